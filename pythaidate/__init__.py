@@ -3,13 +3,18 @@ import datetime
 
 from .csdate import CsDate
 from .pakdate import PakDate
+from .cscalendar import CsCalendar
 
 from .julianday import to_julianday, from_julianday
+from .tracing import stats
+from . import formatting, julianday
 
 __ALL__ = (
     "date",
     "CsDate",
+    "CsCalendar",
     "PakDate",
+    "stats",
 )
 
 
@@ -23,4 +28,28 @@ class date(datetime.date):
     @property
     def julianday(self):
         "Returns the Julian Day Number of the date."
-        return to_julianday(self.year, self.month, self.day)
\ No newline at end of file
+        ordinal = self.toordinal()
+        if ordinal >= julianday.GREGORIAN_START_ORDINAL:
+            return ordinal + julianday.ORDINAL_OFFSET
+        return to_julianday(self.year, self.month, self.day)
+
+    def csstrftime(self, fmt):
+        """
+        Format the date like strftime(), with the Thai additions of
+        pythaidate.formatting (%EY for the Buddhist Era year, %O for Thai
+        digits and so on).
+        """
+        return formatting.strftime(self, fmt, formatting.DATE)
+
+    @classmethod
+    def csstrptime(cls, s, fmt):
+        """
+        Parse a date like strptime(), with the Thai additions of
+        pythaidate.formatting.
+        """
+        return formatting.strptime(s, fmt, formatting.DATE)
+
+    def __format__(self, fmt):
+        if not fmt:
+            return str(self)
+        return self.csstrftime(fmt)
\ No newline at end of file
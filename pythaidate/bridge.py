@@ -0,0 +1,92 @@
+"""
+Conversions between the Chulasakarat (CsDate) and Pakkhakhananaa (PakDate)
+calendars.
+
+Both calendars count days, so a date converts through its Julian Day Number
+without a round trip through datetime.date. For ranges of days, pairs() and
+rows() step both calendars forward a day at a time: the CS date from its
+year record (a year calculation per year) and the Pak date from the day
+before it like an odometer, with no full conversion per day.
+"""
+
+from collections import namedtuple
+
+from . import lsyear
+from .constants import CS_JULIAN_DAY_OFFSET
+from .csdate import CsDate, _DATE_TABLE
+from .julianday import _to_julianday
+from .pakdate import PakDate, _iter_counters
+
+__all__ = (
+    "PairedRow",
+    "to_pakdate",
+    "to_csdate",
+    "pairs",
+    "rows",
+)
+
+PairedRow = namedtuple("PairedRow", [
+    "julianday",
+    "year",
+    "month",
+    "day",
+    "pakdata",
+])
+
+
+def to_pakdate(cs):
+    """
+    Return the PakDate of a CsDate (or any object with a julianday
+    property).
+    """
+    return PakDate.fromjulianday(cs.julianday)
+
+
+def to_csdate(pak):
+    """
+    Return the CsDate of a PakDate (or any object with a julianday
+    property).
+    """
+    return CsDate.fromjulianday(pak.julianday)
+
+
+def pairs(start, stop):
+    """
+    Yield (CsDate, PakDate) pairs for the days from start up to, but not
+    including, stop. Bounds may be CsDate or PakDate objects (or other
+    objects with a julianday property), datetime.date objects or Julian Day
+    Numbers.
+    """
+    cs_dates = CsDate.range(start, stop)
+    fromcounters = PakDate._fromcounters
+    for cs, counters in zip(cs_dates, _iter_counters(cs_dates.start)):
+        yield cs, fromcounters(*counters)
+
+
+def rows(start, stop):
+    """
+    Like pairs(), but yield PairedRow(julianday, year, month, day, pakdata)
+    tuples of plain values, where pakdata is the cycle and the six counters
+    of the pakcode (see PakDate.pakdata). No date objects are created.
+    """
+    start = _to_julianday(start)
+    stop = _to_julianday(stop)
+    if start >= stop:
+        return
+    if start <= CS_JULIAN_DAY_OFFSET:
+        raise ValueError("Julian Day Number before the Chulasakarat epoch.")
+    year_start = year_end = 0
+    for jd, cycle, data, _ in _iter_counters(start):
+        if jd >= stop:
+            return
+        hk = jd - CS_JULIAN_DAY_OFFSET
+        if not year_start <= hk < year_end:
+            year0 = lsyear.calculate_year0(lsyear.horakhun_year(hk))
+            year_start = year0.horakhun
+            year_end = year_start + 365 + year0.leapday
+            table = _DATE_TABLE[year0.cal_type]
+            shift = year0.offset_days - year_start
+        month, day = table[hk + shift]
+        if month > 12 and month != 88:
+            month -= 10
+        yield PairedRow(jd, year0.year, month, day, (cycle, *data))
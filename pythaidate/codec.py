@@ -0,0 +1,222 @@
+"""
+Fixed-width binary encoding of CsDate and PakDate values.
+
+Each date is packed into an unsigned 32-bit integer. The layouts below are
+part of the public interface and will not change between versions; when
+stored as bytes, codes are little-endian.
+
+CsDate (bit 31 is always zero):
+
+    bits 30-11  year        CS year, 0 - 1048575
+    bits 10-7   month       month code: 1-12 for months 1-12, 13 for the
+                            intercalary month 88, 14 and 15 for months 5
+                            and 6 at the end of the year (month_raw 15, 16)
+    bits  6-2   day         day of the month, 1-30
+    bits  1-0   year type   0, 1, 2 for calendar (year) types A, B, C
+
+PakDate:
+
+    bits 31-22  cycle       รอบ, 1 - 1023
+    bits 21-17  a           ปักขคณนา, 1-18
+    bits 16-13  b           สัมพยุหะ, 1-11
+    bits 12-10  c           พยุหะ, 1-7
+    bits  9-7   d           สมุหะ, 1-4
+    bits  6-4   e           วรรค, 1-5
+    bits  3-0   f           วัน, 1-15
+
+The bulk functions convert between Julian Day Numbers and codes directly,
+without creating a date object per element. Decoding raises ValueError for
+a code that is not a valid date.
+"""
+
+from array import array
+import sys
+
+from . import lsyear
+from .constants import CS_JULIAN_DAY_OFFSET, PAK_JULIAN_DAY_OFFSET, PAK_DAYS_IN_CYCLE
+from .csdate import CsDate, _DATE_TABLE
+from .pakdate import PakDate, _counters, _ROW_FLAGS, _ROW_LENGTHS
+
+__all__ = (
+    "CS",
+    "PAK",
+    "encode",
+    "decode",
+    "encode_many",
+    "decode_many",
+)
+
+# kinds of date
+CS = "cs"
+PAK = "pak"
+
+_CAL_CODES = {"A": 0, "B": 1, "C": 2}
+_CAL_TYPES = "ABC"
+_MONTH_CODES = {m: m for m in range(1, 13)}
+_MONTH_CODES.update({88: 13, 15: 14, 16: 15})
+_MONTHS = {c: m for m, c in _MONTH_CODES.items()}
+
+# (month code, day) -> days since the start of month 5, for each year type
+_DATE_INDEX = {
+    cal: {(_MONTH_CODES[m], d): t for t, (m, d) in enumerate(table) if d}
+    for cal, table in _DATE_TABLE.items()
+}
+
+# Pak row weights in days, in code order (a, b, c, d, e, f)
+_PAK_WEIGHTS = (16168, 1447, 251, 59, 15, 1)
+
+
+def _array(typecode):
+    a = array(typecode)
+    assert a.itemsize == {"I": 4, "q": 8}[typecode]
+    return a
+
+
+def _codes(buf):
+    """Return buf as an array of uint32 codes."""
+    if isinstance(buf, array) and buf.typecode == "I":
+        return buf
+    if isinstance(buf, (bytes, bytearray, memoryview)):
+        mv = memoryview(buf)
+        if mv.format in ("B", "b", "c"):
+            codes = _array("I")
+            codes.frombytes(mv.cast("B"))
+            if sys.byteorder == "big":
+                codes.byteswap()
+            return codes
+    codes = _array("I")
+    codes.extend(buf)
+    return codes
+
+
+def _encode_cs(jds):
+    codes = _array("I")
+    append = codes.append
+    start = stop = 0
+    for jd in jds:
+        hk = jd - CS_JULIAN_DAY_OFFSET
+        if not start <= hk < stop:
+            if hk <= 0:
+                raise ValueError("Julian Day Number before the Chulasakarat epoch.")
+            year0 = lsyear.calculate_year0(lsyear.horakhun_year(hk))
+            start = year0.horakhun
+            stop = start + 365 + int(year0.leapday)
+            prefix = year0.year << 11 | _CAL_CODES[year0.cal_type]
+            table = _DATE_TABLE[year0.cal_type]
+            shift = year0.offset_days - start
+        m, d = table[hk + shift]
+        append(prefix | _MONTH_CODES[m] << 7 | d << 2)
+    return codes
+
+
+def _decode_cs(codes):
+    jds = _array("q")
+    append = jds.append
+    year = None
+    for code in codes:
+        if code >> 11 != year:
+            year = code >> 11
+            year0 = lsyear.calculate_year0(year)
+            cal = _CAL_CODES[year0.cal_type]
+            index = _DATE_INDEX[year0.cal_type]
+            base = year0.horakhun - year0.offset_days + CS_JULIAN_DAY_OFFSET
+            # first and last (exclusive) Julian Day Numbers of the year
+            first = year0.horakhun + CS_JULIAN_DAY_OFFSET
+            stop = first + 365 + int(year0.leapday)
+        if code & 3 != cal:
+            raise ValueError("Year type in code {:#010x} does not match CS year {}.".format(code, year))
+        try:
+            t = index[(code >> 7 & 15, code >> 2 & 31)]
+        except KeyError:
+            raise ValueError("Invalid month or day in code {:#010x}.".format(code)) from None
+        if not first <= base + t < stop:
+            raise ValueError("Date in code {:#010x} is not in CS year {}.".format(code, year))
+        append(base + t)
+    return jds
+
+
+def _encode_pak(jds):
+    codes = _array("I")
+    append = codes.append
+    for jd in jds:
+        hk = jd - PAK_JULIAN_DAY_OFFSET
+        if hk <= 0:
+            raise ValueError("Invalid Pakkhakhananaa range.")
+        cycle, days = divmod(hk - 1, PAK_DAYS_IN_CYCLE)
+        a, b, c, d, e, f = _counters(days + 1)[0]
+        append((cycle + 1) << 22 | a << 17 | b << 13 | c << 10 | d << 7 | e << 4 | f)
+    return codes
+
+
+def _check_pak(code):
+    """Raise ValueError if code is not a valid PakDate code."""
+    if code >> 22 < 1:
+        raise ValueError("Invalid cycle in code {:#010x}.".format(code))
+    flag = 0
+    for row, shift in enumerate((17, 13, 10, 7, 4, 0)):
+        n = code >> shift & (31 if row == 0 else 15 if row in (1, 5) else 7)
+        if not 1 <= n <= _ROW_LENGTHS[row][flag]:
+            raise ValueError("Invalid counter in code {:#010x}.".format(code))
+        if row < 5:
+            flag = _ROW_FLAGS[row][flag][n-1]
+
+
+def _decode_pak(codes):
+    jds = _array("q")
+    append = jds.append
+    wa, wb, wc, wd, we, _ = _PAK_WEIGHTS
+    base = PAK_JULIAN_DAY_OFFSET - PAK_DAYS_IN_CYCLE - wa - wb - wc - wd - we
+    for code in codes:
+        _check_pak(code)
+        append(base + (code >> 22) * PAK_DAYS_IN_CYCLE +
+               (code >> 17 & 31) * wa + (code >> 13 & 15) * wb +
+               (code >> 10 & 7) * wc + (code >> 7 & 7) * wd +
+               (code >> 4 & 7) * we + (code & 15))
+    return jds
+
+
+_ENCODERS = {CS: _encode_cs, PAK: _encode_pak}
+_DECODERS = {CS: _decode_cs, PAK: _decode_pak}
+_TYPES = {CsDate: CS, PakDate: PAK}
+
+
+def encode(obj):
+    """
+    Return the 32-bit code for a CsDate or PakDate object.
+    """
+    for cls, kind in _TYPES.items():
+        if isinstance(obj, cls):
+            return _ENCODERS[kind]((obj.julianday,))[0]
+    raise TypeError("Cannot encode object of type {}.".format(type(obj).__name__))
+
+
+def decode(code: int, kind: str = CS):
+    """
+    Return the CsDate (kind CS) or PakDate (kind PAK) object for a code.
+    """
+    jd = _DECODERS[kind]((code,))[0]
+    return CsDate.fromjulianday(jd) if kind == CS else PakDate.fromjulianday(jd)
+
+
+def encode_many(jds, kind: str = CS, as_bytes: bool = False):
+    """
+    Encode a sequence of Julian Day Numbers (any iterable of ints, such as
+    an array.array or memoryview) as an array.array("I") of codes, or as
+    little-endian bytes if as_bytes is true. Runs of dates in the same year
+    share one year calculation.
+    """
+    codes = _ENCODERS[kind](jds)
+    if as_bytes:
+        if sys.byteorder == "big":
+            codes.byteswap()
+        return codes.tobytes()
+    return codes
+
+
+def decode_many(buf, kind: str = CS):
+    """
+    Decode codes to an array.array("q") of Julian Day Numbers. buf can be
+    little-endian bytes (bytes, bytearray or a byte memoryview), an
+    array.array("I") or any iterable of ints.
+    """
+    return _DECODERS[kind](_codes(buf))
@@ -0,0 +1,172 @@
+"""
+Month and year grids for the Thai lunisolar calendar, following the
+interface of the standard library's calendar.Calendar.
+"""
+
+from .csdate import CsDate, lunar_months
+
+__all__ = (
+    "CsCalendar",
+    "WAXING",
+    "WANING",
+)
+
+# Moon phases (Thai: ขึ้น, แรม)
+WAXING = "ขึ้น"
+WANING = "แรม"
+
+
+class CsCalendar:
+    """
+    Base calendar class for the Thai lunisolar calendar. Months are keyed on
+    CS year and Sukothai month number (88 for the intercalary month), and
+    are the months of the lunar year that begins with month 5 of that CS
+    year. Weekdays are numbered as by datetime.date.weekday() (0 is Monday).
+
+    Grids are built from the year's month table, so a whole year of grids
+    costs a single year calculation.
+    """
+
+    def __init__(self, firstweekday: int = 0):
+        self.firstweekday = firstweekday
+
+    @property
+    def firstweekday(self):
+        return self._firstweekday % 7
+
+    @firstweekday.setter
+    def firstweekday(self, firstweekday):
+        self._firstweekday = firstweekday
+
+    def iterweekdays(self):
+        """
+        Return an iterator for one week of weekday numbers starting with the
+        configured first one.
+        """
+        for i in range(self.firstweekday, self.firstweekday + 7):
+            yield i % 7
+
+    def months(self, year: int):
+        """
+        Return the month numbers of a year in calendar order.
+        """
+        return tuple(m.month for m in lunar_months(year))
+
+    def _month(self, year, month):
+        for m in lunar_months(year):
+            if m.month == month:
+                return m
+        raise ValueError("Month {} not in CS year {}.".format(month, year))
+
+    def _grid_range(self, year, month):
+        # Julian Day Numbers of the month padded out to complete weeks
+        m = self._month(year, month)
+        before = (m.julianday - self.firstweekday) % 7
+        after = -(m.julianday + m.days - self.firstweekday) % 7
+        return m, before, after
+
+    def itermonthdates(self, year: int, month: int):
+        """
+        Return an iterator for one month. The iterator will yield CsDate
+        objects for all days of the month and all days before the start of
+        the month or after the end of the month that are required to get a
+        complete week.
+        """
+        m, before, after = self._grid_range(year, month)
+        return iter(CsDate.range(m.julianday - before, m.julianday + m.days + after))
+
+    def itermonthdays(self, year: int, month: int):
+        """
+        Like itermonthdates(), but will yield day numbers. For days outside
+        the specified month the day number is 0.
+        """
+        m, before, after = self._grid_range(year, month)
+        yield from (0,) * before
+        yield from range(1, m.days + 1)
+        yield from (0,) * after
+
+    def itermonthdays2(self, year: int, month: int):
+        """
+        Like itermonthdates(), but will yield (day number, weekday number)
+        tuples. For days outside the specified month the day number is 0.
+        """
+        for i, d in enumerate(self.itermonthdays(year, month), self.firstweekday):
+            yield d, i % 7
+
+    def itermonthphases(self, year: int, month: int):
+        """
+        Like itermonthdates(), but will yield (day of moon phase, phase)
+        tuples, where phase is WAXING (ขึ้น) for days 1-15 of the month and
+        WANING (แรม) after. For days outside the specified month the tuple
+        is (0, None).
+        """
+        for d in self.itermonthdays(year, month):
+            if d == 0:
+                yield 0, None
+            elif d <= 15:
+                yield d, WAXING
+            else:
+                yield d - 15, WANING
+
+    def _weeks(self, days):
+        days = list(days)
+        return [days[i:i+7] for i in range(0, len(days), 7)]
+
+    def monthdatescalendar(self, year: int, month: int):
+        """
+        Return a matrix (list of lists) representing a month's calendar.
+        Each row represents a week; week entries are CsDate objects.
+        """
+        return self._weeks(self.itermonthdates(year, month))
+
+    def monthdays2calendar(self, year: int, month: int):
+        """
+        Return a matrix representing a month's calendar. Each row represents
+        a week; week entries are (day number, weekday number) tuples. Day
+        numbers outside this month are zero.
+        """
+        return self._weeks(self.itermonthdays2(year, month))
+
+    def monthdayscalendar(self, year: int, month: int):
+        """
+        Return a matrix representing a month's calendar. Each row represents
+        a week; days outside this month are zero.
+        """
+        return self._weeks(self.itermonthdays(year, month))
+
+    def monthphasecalendar(self, year: int, month: int):
+        """
+        Return a matrix representing a month's calendar. Each row represents
+        a week; week entries are (day of moon phase, phase) tuples.
+        """
+        return self._weeks(self.itermonthphases(year, month))
+
+    def _year(self, year, width, monthcalendar):
+        months = [monthcalendar(year, m) for m in self.months(year)]
+        return [months[i:i+width] for i in range(0, len(months), width)]
+
+    def yeardatescalendar(self, year: int, width: int = 3):
+        """
+        Return the data for the specified year ready for formatting. The
+        return value is a list of month rows. Each month row contains up to
+        width months. Each month contains between 4 and 6 weeks and each
+        week contains 1-7 days. Days are CsDate objects. Years with an
+        intercalary month have 13 months.
+        """
+        return self._year(year, width, self.monthdatescalendar)
+
+    def yeardays2calendar(self, year: int, width: int = 3):
+        """
+        Return the data for the specified year ready for formatting (similar
+        to yeardatescalendar()). Entries in the week lists are (day number,
+        weekday number) tuples. Day numbers outside this month are zero.
+        """
+        return self._year(year, width, self.monthdays2calendar)
+
+    def yeardayscalendar(self, year: int, width: int = 3):
+        """
+        Return the data for the specified year ready for formatting (similar
+        to yeardatescalendar()). Entries in the week lists are day numbers.
+        Day numbers outside this month are zero.
+        """
+        return self._year(year, width, self.monthdayscalendar)
@@ -1,29 +1,30 @@
-import logging
 from collections import namedtuple
 from datetime import date, timedelta
+from functools import lru_cache
 
 from .constants import (
-    DAYS_IN_800_YEARS,
-    TIME_UNITS_IN_1_DAY,
-    EPOCH_OFFSET,
     UCCAPON_CONSTANT,
     APOGEE_ROTATION_DAYS,
-    WEEKDAYS,
     CS_JULIAN_DAY_OFFSET,
-    CAL_TYPE_DAY_COUNTS,
     CS_UNIX_EPOCH_OFFSET,
 )
 
-from .lsyear import LSYear
-from .helpers import digit_arabic_to_thai, digit_thai_to_arabic
-from . import julianday
+from . import formatting, julianday, lsyear
 
 __all__ = (
     "CsDate",
+    "lunar_months",
+    "lunation_start_jd",
+    "lunation_bounds",
+    "lunation_months",
+    "set_intern_size",
+    "intern_cache_info",
+    "intern_cache_clear",
     # "CsCalendarDate"
 )
 
 CsCalendarDate = namedtuple("CsCalendarDate", ["year", "month", "day"])
+LunarMonth = namedtuple("LunarMonth", ["month", "julianday", "days"])
 
 # Month offsets
 MONTH_SUK = 4
@@ -45,32 +46,57 @@ LUNAR_MONTHS = (
 MONTH_POSITION_AB = (None, 5, 6, 7, 8, 9, 10, 11, 12, 1, 2, 3, 4, 15, 16)
 MONTH_POSITION_C = (None, 5, 6, 7, 8, 88, 9, 10, 11, 12, 1, 2, 3, 4, 15, 16)
 
+# What month arithmetic does with a day the target month doesn't have (day
+# 30 of a 29 day month): use the last day of the month, carry over into the
+# next month, or raise ValueError.
+CLAMP = "clamp"
+OVERFLOW = "overflow"
+RAISE = "raise"
+
+# Which month 8 a month 8 date maps to in years with an intercalary month:
+# the first (8), the second (88) or, for recurrence rules, both.
+LEAP_FIRST = "first"
+LEAP_SECOND = "second"
+LEAP_BOTH = "both"
+
+# Mean lunation of the calendar in days (30 tithi of 1 + 11/692 days), as a
+# fraction. Month starts are within 1.2 days of the mean lunations.
+LUNATION_NUMERATOR = 20760
+LUNATION_DENOMINATOR = 703
+
+# csformat() layout: วันเสาร์ เดือน ๑ แรม ๙ ค่ำ ปีเถาะ จ.ศ.๑๓๖๑
+CSFORMAT = "%A เดือน %O-m %p %O-e ค่ำ %K %OEY"
+
 YEAR_NAKSATR = [None, "ชวด", "ฉลู", "ขาล", "เถาะ", "มะโรง", "มะเส็ง",
                 "มะเมีย", "มะแม", "วอก", "ระกา", "จอ", "กุน"]
 
 
 class CsDate:
 
+    # Only the minimal state is stored; the astronomical values are derived
+    # from the horakhun when they are read.
+    __slots__ = (
+        "__julianday",
+        "__year",
+        "__month",
+        "__day",
+        "__year0",
+        "__month_style",
+    )
+
     def __init__(self, year: int, month: int=None, day: int=None,
                  month_style: int = MONTH_SUK):
-        logging.debug("args year:%s month:%s day:%s, month_style:%s",
-                      year, month, day, month_style)
         self.__year = year
         self.__month = month
         self.__day = day  # day of month
-        self.__days = None  # days elapsed in year
         self.__month_style = month_style  # Sukothai, Chiang Mai, Keng Tung
         self.__init_ymd()
-        self.__calculate()
-        logging.debug("final y:%s m:%s d:%s days:%s",
-                      self.__year, self.__month, self.__day, self.__days)
 
     def __init_ymd(self):
         """
         Initialise from year, month and day args.
         """
-        self.__year0 = self.calculate_year0(self.__year)
-        # logging.debug("offset_days:%d", self.__year0.offset_days)
+        self.__year0 = lsyear.calculate_year0(self.__year)
 
         date_offset = None
         if self.__month == 5:
@@ -85,94 +111,16 @@ class CsDate:
             tmonth += 13 if self.__year0.cal_type == "C" else 12
             # shift month number to end of the index in LUNAR_MONTHS[]
             self.__month += 10
-        self.__days = MONTH_CUMULATIVE_DAYS[self.__year0.cal_type][tmonth-1] + self.__day - self.__year0.offset_days
-        logging.debug("ymd: y:%s m:%s d:%s days:%s cal_type:%s tmonth:%s",
-                      self.__year, self.__month, self.__day,
-                      self.__days, self.__year0.cal_type, tmonth)
-
-    def __calculate(self):
-        # horakhun: The number of elapsed days since epoch plus days since New Year's Day (Thai: หรคุฌ)
-        self.__horakhun = (self.__year * DAYS_IN_800_YEARS + EPOCH_OFFSET) // TIME_UNITS_IN_1_DAY + 1 + self.__days
-        assert self.julianday > CS_JULIAN_DAY_OFFSET  # check for pre-epoch dates
-
-        # kammacapon: A quantity that gives the excess of solar days over whole solar days (Thai: กัมมัขผล)
-        self.__kammacapon = TIME_UNITS_IN_1_DAY - (self.__year * DAYS_IN_800_YEARS + EPOCH_OFFSET) % TIME_UNITS_IN_1_DAY
-
-        # uccapon: The measure of the position of the Moon's apogee. It increases by one unit a day to
-        # a maximum of 3232 (Thai: อุจจพล)
-        self.__uccapon = (self.__horakhun + UCCAPON_CONSTANT) % APOGEE_ROTATION_DAYS
-
-        # avoman: The excess of lunar days over solar days in units of 1/692 of a lunar day modulus 692.
-        # It increases by 11 units each solar day. It is used to determine when to add intercalary days
-        # in the calendar (Thai: อวมาน)
-        self.__avoman = (self.__horakhun * 11 + 650) % 692
-        if self.__avoman == 0:
-            self.__avoman = 692
-
-        # masaken: Number of lunar months since the epoch (Thai: มาสเกฌฑ์)
-        avoman_div = ((self.__horakhun + self.days) * 11 + 650) // 692
-        self.__masaken = (avoman_div + self.__horakhun) // 30
-
-        # tithi: a lunar day, equal to 1/30th of a synodic month (Thai: ดิถี)
-        quot = (self.__horakhun * 11 + 650) // 692
-        self.__tithi = (quot + self.__horakhun) % 30
-
-        # self.avomanExtra = (self.horakhun * 11 + 650) % 692
-        logging.debug("horakhun:%s kamma:%s quot:%s tt:%s", self.__horakhun, self.__kammacapon, quot, self.__tithi)
+        days = MONTH_CUMULATIVE_DAYS[self.__year0.cal_type][tmonth-1] + self.__day - self.__year0.offset_days
+        self.__julianday = self.__year0.horakhun + days + CS_JULIAN_DAY_OFFSET
+        assert self.__julianday > CS_JULIAN_DAY_OFFSET  # check for pre-epoch dates
 
     @staticmethod
     def calculate_year0(year: int):
-        y = [
-            LSYear(year - 2),
-            LSYear(year - 1),
-            LSYear(year),
-            LSYear(year + 1),
-            LSYear(year + 2),
-        ]
-        # logging.debug("[0] year0[].caltype:%s", "".join([i.cal_type for i in y]))
-
-        for i in (0, 1, 2, 3, 4):
-            if y[2].tithi == 24 and y[3].tithi == 6:
-                # where tithi of this year is 24 and next year is 6, set all years to C-type
-                # adjust next_nyd weekday
-                y[i].cal_type = "C"
-                y[i].next_nyd = (y[i].next_nyd + 2) % 7
-        # logging.debug("[1] year0[].caltype:%s", "".join([i.cal_type for i in y]))
-
-        # Adjust c-type years where a intercalary day and month coincide. This can't happen
-        # in the Thai calendar (unlike the Burmese) so we decide if the intercalary day is moved
-        # to the previous or next year. This is done by ensuring a correct sequence of weekdays
-        # from one year to the next.
-        for i in (1, 2, 3):
-            if y[i].cal_type == "c":
-                j = 1 if y[i].nyd == y[i-1].next_nyd else -1
-                y[i+j].cal_type = "B"
-                y[i+j].next_nyd = (y[i+j].next_nyd + 1) % 7
-        # logging.debug("[2] year0[].caltype:%s", "".join([i.cal_type for i in y]))
-
-        for i in (1, 2, 3):
-            if y[i-1].next_nyd != y[i].nyd and y[i].next_nyd != y[i+1].nyd:
-                y[i].offset = True
-                y[i].langsak += 1
-                y[i].nyd = (y[i].nyd + 6) % 7
-                y[i].next_nyd = (y[i].next_nyd + 6) % 7
-
-        # housekeeping - elabal any remaining c-type years as C-type; add day count too
-        for i in (0, 1, 2, 3, 4):
-            if y[i].cal_type == "c":
-                y[i].cal_type = "C"
-            y[i].caldays = CAL_TYPE_DAY_COUNTS[y[i].cal_type]
-        # logging.debug("[F] year0[].caltype:%s", "".join([i.cal_type for i in y]))
-
-        # Determine month/day of new year
-        y[2].first_month = "C"  # as per Eade, C=>Caitra, V=>Vaisakha
-        y[2].first_day = y[2].langsak
-        y[2].offset_days = y[2].langsak  # no.days offset from Caitra 1st
-        if y[2].offset_days < (6 + int(y[2].offset)):
-            y[2].first_month = "V"
-            y[2].first_day = y[2].offset_days
-            y[2].offset_days += 29
-        return y[2]
+        """
+        Return the (cached, read-only) year record for a CS year.
+        """
+        return lsyear.calculate_year0(year)
 
     @staticmethod
     def find_date(cal: str, days: int):
@@ -180,7 +128,6 @@ class CsDate:
         Given a calendar type (A, B, C) and number of days since new years day,
         return the month and day component of a date, derived from lookup tables.
         """
-        logging.debug("cal:%s days:%s", cal, days)
         vals = {
             "A": (
                 (383, 16), (354, 15), (324, 12), (295, 11), (265, 10), (236, 9),
@@ -200,13 +147,9 @@ class CsDate:
         for a, b in vals[cal]:
             if days > a:
                 days -= a
-                logging.debug("solution: (a:%s b:%s) month:%s day:%s",
-                              a, b, LUNAR_MONTHS[b], days)
                 month = LUNAR_MONTHS[b]
                 break
             month = LUNAR_MONTHS[1]
-        else:
-            logging.debug("default: month:%s (%s) day:%s", 1, LUNAR_MONTHS[1], days)
         return month, days
 
     @classmethod
@@ -215,54 +158,97 @@ class CsDate:
         Return today as CS date.
         """
         jd = julianday.today()
-        logging.debug("jd:%s", jd)
         return cls.fromjulianday(jd)
 
+    @classmethod
+    def _fromyear0(cls, jd: int, year0, days: int, month_style: int = MONTH_SUK):
+        """
+        Return a Chulasakarat object directly from a Julian Day Number, its
+        year record and the days since new years day, without decoding and
+        re-encoding the month and day. days must be within the year.
+        """
+        self = cls.__new__(cls)
+        self.__julianday = jd
+        self.__year = year0.year
+        self.__month, self.__day = _DATE_TABLE[year0.cal_type][year0.offset_days + days]
+        self.__year0 = year0
+        self.__month_style = month_style
+        return self
+
     @classmethod
     def fromyd(cls, year: int, days: int):
         """
         Return a Chulasakarat object from a year and days since new years day.
+        Day counts outside of the year are carried into the correct year.
         """
-        logging.debug("start: year:%s days:%s", year, days)
-        year0 = cls.calculate_year0(year)
-        days_in_year = 365 + int(year0.leapday)
-        while days > days_in_year:  # zero-indexed
-            year += 1
-            days -= days_in_year
-            year0 = cls.calculate_year0(year)
-            days_in_year = 365 + int(year0.leapday)
-            logging.debug("days >= %s: year:%s days:%s", 364 + int(year0.leapday), year, days)
-
-        # logging.debug("year0 langsak:%s offset_days:%s", year0.langsak, year0.offset_days)
-        month, day = cls.find_date(year0.cal_type, year0.offset_days + days)
-        logging.debug("year:%s month:%s day:%s", year, month, day)
-        return cls(year, month, day)
+        year0 = lsyear.calculate_year0(year)
+        if not 0 <= days < 365 + int(year0.leapday):  # zero-indexed
+            hk = year0.horakhun + days
+            year0 = lsyear.calculate_year0(lsyear.horakhun_year(hk))
+            days = hk - year0.horakhun
+        return cls._fromyear0(year0.horakhun + days + CS_JULIAN_DAY_OFFSET, year0, days)
 
     @classmethod
     def fromjulianday(cls, jd: int):
         """
-        Return a Chulasakarat object from a Julian Day Number.
+        Return a Chulasakarat object from a Julian Day Number. If interning
+        is enabled (see set_intern_size()), a shared instance is returned.
         """
+        if _interned is not None and cls is CsDate:
+            return _interned(jd)
+        return cls._fromjulianday(jd)
+
+    @classmethod
+    def _fromjulianday(cls, jd: int):
         hk = jd - CS_JULIAN_DAY_OFFSET
-        year = (hk * 800 - 373) // 292207
-        if hk % 292207 == 95333:
-            # Every 800 years (292207 days), on the last day of the solar leap
-            # year coinciding with an adhkimas lunar year, this jd->year
-            # formula will be off by one day pushing the year forward by one
-            # and the days count to -1.
-            year -= 1
-            days = 365
-            logging.debug("800 year kamma adjustment")
-        else:
-            year0 = cls.calculate_year0(year)
-            days = hk - year0.horakhun
-        # logging.debug("kamma:%s", year0.kammacapon)
-        # logging.debug("jd:%s year:%s days:%s cal_type:%s hk0:%s", jd, year, days, year0.cal_type, year0.horakhun)
-        logging.debug("jd:%s year:%s days:%s", jd, year, days)
-        return cls.fromyd(year=year, days=days)
+        if hk <= 0:
+            raise ValueError("Julian Day Number before the Chulasakarat epoch.")
+        year0 = lsyear.calculate_year0(lsyear.horakhun_year(hk))
+        return cls._fromyear0(jd, year0, hk - year0.horakhun)
 
     from_julianday = fromjulianday
 
+    @classmethod
+    def range(cls, start, stop, step: int = 1):
+        """
+        Return a lazy sequence of dates from start up to, but not including,
+        stop. Bounds may be CsDate (or other objects with a julianday
+        property), datetime.date objects or Julian Day Numbers. Like the
+        builtin range(), it supports len(), reversed(), indexing and negative
+        steps without building the dates.
+        """
+        return julianday.DateRange(cls, start, stop, step)
+
+    @classmethod
+    def _checkrange(cls, jds):
+        if min(jds[0], jds[-1]) <= CS_JULIAN_DAY_OFFSET:
+            raise ValueError("Julian Day Number before the Chulasakarat epoch.")
+
+    @classmethod
+    def _walk(cls, jds):
+        """Yield the dates of a range of Julian Day Numbers."""
+        # Only look up a year record when the walk leaves the current year.
+        fromyear0 = cls._fromyear0
+        start = end = 0
+        for jd in jds:
+            hk = jd - CS_JULIAN_DAY_OFFSET
+            if not start <= hk < end:
+                year0 = lsyear.calculate_year0(lsyear.horakhun_year(hk))
+                start = year0.horakhun
+                end = start + 365 + year0.leapday
+            yield fromyear0(jd, year0, hk - start)
+
+    @classmethod
+    def from_lunation(cls, n: int, day: int = 1):
+        """
+        Return the date of day day of lunation (lunar month) n. See
+        lunation_bounds().
+        """
+        month = _lunation_month(n)
+        if not 1 <= day <= month.days:
+            raise ValueError("Lunation {} has no day {}.".format(n, day))
+        return cls.fromjulianday(month.julianday + day - 1)
+
     @classmethod
     def fromtimestamp(cls, ts):
         """
@@ -276,31 +262,65 @@ class CsDate:
         """
         Return the Julian Day Number of this CS date.
         """
-        return self.__horakhun + CS_JULIAN_DAY_OFFSET
+        return self.__julianday
 
     @property
     def horakhun(self):
-        return self.__horakhun
+        """
+        The number of elapsed days since epoch plus days since New Year's Day (Thai: หรคุฌ)
+        """
+        return self.__julianday - CS_JULIAN_DAY_OFFSET
 
     @property
     def kammacapon(self):
-        return self.__kammacapon
+        """
+        A quantity that gives the excess of solar days over whole solar days (Thai: กัมมัขผล)
+        """
+        return self.__year0.kammacapon
 
     @property
     def masaken(self):
-        return self.__masaken
+        """
+        Number of lunar months since the epoch (Thai: มาสเกฌฑ์)
+        """
+        horakhun = self.__julianday - CS_JULIAN_DAY_OFFSET
+        avoman_div = ((horakhun + self.days) * 11 + 650) // 692
+        return (avoman_div + horakhun) // 30
+
+    @property
+    def lunation(self):
+        """
+        Number of the lunar month containing the date, counted from the
+        epoch: the masaken of the first day of the month.
+        """
+        return _lunation(self.__julianday)
 
     @property
     def uccapon(self):
-        return self.__uccapon
+        """
+        The measure of the position of the Moon's apogee. It increases by one
+        unit a day to a maximum of 3232 (Thai: อุจจพล)
+        """
+        return (self.__julianday - CS_JULIAN_DAY_OFFSET + UCCAPON_CONSTANT) % APOGEE_ROTATION_DAYS
 
     @property
     def avoman(self):
-        return self.__avoman
+        """
+        The excess of lunar days over solar days in units of 1/692 of a lunar
+        day modulus 692. It increases by 11 units each solar day. It is used to
+        determine when to add intercalary days in the calendar (Thai: อวมาน)
+        """
+        avoman = ((self.__julianday - CS_JULIAN_DAY_OFFSET) * 11 + 650) % 692
+        return 692 if avoman == 0 else avoman
 
     @property
     def tithi(self):
-        return self.__tithi
+        """
+        A lunar day, equal to 1/30th of a synodic month (Thai: ดิถี)
+        """
+        horakhun = self.__julianday - CS_JULIAN_DAY_OFFSET
+        quot = (horakhun * 11 + 650) // 692
+        return (quot + horakhun) % 30
 
     @property
     def year(self):
@@ -322,7 +342,7 @@ class CsDate:
 
     @property
     def days(self):
-        return self.__days
+        return self.__julianday - CS_JULIAN_DAY_OFFSET - self.__year0.horakhun
 
     @property
     def solar_leap_year(self):
@@ -346,21 +366,68 @@ class CsDate:
             return 384
 
     def replace(self, year=None, month=None, day=None):
-        logging.debug("year:%s month%s day:%s", year, month, day)
         y = year if year else self.year
         m = month if month else self.month
         d = day if day else self.day
-        logging.debug("year:%s month%s day:%s", y, m, d)
         return CsDate(y, m, d)
 
+    def _month_date(self, month, day, policy):
+        # date of day in the LunarMonth month, applying the day policy
+        if day > month.days:
+            if policy == CLAMP:
+                day = month.days
+            elif policy == RAISE:
+                raise ValueError("Month {} has no day {}.".format(month.month, day))
+            elif policy != OVERFLOW:
+                raise ValueError("Unknown day policy {!r}.".format(policy))
+        return self.fromjulianday(month.julianday + day - 1)
+
+    def add_lunar_months(self, n: int, policy: str = CLAMP):
+        """
+        Return the date n lunar months (lunations) from this one, on the same
+        day of the month. Intercalary months are counted. policy decides
+        what happens to day 30 in a 29 day month: CLAMP to the last day,
+        OVERFLOW into the next month or RAISE a ValueError.
+        """
+        month = _lunation_month(_lunation(self.__julianday) + n)
+        return self._month_date(month, self.day, policy)
+
+    def add_lunar_years(self, n: int, policy: str = CLAMP, leap: str = LEAP_FIRST):
+        """
+        Return the date on the same month and day n lunar years from this
+        one. See anniversary().
+        """
+        return self.anniversary(_lunar_year(self.__julianday) + n, policy, leap)
+
+    def anniversary(self, year: int, policy: str = CLAMP, leap: str = LEAP_FIRST):
+        """
+        Return the date on the same month and day as this one in the lunar
+        year beginning with month 5 of CS year year (see lunar_months()).
+        A date in month 88 falls in month 8 in years without an intercalary
+        month; a date in month 8 of a year without one falls in month 8
+        (leap=LEAP_FIRST) or 88 (leap=LEAP_SECOND) in years with one.
+        policy is as for add_lunar_months().
+        """
+        if leap not in (LEAP_FIRST, LEAP_SECOND):
+            raise ValueError("Unknown leap month policy {!r}.".format(leap))
+        source = _lunar_month(self.__julianday)
+        months = {m.month: m for m in lunar_months(year)}
+        month = source.month
+        if month == 88 and 88 not in months:
+            month = 8
+        elif month == 8 and leap == LEAP_SECOND and 88 in months and \
+                len(lunar_months(_lunar_year(self.__julianday))) == 12:
+            month = 88
+        return self._month_date(months[month], self.day, policy)
+
     def csweekday(self):
-        return self.__horakhun % 7
+        return (self.__julianday - CS_JULIAN_DAY_OFFSET) % 7
 
     def weekday(self):
-        return self.csweekday() - 2
+        return (self.csweekday() + 5) % 7
 
     def isoweekday(self):
-        return self.csweekday() - 1
+        return (self.csweekday() + 5) % 7 + 1
 
     @property
     def yearnaksatr(self):
@@ -370,18 +437,19 @@ class CsDate:
         return "ปี" + YEAR_NAKSATR[idx]
 
     def csformat(self):
-        phase = "ขึ้น" if self.day <= 15 else "แรม"
-        day = self.day if self.day <= 15 else self.day - 15
-        s = "{:s} เดือน {:s} {:s} {:s} ค่ำ {:s} จ.ศ.{:s}".format(
-            WEEKDAYS[self.csweekday()],
-            digit_arabic_to_thai(self.month),
-            phase,
-            digit_arabic_to_thai(day),
-            self.yearnaksatr,
-            digit_arabic_to_thai(self.year)
-        )
-        s = digit_arabic_to_thai(s)
-        return s
+        return self.csstrftime(CSFORMAT)
+
+    def csstrftime(self, fmt: str) -> str:
+        """
+        Return the date formatted according to fmt. See pythaidate.formatting
+        for the format directives.
+        """
+        return formatting.strftime(self, fmt, formatting.CS)
+
+    def __format__(self, fmt):
+        if not fmt:
+            return str(self)
+        return self.csstrftime(fmt)
 
     def csformatymd(self):
         """
@@ -390,15 +458,19 @@ class CsDate:
         return "{:4d}-{:02d}-{:02d}".format(self.year, self.month, self.day)
 
     @classmethod
-    def fromcsformat(self, s):
-        s = digit_thai_to_arabic(s)
-        weekday, _, month, phase, day, _, _, year = s.split()
-        year = int(year.replace("จ.ศ.", ""))
-        month = int(month)
-        day = int(day)
-        if phase == "แรม":
-            day += 15
-        return CsDate(year, month, day)
+    def fromcsformat(cls, s):
+        """
+        Return a Chulasakarat object from a csformat() string.
+        """
+        return cls.csstrptime(s, CSFORMAT)
+
+    @classmethod
+    def csstrptime(cls, s: str, fmt: str):
+        """
+        Return a Chulasakarat object parsed from s according to fmt. See
+        pythaidate.formatting for the format directives.
+        """
+        return formatting.strptime(s, fmt, formatting.CS)
 
     def cscalendar(self):
         return CsCalendarDate(self.year, self.month, self.day)
@@ -415,81 +487,277 @@ class CsDate:
             self.__year,
             self.__month,
             self.__day,
-            self.__days,
-            self.__horakhun,
-            self.__kammacapon,
-            self.__tithi,
+            self.days,
+            self.horakhun,
+            self.kammacapon,
+            self.tithi,
             self.__year0.cal_type,
         )
 
-    def __hash__(self):  # pragma: no cover
-        return hash(self._hashable())
+    def __hash__(self):
+        # Equal dates have the same Julian Day Number, whatever the month
+        # numbering used to create them, and a CsDate also equals the
+        # datetime.date of that day, so both must hash alike.
+        return julianday._date_hash(self.__julianday)
+
+    def __reduce__(self):
+        # Only the day and month style are stored; everything else is
+        # rebuilt from the (cached) year record on unpickling.
+        return (self._restore, (self.__julianday, self.__month_style))
+
+    @classmethod
+    def _restore(cls, jd: int, month_style: int = MONTH_SUK):
+        if month_style == MONTH_SUK:
+            return cls.fromjulianday(jd)
+        hk = jd - CS_JULIAN_DAY_OFFSET
+        year0 = lsyear.calculate_year0(lsyear.horakhun_year(hk))
+        return cls._fromyear0(jd, year0, hk - year0.horakhun, month_style)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     def __lt__(self, other):
         if hasattr(other, "julianday"):
             return self.julianday < other.julianday
         elif isinstance(other, date):
-            return self.julianday < julianday.to_julianday(other.year, other.month, other.day)
+            return self.julianday < julianday.date_to_julianday(other)
         return NotImplemented
 
     def __le__(self, other):
         if hasattr(other, "julianday"):
             return self.julianday <= other.julianday
         elif isinstance(other, date):
-            return self.julianday <= julianday.to_julianday(other.year, other.month, other.day)
+            return self.julianday <= julianday.date_to_julianday(other)
         return NotImplemented
 
     def __eq__(self, other):
         if hasattr(other, "julianday"):
             return self.julianday == other.julianday
         elif isinstance(other, date):
-            return self.julianday == julianday.to_julianday(other.year, other.month, other.day)
+            return self.julianday == julianday.date_to_julianday(other)
         return NotImplemented
 
     def __ge__(self, other):
         if hasattr(other, "julianday"):
             return self.julianday >= other.julianday
         elif isinstance(other, date):
-            return self.julianday >= julianday.to_julianday(other.year, other.month, other.day)
+            return self.julianday >= julianday.date_to_julianday(other)
         return NotImplemented
 
     def __gt__(self, other):
         if hasattr(other, "julianday"):
             return self.julianday > other.julianday
         elif isinstance(other, date):
-            return self.julianday > julianday.to_julianday(other.year, other.month, other.day)
+            return self.julianday > julianday.date_to_julianday(other)
         return NotImplemented
 
+    def _adddays(self, n: int):
+        """
+        Return the date n days from this one. The current year record is
+        reused when the result is in the same CS year, and the neighbouring
+        year's record when it crosses one new year; only larger jumps do a
+        full Julian Day conversion.
+        """
+        jd = self.__julianday + n
+        year0 = self.__year0
+        days = jd - CS_JULIAN_DAY_OFFSET - year0.horakhun
+        if days >= 0:
+            year_days = 365 + year0.leapday
+            if days >= year_days:
+                if days >= year_days + 366:
+                    return self.fromjulianday(jd)
+                year0 = lsyear.calculate_year0(year0.year + 1)
+                days -= year_days
+                if days >= 365 + year0.leapday:
+                    return self.fromjulianday(jd)
+        else:
+            if jd <= CS_JULIAN_DAY_OFFSET:
+                raise ValueError("Julian Day Number before the Chulasakarat epoch.")
+            if days < -366:
+                return self.fromjulianday(jd)
+            year0 = lsyear.calculate_year0(year0.year - 1)
+            days += 365 + year0.leapday
+            if days < 0:
+                return self.fromjulianday(jd)
+        return self._fromyear0(jd, year0, days, self.__month_style)
+
     def __add__(self, other):
         if isinstance(other, timedelta):
-            return CsDate.fromjulianday(self.julianday + other.days)
+            return self._adddays(other.days)
         return NotImplemented
 
     __radd__ = __add__
 
     def __sub__(self, other):
         if isinstance(other, timedelta):
-            return self + timedelta(-other.days)
+            return self._adddays(-other.days)
         elif hasattr(other, "julianday"):
             return timedelta(days=self.julianday - other.julianday)
         elif isinstance(other, date):
-            other_jd = julianday.to_julianday(other.year, other.month, other.day)
+            other_jd = julianday.date_to_julianday(other)
             return timedelta(days=self.julianday - other_jd)
         return NotImplemented
 
     def debug(self):  # pragma: no cover
         return {
             "cp": self.__year0,
-            "horakhun": self.__horakhun,
-            "kamma": self.__kammacapon,
-            # "avomanExtra": self.avomanExtra,
-            "tt": self.__tithi,
+            "horakhun": self.horakhun,
+            "kamma": self.kammacapon,
+            "tt": self.tithi,
             "year": self.__year,
             "month": self.__month,
             "day": self.__day,
-            "days": self.__days,
+            "days": self.days,
             "cal_type": self.__year0.cal_type,
             "month_style": self.__month_style,
             "year0.langsak": self.__year0.langsak,
             "year0.offset": self.__year0.offset,
-        }
\ No newline at end of file
+        }
+
+
+# Optional bounded table of shared CsDate instances, keyed on Julian Day Number.
+_interned = None
+
+
+def set_intern_size(maxsize):
+    """
+    Intern up to maxsize CsDate instances returned by CsDate.fromjulianday(),
+    so that frequently used dates are shared rather than rebuilt. The least
+    recently used instances are dropped first; None interns without limit
+    and 0 turns interning off (the default).
+    """
+    global _interned
+    if maxsize == 0:
+        _interned = None
+    else:
+        _interned = lru_cache(maxsize=maxsize)(CsDate._fromjulianday)
+
+
+def intern_cache_info():
+    """Return hit/miss statistics for the intern table, or None if it is off."""
+    return None if _interned is None else _interned.cache_info()
+
+
+def intern_cache_clear():
+    """Empty the intern table."""
+    if _interned is not None:
+        _interned.cache_clear()
+
+
+@lru_cache(maxsize=lsyear.YEAR_CACHE_SIZE)
+def lunar_months(year: int):
+    """
+    Return the months of the lunar year that begins with month 5 of CS year
+    year, as a tuple of LunarMonth(month, julianday, days) records giving the
+    month number (88 for the intercalary month), the Julian Day Number of its
+    first day and its length. The days of month 5 (and 6) before new year's
+    day are dated in the previous CS year as months 15 (and 16).
+    """
+    year0 = lsyear.calculate_year0(year)
+    cumulative = MONTH_CUMULATIVE_DAYS[year0.cal_type]
+    if year0.cal_type == "C":
+        months = MONTH_POSITION_C[1:14]
+    else:
+        months = MONTH_POSITION_AB[1:13]
+    start = year0.horakhun - year0.offset_days + 1 + CS_JULIAN_DAY_OFFSET
+    return tuple(
+        LunarMonth(m, start + cumulative[i], cumulative[i+1] - cumulative[i])
+        for i, m in enumerate(months)
+    )
+
+
+def _lunar_year(jd: int) -> int:
+    """
+    Return the CS year whose lunar year (see lunar_months()) contains the
+    Julian Day Number jd.
+    """
+    # the lunar year starts on or before new year's day, so it is the CS
+    # year containing jd or the next one
+    year = lsyear.horakhun_year(jd - CS_JULIAN_DAY_OFFSET)
+    if jd >= lunar_months(year + 1)[0].julianday:
+        year += 1
+    return year
+
+
+def _lunar_month(jd: int):
+    """
+    Return the LunarMonth record of the month containing the Julian Day
+    Number jd.
+    """
+    months = lunar_months(_lunar_year(jd))
+    for month in reversed(months):
+        if month.julianday <= jd:
+            return month
+
+
+def _lunation(jd: int) -> int:
+    """
+    Return the lunation number (masaken of the first day) of the month
+    containing the Julian Day Number jd.
+    """
+    return _month_lunation(_lunar_month(jd).julianday)
+
+
+def _month_lunation(jd: int) -> int:
+    """
+    Return the lunation number of the month starting on the Julian Day
+    Number jd.
+    """
+    start = jd - CS_JULIAN_DAY_OFFSET
+    return (start * LUNATION_DENOMINATOR + LUNATION_NUMERATOR // 2) // LUNATION_NUMERATOR
+
+
+def _lunation_month(n: int):
+    """
+    Return the LunarMonth record of lunation n.
+    """
+    # the middle of the mean lunation is always inside the month
+    jd = (n * LUNATION_NUMERATOR + LUNATION_DENOMINATOR // 2) // LUNATION_DENOMINATOR + 14
+    return _lunar_month(jd + CS_JULIAN_DAY_OFFSET)
+
+
+def lunation_start_jd(n: int) -> int:
+    """
+    Return the Julian Day Number of the first day of lunation n.
+    """
+    return _lunation_month(n).julianday
+
+
+def lunation_bounds(n: int):
+    """
+    Return the Julian Day Numbers (start, stop) of the first day of
+    lunation n and of the day after its last day. Lunations are numbered by
+    the masaken of their first day (see CsDate.lunation) and each is one
+    calendar month, including intercalary months.
+    """
+    month = _lunation_month(n)
+    return month.julianday, month.julianday + month.days
+
+
+def lunation_months(start: int, stop: int):
+    """
+    Return the LunarMonth records of lunations start up to, but not
+    including, stop, read from consecutive year month tables.
+    """
+    if start >= stop:
+        return ()
+    first = _lunation_month(start)
+    year = _lunar_year(first.julianday)
+    months = lunar_months(year)
+    result = list(months[months.index(first):])
+    while len(result) < stop - start:
+        year += 1
+        result.extend(lunar_months(year))
+    return tuple(result[:stop - start])
+
+
+# Month and day of month for each lunar day of the year (offset_days + days),
+# by year type. Offsets are at most 35 days and a solar year at most 366 days.
+DATE_TABLE_SIZE = 402
+_DATE_TABLE = {
+    cal: tuple(CsDate.find_date(cal, t) for t in range(DATE_TABLE_SIZE))
+    for cal in ("A", "B", "C")
+}
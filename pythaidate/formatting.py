@@ -0,0 +1,559 @@
+"""
+strftime/strptime-style formatting and parsing for CsDate, PakDate and
+datetime.date objects.
+
+Format strings are compiled once into a function joining the literal text
+and the fields, and the compiled forms are cached, so repeated formatting
+with the same format string skips parsing. format_many() formats a sequence with
+a single compilation and, given an array of Julian Day Numbers and NumPy,
+calculates the fields of all dates at once.
+
+Directives are written %X, optionally with flags between the % and the
+directive character:
+
+    -   do not zero-pad a number (%-d)
+    O   use Thai digits (%Od)
+    E   use the era form of the directive (%EY)
+
+CsDate directives:
+
+    %Y  CS year             %EY  CS year with era (จ.ศ.1361)
+    %m  month (Sukothai numbering, 88 for the intercalary month), 2 digits
+    %B  month name (เดือนอ้าย)       %b  short month name (อ้าย)
+    %d  day of the month (1-30), 2 digits
+    %e  day of the moon phase (1-15), 2 digits
+    %p  moon phase (ขึ้น or แรม)
+    %A  weekday name (วันเสาร์)      %a  short weekday name (ส.)
+    %w  weekday number, 0 is Sunday
+    %K  naksatr year name (ปีเถาะ)
+    %j  day of the solar year, 3 digits
+    %J  Julian Day Number
+    %%  a literal %
+
+PakDate directives:
+
+    %P  pakcode (1-6:11:5:2:2:10)
+    %C  cycle (รอบ)
+    %1 ... %6  the counters of the pakcode, in order
+    %p, %A, %a, %w, %J as for CsDate
+
+datetime.date directives are those of date.strftime(), plus:
+
+    %EY  Buddhist Era year (พ.ศ.2543)   %Ey  Buddhist Era year number (2543)
+    %EA  Thai weekday name              %Ea  short Thai weekday name
+    %EB  Thai month name (มกราคม)       %Eb  short Thai month name (ม.ค.)
+    %J   Julian Day Number
+
+strptime() and parse_many() accept the same directives, with numbers in
+either Arabic or Thai digits. A CsDate weekday is checked against the date,
+and chooses between month 5 or 6 at the start and at the end of a CS year
+where both exist; other names that do not determine the date (PakDate and
+datetime.date weekdays, naksatr year) are matched but not checked.
+"""
+
+from datetime import date
+from functools import lru_cache
+import re
+
+from .constants import CS_JULIAN_DAY_OFFSET, LUNAR_YEAR_NAMES, WEEKDAYS
+# csdate and pakdate import this module; their classes are looked up when used
+from . import csdate, julianday, lsyear, pakdate
+
+__all__ = (
+    "CS",
+    "PAK",
+    "DATE",
+    "strftime",
+    "strptime",
+    "format_many",
+    "parse_many",
+    "ParseError",
+)
+
+# kinds of date
+CS = "cs"
+PAK = "pak"
+DATE = "date"
+
+_THAI_DIGITS = str.maketrans("0123456789", "๐๑๒๓๔๕๖๗๘๙")
+_DIRECTIVE = re.compile(r"%([-OE]*)(.?)", re.DOTALL)
+
+# Saturday first, as WEEKDAYS
+WEEKDAYS_ABBR = ["ส.", "อา.", "จ.", "อ.", "พ.", "พฤ.", "ศ."]
+LUNAR_MONTH_NAMES = {
+    1: "อ้าย", 2: "ยี่", 3: "สาม", 4: "สี่", 5: "ห้า", 6: "หก", 7: "เจ็ด",
+    8: "แปด", 9: "เก้า", 10: "สิบ", 11: "สิบเอ็ด", 12: "สิบสอง", 88: "แปดหลัง",
+}
+MONTH_NAMES = [
+    None, "มกราคม", "กุมภาพันธ์", "มีนาคม", "เมษายน", "พฤษภาคม", "มิถุนายน",
+    "กรกฎาคม", "สิงหาคม", "กันยายน", "ตุลาคม", "พฤศจิกายน", "ธันวาคม",
+]
+MONTH_NAMES_ABBR = [
+    None, "ม.ค.", "ก.พ.", "มี.ค.", "เม.ย.", "พ.ค.", "มิ.ย.",
+    "ก.ค.", "ส.ค.", "ก.ย.", "ต.ค.", "พ.ย.", "ธ.ค.",
+]
+
+# Values extracted once per date; directives are functions of these.
+#   CS:   (year, month, day, days, julianday, csweekday)
+#   PAK:  (cycle, a, b, c, d, e, f, julianday, iswaxing)
+#   DATE: the date object
+_CS_DIRECTIVES = {
+    "Y": (lambda v: v[0], 0),
+    "m": (lambda v: v[1], 2),
+    "B": (lambda v: "เดือน" + LUNAR_MONTH_NAMES[v[1]], 0),
+    "b": (lambda v: LUNAR_MONTH_NAMES[v[1]], 0),
+    "d": (lambda v: v[2], 2),
+    "e": (lambda v: v[2] if v[2] <= 15 else v[2] - 15, 2),
+    "p": (lambda v: "ขึ้น" if v[2] <= 15 else "แรม", 0),
+    "A": (lambda v: WEEKDAYS[v[5]], 0),
+    "a": (lambda v: WEEKDAYS_ABBR[v[5]], 0),
+    "w": (lambda v: (v[5] + 6) % 7, 0),
+    "K": (lambda v: LUNAR_YEAR_NAMES[(v[0] - 1) % 12], 0),
+    "j": (lambda v: v[3] + 1, 3),
+    "J": (lambda v: v[4], 0),
+}
+_CS_ERA_DIRECTIVES = {
+    "Y": (lambda v: "จ.ศ." + str(v[0]), 0),
+    "y": (lambda v: v[0], 0),
+}
+
+_PAK_DIRECTIVES = {
+    "P": (lambda v: "%d-%d:%d:%d:%d:%d:%d" % v[:7], 0),
+    "C": (lambda v: v[0], 0),
+    "p": (lambda v: "ขึ้น" if v[8] else "แรม", 0),
+    "A": (lambda v: WEEKDAYS[(v[7] - CS_JULIAN_DAY_OFFSET) % 7], 0),
+    "a": (lambda v: WEEKDAYS_ABBR[(v[7] - CS_JULIAN_DAY_OFFSET) % 7], 0),
+    "w": (lambda v: (v[7] + 1) % 7, 0),
+    "J": (lambda v: v[7], 0),
+}
+for _i in range(1, 7):
+    _PAK_DIRECTIVES[str(_i)] = (lambda v, i=_i: v[i], 0)
+
+_DATE_DIRECTIVES = {
+    "Y": (lambda d: d.year, 0),
+    "y": (lambda d: d.year % 100, 2),
+    "m": (lambda d: d.month, 2),
+    "d": (lambda d: d.day, 2),
+    "j": (lambda d: d.timetuple().tm_yday, 3),
+    "J": (julianday.date_to_julianday, 0),
+}
+_DATE_ERA_DIRECTIVES = {
+    "Y": (lambda d: "พ.ศ." + str(d.year + 543), 0),
+    "y": (lambda d: d.year + 543, 0),
+    "A": (lambda d: WEEKDAYS[(d.weekday() + 2) % 7], 0),
+    "a": (lambda d: WEEKDAYS_ABBR[(d.weekday() + 2) % 7], 0),
+    "B": (lambda d: MONTH_NAMES[d.month], 0),
+    "b": (lambda d: MONTH_NAMES_ABBR[d.month], 0),
+}
+
+_DIRECTIVES = {
+    CS: (_CS_DIRECTIVES, _CS_ERA_DIRECTIVES),
+    PAK: (_PAK_DIRECTIVES, {}),
+    DATE: (_DATE_DIRECTIVES, _DATE_ERA_DIRECTIVES),
+}
+
+
+def _cs_values(cs):
+    return (cs.year, cs.month, cs.day, cs.days, cs.julianday, cs.csweekday())
+
+
+def _pak_values(pak):
+    return pak.pakdata + (pak.julianday, pak.iswaxing)
+
+
+_VALUES = {
+    CS: _cs_values,
+    PAK: _pak_values,
+    DATE: lambda d: d,
+}
+
+
+def _field(getter, width, flags):
+    pad = width and "-" not in flags
+    thai = "O" in flags
+    if not pad and not thai:
+        return lambda v: str(getter(v))  # noqa: E731
+
+    # values have small ranges, so cache their conversions to text
+    @lru_cache(maxsize=1024)
+    def text(value):
+        s = "%0*d" % (width, value) if pad else str(value)
+        return s.translate(_THAI_DIGITS) if thai else s
+    return lambda v: text(getter(v))  # noqa: E731
+
+
+@lru_cache(maxsize=256)
+def _compile(fmt: str, kind: str):
+    """
+    Compile a format string to a function of a date's value tuple that
+    returns the formatted string.
+    """
+    directives, era_directives = _DIRECTIVES[kind]
+    parts = []
+    literal = []
+    pos = 0
+    for m in _DIRECTIVE.finditer(fmt):
+        literal.append(fmt[pos:m.start()])
+        pos = m.end()
+        flags, char = m.groups()
+        if char == "%" and not flags:
+            literal.append("%")
+            continue
+        table = era_directives if "E" in flags else directives
+        if char in table:
+            getter, width = table[char]
+        elif kind == DATE and char.isalpha() and "E" not in flags:
+            getter, width = (lambda d, s="%" + char: d.strftime(s)), 0
+        else:
+            raise ValueError("Invalid format directive {!r} in {!r}".format(m.group(), fmt))
+        if "".join(literal):
+            parts.append("".join(literal))
+        literal = []
+        parts.append(_field(getter, width, flags))
+    literal.append(fmt[pos:])
+    if "".join(literal):
+        parts.append("".join(literal))
+    parts = tuple(parts)
+
+    # literal text and field functions, joined in order
+    def render(v):
+        return "".join([p if isinstance(p, str) else p(v) for p in parts])
+    return render
+
+
+def _kind(obj):
+    if isinstance(obj, csdate.CsDate):
+        return CS
+    if isinstance(obj, pakdate.PakDate):
+        return PAK
+    if isinstance(obj, date):
+        return DATE
+    raise TypeError("Cannot format object of type {}.".format(type(obj).__name__))
+
+
+def strftime(obj, fmt: str, kind: str = None) -> str:
+    """
+    Format a CsDate, PakDate or datetime.date object.
+    """
+    if kind is None:
+        kind = _kind(obj)
+    return _compile(fmt, kind)(_VALUES[kind](obj))
+
+
+def _array_values(jds, kind):
+    """Return an iterator of value tuples for an array of Julian Day Numbers."""
+    from . import vector
+    jds = vector.np.asarray(jds, dtype=vector.np.int64)
+    if kind == CS:
+        f = vector.from_julianday(jds)
+        columns = (f.year, f.month, f.day, f.days, f.horakhun + CS_JULIAN_DAY_OFFSET, f.horakhun % 7)
+    elif kind == PAK:
+        f = vector.pak_from_julianday(jds)
+        columns = (f.cycle, f.a, f.b, f.c, f.d, f.e, f.f, jds, f.iswaxing)
+    else:
+        raise ValueError("Julian Day Numbers can only be formatted as CS or PAK dates.")
+    return zip(*(c.tolist() for c in columns))
+
+
+def format_many(fmt: str, items, kind: str = None):
+    """
+    Format a sequence of dates with one format string, returning a list of
+    strings. items can be CsDate, PakDate or datetime.date objects, or Julian
+    Day Numbers (formatted as kind, CS by default). A NumPy array of Julian
+    Day Numbers is converted in bulk without creating date objects.
+    """
+    if type(items).__module__ == "numpy":
+        kind = kind or CS
+        render = _compile(fmt, kind)
+        return [render(v) for v in _array_values(items, kind)]
+
+    out = []
+    compiled = {}
+    for obj in items:
+        if isinstance(obj, int):
+            k = kind or CS
+            obj = (csdate.CsDate if k == CS else pakdate.PakDate).fromjulianday(obj)
+        else:
+            k = kind or _kind(obj)
+        if k not in compiled:
+            compiled[k] = (_compile(fmt, k), _VALUES[k])
+        render, values = compiled[k]
+        out.append(render(values(obj)))
+    return out
+
+
+class ParseError(ValueError):
+    """
+    A record that could not be parsed. lineno is the 1-based record number
+    in the input and text the record itself.
+    """
+
+    def __init__(self, reason, text, lineno):
+        self.reason = reason
+        self.text = text
+        self.lineno = lineno
+        super().__init__("line {}: {}".format(lineno, reason))
+
+
+def _names(names):
+    """Return a regex alternation of names, longest first."""
+    return "|".join(re.escape(n) for n in sorted(names, key=len, reverse=True))
+
+
+def _number(n):
+    return r"[0-9๐-๙]{1,%d}" % n
+
+
+# Parsing: directive -> (regex, component, converter). Numbers are accepted
+# with Arabic or Thai digits whatever the flags; _IGNORE components are
+# matched and not used.
+_LUNAR_MONTHS = {name: m for m, name in LUNAR_MONTH_NAMES.items()}
+_PHASES = {"ขึ้น": 0, "แรม": 15}
+_IGNORE = None
+
+_CS_PARSE = {
+    "Y": (_number(4), "year", int),
+    "m": (_number(2), "month", int),
+    "B": ("เดือน(?:%s)" % _names(_LUNAR_MONTHS), "month", lambda s: _LUNAR_MONTHS[s[5:]]),
+    "b": (_names(_LUNAR_MONTHS), "month", _LUNAR_MONTHS.get),
+    "d": (_number(2), "day", int),
+    "e": (_number(2), "phase_day", int),
+    "p": (_names(_PHASES), "phase", _PHASES.get),
+    "A": (_names(WEEKDAYS), "weekday", WEEKDAYS.index),
+    "a": (_names(WEEKDAYS_ABBR), "weekday", WEEKDAYS_ABBR.index),
+    "w": ("[0-6]", "weekday", lambda s: (int(s) + 1) % 7),
+    "K": (_names(LUNAR_YEAR_NAMES), _IGNORE, None),
+    "j": (_number(3), "yday", int),
+    "J": (_number(8), "julianday", int),
+}
+_CS_ERA_PARSE = {
+    "Y": (r"จ\.ศ\.\s*" + _number(4), "year", lambda s: int(s[4:].strip())),
+    "y": (_number(4), "year", int),
+}
+_PAK_PARSE = {
+    "P": (r"[0-9]{1,4}-[0-9]{1,2}(?::[0-9]{1,2}){5}", "pakcode", str),
+    "C": (_number(4), 0, int),
+    "p": (_names(_PHASES), _IGNORE, None),
+    "A": (_names(WEEKDAYS), _IGNORE, None),
+    "a": (_names(WEEKDAYS_ABBR), _IGNORE, None),
+    "w": ("[0-6]", _IGNORE, None),
+    "J": (_number(8), "julianday", int),
+}
+for _i in range(1, 7):
+    _PAK_PARSE[str(_i)] = (_number(2), _i, int)
+
+
+def _date_parse():
+    import calendar
+    english = {}
+    for table, names in (("A", calendar.day_name), ("a", calendar.day_abbr)):
+        english[table] = (_names(names), _IGNORE, None)
+    for table, names in (("B", calendar.month_name), ("b", calendar.month_abbr)):
+        months = {n: m for m, n in enumerate(names) if n}
+        english[table] = (_names(months), "month", months.get)
+    return english
+
+
+_DATE_PARSE = {
+    "Y": (_number(4), "year", int),
+    "y": (_number(2), "year", lambda s: int(s) + (1900 if int(s) >= 69 else 2000)),
+    "m": (_number(2), "month", int),
+    "d": (_number(2), "day", int),
+    "j": (_number(3), "yday", int),
+    "J": (_number(8), "julianday", int),
+    **_date_parse(),
+}
+_THAI_MONTHS = {n: m for m, n in enumerate(MONTH_NAMES) if n}
+_THAI_MONTHS_ABBR = {n: m for m, n in enumerate(MONTH_NAMES_ABBR) if n}
+_DATE_ERA_PARSE = {
+    "Y": (r"พ\.ศ\.\s*" + _number(4), "year", lambda s: int(s[4:].strip()) - 543),
+    "y": (_number(4), "year", lambda s: int(s) - 543),
+    "A": (_names(WEEKDAYS), _IGNORE, None),
+    "a": (_names(WEEKDAYS_ABBR), _IGNORE, None),
+    "B": (_names(_THAI_MONTHS), "month", _THAI_MONTHS.get),
+    "b": (_names(_THAI_MONTHS_ABBR), "month", _THAI_MONTHS_ABBR.get),
+}
+
+_PARSE_DIRECTIVES = {
+    CS: (_CS_PARSE, _CS_ERA_PARSE),
+    PAK: (_PAK_PARSE, {}),
+    DATE: (_DATE_PARSE, _DATE_ERA_PARSE),
+}
+
+
+@lru_cache(maxsize=256)
+def _compile_parser(fmt: str, kind: str):
+    """
+    Compile a format string to a regex and a tuple of (group, component,
+    converter) for the groups that determine the date.
+    """
+    directives, era_directives = _PARSE_DIRECTIVES[kind]
+    pattern = []
+    fields = []
+    pos = 0
+
+    def literal(text):
+        # whitespace matches any run of whitespace, as in time.strptime()
+        return r"\s+".join(re.escape(t) for t in re.split(r"\s+", text))
+
+    for m in _DIRECTIVE.finditer(fmt):
+        pattern.append(literal(fmt[pos:m.start()]))
+        pos = m.end()
+        flags, char = m.groups()
+        if char == "%" and not flags:
+            pattern.append("%")
+            continue
+        table = era_directives if "E" in flags else directives
+        if char not in table:
+            raise ValueError("Invalid format directive {!r} in {!r}".format(m.group(), fmt))
+        regex, component, convert = table[char]
+        if component is _IGNORE:
+            pattern.append("(?:{})".format(regex))
+        else:
+            group = "g{}".format(len(fields))
+            pattern.append("(?P<{}>{})".format(group, regex))
+            fields.append((group, component, convert))
+    pattern.append(literal(fmt[pos:]))
+    return re.compile("".join(pattern)), tuple(fields)
+
+
+def _components(s, fmt, kind):
+    regex, fields = _compile_parser(fmt, kind)
+    m = regex.fullmatch(s.strip())
+    if m is None:
+        raise ValueError("{!r} does not match format {!r}".format(s, fmt))
+    return {component: convert(m.group(group)) for group, component, convert in fields}
+
+
+@lru_cache(maxsize=1024)
+def _cs_year_months(year):
+    """
+    Return the first and last + 1 Julian Day Numbers of a CS year and a dict
+    of month number to (first day, days in month) of the lunar months that
+    can be dated in it. Month 5 or 6 can be at the start of the CS year or
+    at the end (in the next lunar year).
+    """
+    months = {}
+    for y in (year, year + 1):
+        for m in csdate.lunar_months(y):
+            if y == year or m.month in (5, 6):
+                months.setdefault(m.month, []).append((m.julianday, m.days))
+    first = lsyear.year_horakhun(year) + CS_JULIAN_DAY_OFFSET
+    last = lsyear.year_horakhun(year + 1) + CS_JULIAN_DAY_OFFSET
+    return first, last, months
+
+
+def _build_cs(c):
+    CsDate = csdate.CsDate
+    if "julianday" in c:
+        return CsDate.fromjulianday(c["julianday"])
+    if "year" in c and "yday" in c:
+        year0 = CsDate.calculate_year0(c["year"])
+        if not 1 <= c["yday"] <= 365 + int(year0.leapday):
+            raise ValueError("Day of year out of range.")
+        return CsDate.fromyd(c["year"], c["yday"] - 1)
+    day = c.get("day")
+    if day is None and "phase_day" in c and "phase" in c:
+        day = c["phase_day"] + c["phase"]
+    if "year" not in c or "month" not in c or day is None:
+        raise ValueError("Not enough fields to determine the date.")
+    year, month = c["year"], c["month"]
+    first, last, months = _cs_year_months(year)
+    candidates = [
+        start + day - 1 for start, days in months.get(month, ())
+        if 1 <= day <= days and first <= start + day - 1 < last
+    ]
+    if not candidates:
+        raise ValueError("Invalid date {}-{}-{}".format(year, month, day))
+    if "weekday" in c:
+        candidates = [jd for jd in candidates if (jd - CS_JULIAN_DAY_OFFSET) % 7 == c["weekday"]]
+        if not candidates:
+            raise ValueError("Weekday does not match date {}-{}-{}".format(year, month, day))
+    return CsDate.fromjulianday(candidates[0])
+
+
+def _build_pak(c):
+    PakDate = pakdate.PakDate
+    if "julianday" in c:
+        return PakDate(jd=c["julianday"])
+    code = c.get("pakcode")
+    if code is None:
+        if not all(i in c for i in range(7)):
+            raise ValueError("Not enough fields to determine the date.")
+        code = "{}-{}:{}:{}:{}:{}:{}".format(*(c[i] for i in range(7)))
+    pak = None
+    if not code.startswith("0-"):
+        pak = PakDate(pakcode=code)
+    if pak is None or pak.pakcode != code:
+        raise ValueError("Invalid pakcode {}".format(code))
+    return pak
+
+
+def _build_date(c):
+    from . import date as pdate
+    if "julianday" in c:
+        return pdate(*julianday.from_julianday(c["julianday"]))
+    if "year" in c and "yday" in c:
+        d = pdate(c["year"], 1, 1).toordinal() + c["yday"] - 1
+        if not 1 <= c["yday"] <= 366 or date.fromordinal(d).year != c["year"]:
+            raise ValueError("Day of year out of range.")
+        d = date.fromordinal(d)
+        return pdate(d.year, d.month, d.day)
+    if not all(k in c for k in ("year", "month", "day")):
+        raise ValueError("Not enough fields to determine the date.")
+    return pdate(c["year"], c["month"], c["day"])
+
+
+_BUILD = {
+    CS: _build_cs,
+    PAK: _build_pak,
+    DATE: _build_date,
+}
+
+
+def strptime(s: str, fmt: str, kind: str = CS):
+    """
+    Parse a string according to fmt, returning a CsDate (kind CS), PakDate
+    (PAK) or pythaidate.date (DATE). Raises ValueError if the string does
+    not match the format or is not a valid date.
+    """
+    return _BUILD[kind](_components(s, fmt, kind))
+
+
+def parse_many(source, fmt: str, kind: str = CS, as_julianday: bool = False,
+               errors: str = "report"):
+    """
+    Parse records from an iterable of strings or a text file (one record
+    per line; blank lines are skipped), yielding dates, or Julian Day
+    Numbers if as_julianday is true. Records that cannot be parsed are
+    handled according to errors:
+
+        "report"  yield a ParseError in place of the date
+        "skip"    leave the record out
+        "raise"   raise the ParseError
+
+    Repeated strings are parsed once.
+    """
+    if errors not in ("report", "skip", "raise"):
+        raise ValueError("errors must be 'report', 'skip' or 'raise'.")
+    build = _BUILD[kind]
+
+    @lru_cache(maxsize=4096)
+    def parse(text):
+        obj = build(_components(text, fmt, kind))
+        return obj.julianday if as_julianday else obj
+
+    for lineno, text in enumerate(source, 1):
+        if isinstance(text, bytes):
+            text = text.decode("utf-8")
+        text = text.strip()
+        if not text:
+            continue
+        try:
+            yield parse(text)
+        except ValueError as e:
+            err = ParseError(str(e), text, lineno)
+            if errors == "raise":
+                raise err from None
+            if errors == "report":
+                yield err
@@ -1,63 +1,147 @@
+import codecs
+from contextlib import nullcontext
+import io
+import mmap as _mmap
+import os
+import re
+
 __ALL__ = (
     "digit_thai_to_arabic",
     "digit_arabic_to_thai",
     "thai_string_width",
+    "string_width",
+    "iter_transcode",
+    "transcode",
 )
 
-__digits_arabic_thai = {
-    "0": "๐",
-    "1": "๑",
-    "2": "๒",
-    "3": "๓",
-    "4": "๔",
-    "5": "๕",
-    "6": "๖",
-    "7": "๗",
-    "8": "๘",
-    "9": "๙",
-}
+ARABIC_DIGITS = "0123456789"
+THAI_DIGITS = "๐๑๒๓๔๕๖๗๘๙"
+
+# str.translate() tables
+THAI_TO_ARABIC = str.maketrans(THAI_DIGITS, ARABIC_DIGITS)
+ARABIC_TO_THAI = str.maketrans(ARABIC_DIGITS, THAI_DIGITS)
 
-__digits_thai_arabic = {
-    "๐": "0",
-    "๑": "1",
-    "๒": "2",
-    "๓": "3",
-    "๔": "4",
-    "๕": "5",
-    "๖": "6",
-    "๗": "7",
-    "๘": "8",
-    "๙": "9",
+# str.translate() looks up non-ASCII text one character at a time, so the
+# conversions are done as one str.replace() per digit (of the same tables),
+# skipping digits that aren't present.
+__thai_to_arabic = tuple((chr(k), chr(v)) for k, v in THAI_TO_ARABIC.items())
+__arabic_to_thai = tuple((chr(k), chr(v)) for k, v in ARABIC_TO_THAI.items())
+_REPLACEMENTS = {
+    "arabic": __thai_to_arabic,
+    "thai": __arabic_to_thai,
 }
 
-__thai_central_chars = "ผปแอทมใฝฉฮฬฦฟหกดเาสวงฤฆฏโฌษศซๆไำพะรนยบลฃ๐ฎฑธณฯญฐฅๅ๑๒ภ๓ถ๔฿ค๕ต๖จ๗ข๘ช๙"
+# Thai combining vowels and tone marks (ั ิ ี ึ ื ุ ู ฺ ็ ่ ้ ๊ ๋ ์ ํ ๎) take no
+# space of their own; every other character of the Thai block does. Thai
+# block characters are counted by their UTF-8 lead bytes.
+__thai_combining = "ั" + "".join(map(chr, range(0x0e34, 0x0e3b))) + "".join(map(chr, range(0x0e47, 0x0e4f)))
+__thai_lead_bytes = (b"\xe0\xb8", b"\xe0\xb9")  # U+0E00-0E3F, U+0E40-0E7F
+__zero_width = re.compile("[" + __thai_combining + "\u0300-\u036f\u200b-\u200d\ufeff]")
+
+CHUNK_SIZE = 1 << 20
+
+
+def _replace(s, replacements):
+    for old, new in replacements:
+        if old in s:
+            s = s.replace(old, new)
+    return s
+
 
 def digit_thai_to_arabic(s) -> str:
-    result = []
-    for c in s:
-        if c in __digits_thai_arabic:
-            result.append(__digits_thai_arabic[c])
-        else:
-            result.append(c)
-    return "".join(result)
+    return _replace(s, __thai_to_arabic)
 
 
 def digit_arabic_to_thai(s: str) -> str:
     if isinstance(s, int):
         # leading zeros won't be preserved
         s = str(s)
-    result = []
-    for c in s:
-        if c in __digits_arabic_thai:
-            result.append(__digits_arabic_thai[c])
-        else:
-            result.append(c)
-    return "".join(result)
+    return _replace(s, __arabic_to_thai)
 
 
 def thai_string_width(s):
+    """
+    Return the number of Thai characters in s that take up a column when
+    displayed, ie. not counting combining vowels and tone marks.
+    """
+    b = s.encode("utf-8")
+    return sum(map(b.count, __thai_lead_bytes)) - sum(map(s.count, __thai_combining))
+
+
+def string_width(s):
+    """
+    Return the display width of s in columns, counting combining vowels,
+    tone marks and other zero width characters as zero.
+    """
+    return len(s) - __zero_width.subn("", s)[1]
+
+
+def iter_transcode(chunks, to: str = "arabic"):
+    """
+    Convert the digits of an iterable of strings to Arabic (to="arabic") or
+    Thai (to="thai") digits, yielding the converted strings.
+    """
+    replacements = _REPLACEMENTS[to]
+    for chunk in chunks:
+        yield _replace(chunk, replacements)
+
+
+def _decode(chunks, encoding):
+    # incremental decoding handles characters split between chunks
+    decoder = codecs.getincrementaldecoder(encoding)()
+    for chunk in chunks:
+        yield decoder.decode(chunk)
+    yield decoder.decode(b"", final=True)
+
+
+def _read_chunks(src, chunk_size, encoding, use_mmap):
+    if use_mmap:
+        with open(src, "rb") if isinstance(src, (str, os.PathLike)) else nullcontext(src) as fh:
+            size = os.fstat(fh.fileno()).st_size
+            if size == 0:
+                return
+            with _mmap.mmap(fh.fileno(), 0, access=_mmap.ACCESS_READ) as mm:
+                yield from _decode(
+                    (mm[i:i + chunk_size] for i in range(0, size, chunk_size)), encoding)
+        return
+    if isinstance(src, (str, os.PathLike)):
+        with open(src, encoding=encoding, newline="") as fh:
+            yield from _read_chunks(fh, chunk_size, encoding, False)
+        return
+    chunks = iter(lambda: src.read(chunk_size), src.read(0))
+    first = next(chunks, None)
+    if first is None:
+        return
+    if isinstance(first, bytes):
+        yield from _decode(_chain(first, chunks), encoding)
+    else:
+        yield first
+        yield from chunks
+
+
+def _chain(first, rest):
+    yield first
+    yield from rest
+
+
+def transcode(src, dst, to: str = "arabic", chunk_size: int = CHUNK_SIZE,
+              encoding: str = "utf-8", mmap: bool = False) -> int:
+    """
+    Convert the digits of a text file to Arabic (to="arabic") or Thai
+    (to="thai") digits, writing the result to dst, and return the number of
+    characters written. src and dst may be file names or file objects (text
+    or binary). The input is processed chunk_size characters (bytes for
+    binary files) at a time. With mmap=True the source file is memory-mapped
+    instead of read.
+    """
+    replacements = _REPLACEMENTS[to]
     count = 0
-    for c in s:
-        if c in __thai_central_chars:
-            count += 1
-    return count
\ No newline at end of file
+    with open(dst, "w", encoding=encoding, newline="") if isinstance(dst, (str, os.PathLike)) \
+            else nullcontext(dst) as out:
+        binary = isinstance(out, (io.RawIOBase, io.BufferedIOBase)) or "b" in getattr(out, "mode", "")
+        write = out.write
+        for chunk in _read_chunks(src, chunk_size, encoding, mmap):
+            chunk = _replace(chunk, replacements)
+            count += len(chunk)
+            write(chunk.encode(encoding) if binary else chunk)
+    return count
@@ -0,0 +1,143 @@
+"""
+Buddhist holy days of the Thai lunisolar calendar.
+
+Holy days are computed from each lunar year's month table (see
+csdate.lunar_months()), so a year costs one year calculation and the
+results are cached per year. The holy days of CS year year are those of the
+lunar year that begins with month 5 of that year:
+
+    วันวิสาขบูชา   Visakha Bucha  15th waxing of month 6 (month 7 in a year
+                                with an intercalary month)
+    วันอาสาฬหบูชา  Asanha Bucha   15th waxing of month 8 (month 88 in a year
+                                with an intercalary month)
+    วันเข้าพรรษา   Khao Phansa    the day after Asanha Bucha
+    วันออกพรรษา   Ok Phansa      15th waxing of month 11
+    วันมาฆบูชา    Makha Bucha    15th waxing of month 3 (month 4 if the next
+                                CS year has an intercalary month)
+
+Makha Bucha follows the Thai custom of starting the year with month 1: it
+moves to month 4 when the year of months 1-12 it falls in, which is the
+next CS year from month 5 on, has an intercalary month.
+
+วันพระ (wan phra) are the 8th and 15th waxing and the 8th and last waning
+days (waning 14 in a 29 day month) of every month.
+"""
+
+from bisect import bisect_left
+from collections import namedtuple
+from functools import lru_cache
+
+from . import lsyear
+from .csdate import CsDate, lunar_months, _lunar_year
+from .julianday import _to_julianday
+
+__all__ = (
+    "Holiday",
+    "MAKHA_BUCHA",
+    "VISAKHA_BUCHA",
+    "ASANHA_BUCHA",
+    "KHAO_PHANSA",
+    "OK_PHANSA",
+    "WAN_PHRA",
+    "HOLIDAY_NAMES",
+    "holidays",
+    "wanphra",
+    "between",
+)
+
+Holiday = namedtuple("Holiday", ["name", "julianday"])
+
+MAKHA_BUCHA = "makha_bucha"
+VISAKHA_BUCHA = "visakha_bucha"
+ASANHA_BUCHA = "asanha_bucha"
+KHAO_PHANSA = "khao_phansa"
+OK_PHANSA = "ok_phansa"
+WAN_PHRA = "wan_phra"
+
+HOLIDAY_NAMES = {
+    MAKHA_BUCHA: "วันมาฆบูชา",
+    VISAKHA_BUCHA: "วันวิสาขบูชา",
+    ASANHA_BUCHA: "วันอาสาฬหบูชา",
+    KHAO_PHANSA: "วันเข้าพรรษา",
+    OK_PHANSA: "วันออกพรรษา",
+    WAN_PHRA: "วันพระ",
+}
+
+
+@lru_cache(maxsize=lsyear.YEAR_CACHE_SIZE)
+def _year_days(year: int):
+    """
+    Return a dict of holy day name to a sorted tuple of the Julian Day
+    Numbers of that holy day in CS year year.
+    """
+    months = lunar_months(year)
+    start = {m.month: m.julianday for m in months}
+    leap = 88 in start
+    next_leap = lsyear.calculate_year0(year + 1).leap_month
+    asanha = start[88 if leap else 8] + 14
+    return {
+        VISAKHA_BUCHA: (start[7 if leap else 6] + 14,),
+        ASANHA_BUCHA: (asanha,),
+        KHAO_PHANSA: (asanha + 1,),
+        OK_PHANSA: (start[11] + 14,),
+        MAKHA_BUCHA: (start[4 if next_leap else 3] + 14,),
+        WAN_PHRA: tuple(
+            jd
+            for m in months
+            for jd in (m.julianday + 7, m.julianday + 14, m.julianday + 22, m.julianday + m.days - 1)
+        ),
+    }
+
+
+def holidays(year: int):
+    """
+    Return the holy days of CS year year, other than wan phra, as a tuple of
+    Holiday(name, julianday) records in date order.
+    """
+    days = _year_days(year)
+    return tuple(sorted(
+        (Holiday(name, jds[0]) for name, jds in days.items() if name != WAN_PHRA),
+        key=lambda h: h.julianday,
+    ))
+
+
+def wanphra(year: int):
+    """
+    Return the Julian Day Numbers of the wan phra days of CS year year.
+    """
+    return _year_days(year)[WAN_PHRA]
+
+
+def between(start, stop, names=None, as_date: bool = False):
+    """
+    Return a sorted list of the Julian Day Numbers (CsDate objects if
+    as_date is true) of holy days from start up to, but not including,
+    stop. Bounds may be CsDate (or other objects with a julianday property),
+    datetime.date objects or Julian Day Numbers. names is a holy day name or
+    an iterable of names and defaults to all of them, including WAN_PHRA.
+    """
+    start = _to_julianday(start)
+    stop = _to_julianday(stop)
+    if names is None:
+        names = tuple(HOLIDAY_NAMES)
+    elif isinstance(names, str):
+        names = (names,)
+    else:
+        names = tuple(names)
+    for name in names:
+        if name not in HOLIDAY_NAMES:
+            raise ValueError("Unknown holy day {!r}.".format(name))
+    if start >= stop:
+        return []
+
+    result = []
+    for year in range(_lunar_year(start), _lunar_year(stop - 1) + 1):
+        days = _year_days(year)
+        if len(names) == 1:
+            result.extend(days[names[0]])
+        else:
+            result.extend(sorted(set().union(*(days[name] for name in names))))
+    result = result[bisect_left(result, start):bisect_left(result, stop)]
+    if as_date:
+        return [CsDate.fromjulianday(jd) for jd in result]
+    return result
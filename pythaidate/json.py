@@ -0,0 +1,74 @@
+"""
+JSON serialization for pythaidate objects. Dates are written as single key
+objects tagged with their type and holding the Julian Day Number:
+
+    CsDate          {"$cs": 2451545}
+    PakDate         {"$pak": 2451545}
+
+and read back through the types' fromjulianday() constructors. The default()
+and object_hook() functions can be passed to the standard library's json
+functions directly.
+"""
+
+import json
+
+from .csdate import CsDate
+from .pakdate import PakDate
+
+__all__ = (
+    "dumps",
+    "loads",
+    "dump",
+    "load",
+    "default",
+    "object_hook",
+)
+
+_TAGS = {
+    CsDate: "$cs",
+    PakDate: "$pak",
+}
+_TYPES = {tag: cls for cls, tag in _TAGS.items()}
+
+
+def default(obj):
+    """Return a JSON serializable version of a pythaidate object."""
+    for cls, tag in _TAGS.items():
+        if isinstance(obj, cls):
+            return {tag: obj.julianday}
+    raise TypeError(
+        "Object of type {} is not JSON serializable".format(type(obj).__name__))
+
+
+def object_hook(obj):
+    """Convert a tagged JSON object back to a pythaidate object."""
+    if len(obj) == 1:
+        tag, jd = next(iter(obj.items()))
+        cls = _TYPES.get(tag)
+        if cls is not None and type(jd) is int:
+            return cls.fromjulianday(jd)
+    return obj
+
+
+def dumps(obj, **kwargs):
+    """Serialize obj to a JSON formatted str, including pythaidate objects."""
+    kwargs.setdefault("default", default)
+    return json.dumps(obj, **kwargs)
+
+
+def loads(s, **kwargs):
+    """Deserialize a JSON document, restoring pythaidate objects."""
+    kwargs.setdefault("object_hook", object_hook)
+    return json.loads(s, **kwargs)
+
+
+def dump(obj, fp, **kwargs):
+    """Serialize obj as a JSON formatted stream to fp."""
+    kwargs.setdefault("default", default)
+    return json.dump(obj, fp, **kwargs)
+
+
+def load(fp, **kwargs):
+    """Deserialize a JSON document from fp, restoring pythaidate objects."""
+    kwargs.setdefault("object_hook", object_hook)
+    return json.load(fp, **kwargs)
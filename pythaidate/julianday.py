@@ -3,60 +3,154 @@ Julian Day functions.
 
 Julian day convertor:
 https://core2.gsfc.nasa.gov/time/julian.html
+
+Conversions use exact integer arithmetic. Dates are read in the Julian
+calendar before 1582-10-15 and in the Gregorian calendar from then on
+(cutover STANDARD), or in either calendar throughout (cutover GREGORIAN or
+JULIAN, the proleptic calendars). Years are numbered astronomically (1 BC is
+year 0). datetime.date objects from the start of the Gregorian calendar
+convert through date.toordinal().
 """
 
-import math
 from datetime import date
 
+__all__ = (
+    "STANDARD",
+    "GREGORIAN",
+    "JULIAN",
+    "to_julianday",
+    "from_julianday",
+    "to_julianday_many",
+    "from_julianday_many",
+    "today",
+    "date_to_julianday",
+    "julianday_to_date",
+)
+
+# calendar reform cutovers
+STANDARD = "standard"
+GREGORIAN = "gregorian"
+JULIAN = "julian"
+
+# Julian Day Number of 1582-10-15, the first day of the Gregorian calendar
+GREGORIAN_START = 2299161
+# date.toordinal() + ORDINAL_OFFSET is the Julian Day Number
+ORDINAL_OFFSET = 1721425
+GREGORIAN_START_ORDINAL = GREGORIAN_START - ORDINAL_OFFSET
+
+
+# The calendar functions below only use +, -, * and // so they work on NumPy
+# arrays as well as ints.
+
+def _gregorian_to_jd(year, month, day):
+    a = (14 - month) // 12
+    y = year + 4800 - a
+    m = month + 12 * a - 3
+    return day + (153 * m + 2) // 5 + 365 * y + y // 4 - y // 100 + y // 400 - 32045
+
+
+def _julian_to_jd(year, month, day):
+    a = (14 - month) // 12
+    y = year + 4800 - a
+    m = month + 12 * a - 3
+    return day + (153 * m + 2) // 5 + 365 * y + y // 4 - 32083
+
+
+def _jd_to_gregorian(jd):
+    a = jd + 32044
+    b = (4 * a + 3) // 146097
+    c = a - 146097 * b // 4
+    return _jd_to_ymd(100 * b, c)
+
+
+def _jd_to_julian(jd):
+    return _jd_to_ymd(0, jd + 32082)
+
+
+def _jd_to_ymd(century, c):
+    d = (4 * c + 3) // 1461
+    e = c - 1461 * d // 4
+    m = (5 * e + 2) // 153
+    day = e - (153 * m + 2) // 5 + 1
+    month = m + 3 - 12 * (m // 10)
+    year = century + d - 4800 + m // 10
+    return year, month, day
 
-def to_julianday(year, month, day):
+
+def _check_cutover(cutover):
+    if cutover not in (STANDARD, GREGORIAN, JULIAN):
+        raise ValueError("Unknown calendar cutover {!r}.".format(cutover))
+
+
+def to_julianday(year, month, day, cutover: str = STANDARD):
     """
     Convert year, month, day to Julian Day.
-    Based on: https://gist.github.com/jiffyclub/1294443
     """
-    if month == 1 or month == 2:
-        yearp = year - 1
-        monthp = month + 12
-    else:
-        yearp = year
-        monthp = month
-
-    # this checks where we are in relation to October 15, 1582, the beginning
-    # of the Gregorian calendar.
-    if ((year < 1582) or
-        (year == 1582 and month < 10) or
-        (year == 1582 and month == 10 and day < 15)):
-        # before start of Gregorian calendar
-        B = 0
-    else:
-        # after start of Gregorian calendar
-        A = math.trunc(yearp / 100.)
-        B = 2 - A + math.trunc(A / 4.)
-
-    C = math.trunc((365.25 * yearp) - 0.75) if yearp < 0 else math.trunc(365.25 * yearp)
-    D = math.trunc(30.6001 * (monthp + 1))
-    return int(B + C + D + day + 1720994.5 + 0.5)
-
-
-def from_julianday(jd):
+    if cutover == STANDARD:
+        if (year, month, day) >= (1582, 10, 15):
+            return _gregorian_to_jd(year, month, day)
+        return _julian_to_jd(year, month, day)
+    _check_cutover(cutover)
+    if cutover == GREGORIAN:
+        return _gregorian_to_jd(year, month, day)
+    return _julian_to_jd(year, month, day)
+
+
+def from_julianday(jd, cutover: str = STANDARD):
     """
     Return year, month, day from a Julian day number.
-    Based on: https://gist.github.com/jiffyclub/1294443
     """
     jd = int(jd)  # force to integer
-    # jd = jd + 0.5
-    F, I = math.modf(jd)
-    I = int(I)
-    A = math.trunc((I - 1867216.25)/36524.25)
-    B = (I + 1 + A - math.trunc(A / 4.)) if I > 2299160 else I
-    C = B + 1524
-    D = math.trunc((C - 122.1) / 365.25)
-    E = math.trunc(365.25 * D)
-    G = math.trunc((C - E) / 30.6001)
-    days = C - E + F - math.trunc(30.6001 * G)
-    month = (G - 1) if G < 13.5 else (G - 13)
-    year = (D - 4716) if month > 2.5 else (D - 4715)
-    return year, month, int(days)
+    if cutover == STANDARD:
+        if jd >= GREGORIAN_START:
+            return _jd_to_gregorian(jd)
+        return _jd_to_julian(jd)
+    _check_cutover(cutover)
+    if cutover == GREGORIAN:
+        return _jd_to_gregorian(jd)
+    return _jd_to_julian(jd)
+
+
+def _is_array(obj):
+    return hasattr(obj, "dtype")
+
+
+def to_julianday_many(years, months, days, cutover: str = STANDARD):
+    """
+    Convert sequences of years, months and days to a list of Julian Day
+    Numbers. If any argument is a NumPy array, the arguments are broadcast
+    together and an int64 array is returned.
+    """
+    _check_cutover(cutover)
+    if any(map(_is_array, (years, months, days))):
+        import numpy as np
+        years, months, days = (np.asarray(a, dtype=np.int64) for a in (years, months, days))
+        if cutover == GREGORIAN:
+            return _gregorian_to_jd(years, months, days)
+        if cutover == JULIAN:
+            return _julian_to_jd(years, months, days)
+        gregorian = (years * 10000 + months * 100 + days) >= 15821015
+        return np.where(gregorian, _gregorian_to_jd(years, months, days), _julian_to_jd(years, months, days))
+    return [to_julianday(y, m, d, cutover) for y, m, d in zip(years, months, days)]
+
+
+def from_julianday_many(jds, cutover: str = STANDARD):
+    """
+    Convert a sequence of Julian Day Numbers to a list of (year, month, day)
+    tuples. For a NumPy array, a tuple of int64 arrays (years, months, days)
+    is returned.
+    """
+    _check_cutover(cutover)
+    if _is_array(jds):
+        import numpy as np
+        jds = np.asarray(jds, dtype=np.int64)
+        if cutover == GREGORIAN:
+            return _jd_to_gregorian(jds)
+        if cutover == JULIAN:
+            return _jd_to_julian(jds)
+        gregorian = jds >= GREGORIAN_START
+        return tuple(np.where(gregorian, g, j) for g, j in zip(_jd_to_gregorian(jds), _jd_to_julian(jds)))
+    return [from_julianday(jd, cutover) for jd in jds]
 
 
 def today():  # pragma: no cover
@@ -69,13 +163,95 @@ def date_to_julianday(d):
     if hasattr(d, "julianday"):
         return int(d.julianday)
     assert isinstance(d, date)
+    ordinal = d.toordinal()
+    if ordinal >= GREGORIAN_START_ORDINAL:
+        return ordinal + ORDINAL_OFFSET
     return to_julianday(d.year, d.month, d.day)
 
 def julianday_to_date(obj):
     """Return a date object for the given Julian Day Number or object having a .julianday property."""
     if hasattr(obj, "julianday"):
-        return date(*from_julianday(obj.julianday))
+        obj = obj.julianday
     try:
+        if obj >= GREGORIAN_START:
+            return date.fromordinal(int(obj) - ORDINAL_OFFSET)
         return date(*from_julianday(obj))
     except Exception as e:
-        raise ValueError
\ No newline at end of file
+        raise ValueError
+
+
+def _date_hash(jd):
+    """
+    Return the hash of the date object for Julian Day Number jd (or of jd
+    itself outside the range of datetime.date). Date classes that compare
+    equal to datetime.date objects hash with this.
+    """
+    try:
+        return hash(julianday_to_date(jd))
+    except ValueError:
+        return hash(jd)
+
+
+def _to_julianday(obj):
+    """
+    Return the Julian Day Number of a date-like object or integer.
+    """
+    if isinstance(obj, int):
+        return obj
+    if hasattr(obj, "julianday") or isinstance(obj, date):
+        return date_to_julianday(obj)
+    raise TypeError("Expected a date, an object with a julianday property or a Julian Day Number.")
+
+
+class DateRange:
+    """
+    A lazy, range()-like sequence of dates of the date class cls. See
+    CsDate.range() and PakDate.range(). The class checks the range with
+    cls._checkrange(jds) and builds the dates of a range of Julian Day
+    Numbers with cls._walk(jds).
+    """
+
+    __slots__ = ("__cls", "__jds")
+
+    def __init__(self, cls, start, stop, step: int = 1):
+        self.__cls = cls
+        self.__jds = range(_to_julianday(start), _to_julianday(stop), step)
+        if self.__jds:
+            cls._checkrange(self.__jds)
+
+    @property
+    def start(self):
+        return self.__jds.start
+
+    @property
+    def stop(self):
+        return self.__jds.stop
+
+    @property
+    def step(self):
+        return self.__jds.step
+
+    def __iter__(self):
+        return self.__cls._walk(self.__jds)
+
+    def __reversed__(self):
+        return self.__cls._walk(self.__jds[::-1])
+
+    def __len__(self):
+        return len(self.__jds)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            r = self.__jds[idx]
+            return DateRange(self.__cls, r.start, r.stop, r.step)
+        return self.__cls.fromjulianday(self.__jds[idx])
+
+    def __contains__(self, other):
+        try:
+            return _to_julianday(other) in self.__jds
+        except TypeError:
+            return False
+
+    def __repr__(self):
+        return "{}.range({}, {}, {})".format(
+            self.__cls.__name__, self.start, self.stop, self.step)
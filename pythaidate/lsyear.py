@@ -1,3 +1,6 @@
+from collections import deque, namedtuple
+from functools import lru_cache
+
 from .constants import (
     DAYS_IN_800_YEARS,
     TIME_UNITS_IN_1_DAY,
@@ -5,9 +8,26 @@ from .constants import (
     UCCAPON_CONSTANT,
     APOGEE_ROTATION_DAYS,
     CAL_TYPE_DAY_COUNTS,
+    CS_JULIAN_DAY_OFFSET,
 )
 
 
+def year_horakhun(year: int) -> int:
+    """
+    Return the horakhun of new year's day for a CS year.
+    """
+    return (year * DAYS_IN_800_YEARS + EPOCH_OFFSET) // TIME_UNITS_IN_1_DAY + 1
+
+
+def horakhun_year(horakhun: int) -> int:
+    """
+    Return the CS year containing the given horakhun. This is the exact
+    inverse of year_horakhun(): the largest year whose new year's day is on
+    or before horakhun.
+    """
+    return (horakhun * TIME_UNITS_IN_1_DAY - EPOCH_OFFSET - 1) // DAYS_IN_800_YEARS
+
+
 class LSYear:
     """
     A lightweight class representing a lunisolar year on new year's day.
@@ -18,7 +38,7 @@ class LSYear:
         self.year = year
 
         # this year
-        self.horakhun = (year * DAYS_IN_800_YEARS + EPOCH_OFFSET) // TIME_UNITS_IN_1_DAY + 1
+        self.horakhun = year_horakhun(year)
         self.kammacapon = TIME_UNITS_IN_1_DAY - (year * DAYS_IN_800_YEARS + EPOCH_OFFSET) % TIME_UNITS_IN_1_DAY
         # ucc_i = (2611 + self.ahargana) // APOGEE_ROTATION_DAYS
         self.uccapon = (UCCAPON_CONSTANT + self.horakhun)  % APOGEE_ROTATION_DAYS
@@ -34,7 +54,7 @@ class LSYear:
         self.weekday = self.horakhun % 7
 
         # next year
-        horakhun1 = ((year + 1) * DAYS_IN_800_YEARS + EPOCH_OFFSET) // TIME_UNITS_IN_1_DAY + 1
+        horakhun1 = year_horakhun(year + 1)
         quot1 = (horakhun1 * 11 + 650) // 692
         # avo1 = (ahargana1 * 11 + 650) % 692
         # mas1 = (quot1 + ahargana1) // 30
@@ -85,4 +105,183 @@ class LSYear:
             int(self.leapday),
             int(self.offset),
             self.cal_type
-        )
\ No newline at end of file
+        )
+
+
+# Default number of finished year records held by the year cache.
+YEAR_CACHE_SIZE = 1024
+
+
+class CsYear(namedtuple("CsYear", [
+    "year",
+    "horakhun",
+    "kammacapon",
+    "uccapon",
+    "avoman",
+    "masaken",
+    "tithi",
+    "weekday",
+    "langsak",
+    "nyd",
+    "next_nyd",
+    "leapday",
+    "offset",
+    "cal_type",
+    "caldays",
+    "first_month",
+    "first_day",
+    "offset_days",
+])):
+    """
+    A finished, read-only lunisolar year record on new year's day, with the
+    neighbouring year adjustments of calculate_year0() applied.
+    """
+
+    __slots__ = ()
+
+    @property
+    def julianday(self):
+        """Julian Day Number of new year's day."""
+        return self.horakhun + CS_JULIAN_DAY_OFFSET
+
+    @property
+    def days_in_year(self):
+        """Number of days in the lunar year (354, 355 or 384)."""
+        return self.caldays
+
+    @property
+    def solar_leap_year(self):
+        return self.leapday
+
+    @property
+    def leap_day(self):
+        return self.cal_type == "B"
+
+    @property
+    def leap_month(self):
+        return self.cal_type == "C"
+
+
+def _year0(y):
+    """
+    Return the CsYear record for the centre of a window of five consecutive
+    LSYear objects (year-2 ... year+2), applying the neighbouring year
+    adjustments. The LSYear objects are not modified.
+    """
+    cal_type = [ly.cal_type for ly in y]
+    nyd = [ly.nyd for ly in y]
+    next_nyd = [ly.next_nyd for ly in y]
+
+    if y[2].tithi == 24 and y[3].tithi == 6:
+        # where tithi of this year is 24 and next year is 6, set all years to C-type
+        # adjust next_nyd weekday
+        for i in (0, 1, 2, 3, 4):
+            cal_type[i] = "C"
+            next_nyd[i] = (next_nyd[i] + 2) % 7
+
+    # Adjust c-type years where a intercalary day and month coincide. This can't happen
+    # in the Thai calendar (unlike the Burmese) so we decide if the intercalary day is moved
+    # to the previous or next year. This is done by ensuring a correct sequence of weekdays
+    # from one year to the next.
+    for i in (1, 2, 3):
+        if cal_type[i] == "c":
+            j = 1 if nyd[i] == next_nyd[i-1] else -1
+            cal_type[i+j] = "B"
+            next_nyd[i+j] = (next_nyd[i+j] + 1) % 7
+
+    offset = False
+    langsak = y[2].langsak
+    for i in (1, 2, 3):
+        if next_nyd[i-1] != nyd[i] and next_nyd[i] != nyd[i+1]:
+            if i == 2:
+                offset = True
+                langsak += 1
+            nyd[i] = (nyd[i] + 6) % 7
+            next_nyd[i] = (next_nyd[i] + 6) % 7
+
+    # housekeeping - label a remaining c-type year as C-type
+    if cal_type[2] == "c":
+        cal_type[2] = "C"
+
+    # Determine month/day of new year
+    first_month = "C"  # as per Eade, C=>Caitra, V=>Vaisakha
+    first_day = langsak
+    offset_days = langsak  # no.days offset from Caitra 1st
+    if offset_days < (6 + int(offset)):
+        first_month = "V"
+        first_day = offset_days
+        offset_days += 29
+
+    ly = y[2]
+    return CsYear(
+        ly.year, ly.horakhun, ly.kammacapon, ly.uccapon, ly.avoman,
+        ly.masaken, ly.tithi, ly.weekday, langsak, nyd[2], next_nyd[2],
+        ly.leapday, offset, cal_type[2], CAL_TYPE_DAY_COUNTS[cal_type[2]],
+        first_month, first_day, offset_days,
+    )
+
+
+def iter_years(start: int, stop: int):
+    """
+    Generate the CsYear records for the CS years start ... stop-1. The five
+    year window used by calculate_year0() slides forward one year at a time,
+    so each step calculates only one new LSYear.
+    """
+    window = deque((LSYear(y) for y in range(start - 2, start + 3)), maxlen=5)
+    for year in range(start, stop):
+        if year != start:
+            window.append(LSYear(year + 2))
+        yield _year0(window)
+
+
+def _calculate_year0(year: int):
+    y = [
+        LSYear(year - 2),
+        LSYear(year - 1),
+        LSYear(year),
+        LSYear(year + 1),
+        LSYear(year + 2),
+    ]
+    return _year0(y)
+
+
+calculate_year0 = lru_cache(maxsize=YEAR_CACHE_SIZE)(_calculate_year0)
+calculate_year0.__doc__ = """
+Return the finished CsYear record for a CS year. Records are held in a
+bounded LRU cache; see set_year_cache_size(), year_cache_info() and
+year_cache_clear().
+"""
+
+
+# Functions called with the cache's statistics just before the cache is
+# emptied or replaced (see pythaidate.tracing).
+_cache_clear_hooks = []
+
+
+def _cache_cleared():
+    info = calculate_year0.cache_info()
+    for hook in _cache_clear_hooks:
+        hook(info)
+
+
+def set_year_cache_size(maxsize):
+    """
+    Set the maximum number of year records held in the cache (None for
+    unbounded). The cache is emptied.
+    """
+    global calculate_year0
+    _cache_cleared()
+    doc = calculate_year0.__doc__
+    calculate_year0 = lru_cache(maxsize=maxsize)(_calculate_year0)
+    calculate_year0.__doc__ = doc
+
+
+def year_cache_info():
+    """Return hit/miss statistics for the year cache."""
+    return calculate_year0.cache_info()
+
+
+def year_cache_clear():
+    """Empty the year cache and reset its statistics."""
+    _cache_cleared()
+    calculate_year0.cache_clear()
@@ -1,12 +1,11 @@
 from datetime import date, timedelta
-import logging
 
 from io import StringIO
-import math
+from itertools import islice
 from pprint import pprint
 import sys
 
-from . import julianday
+from . import formatting, julianday
 from .constants import PAK_JULIAN_DAY_OFFSET, PAK_DAYS_IN_CYCLE
 from .helpers import thai_string_width, digit_arabic_to_thai
 
@@ -33,6 +32,174 @@ layout = [
 ]
 
 
+# Days in each position of rows a to e (ปักขคณนา, สัมพยุหะ, พยุหะ, สมุหะ,
+# วรรค). The last position of a row takes any days left over.
+_ROW_DAYS = (16168, 1447, 251, 59, 15)
+
+# Number of positions in each row (a to f), by the mahachula flag of the
+# position in the row above it. Row a always has 18 positions.
+_ROW_LENGTHS = (
+    (18, 18),
+    *((len(layout[row][1]), len(layout[row][0])) for row in range(1, 5)),
+    (14, 15),
+)
+
+# Mahachula flags of the positions of rows a to e, by the flag of the
+# position in the row above (row a by 0).
+_ROW_FLAGS = (
+    (tuple(layout[0][0]), tuple(layout[0][0])),
+    *((tuple(layout[row][1]), tuple(layout[row][0])) for row in range(1, 5)),
+)
+
+# Largest move, in days, made by stepping the counters rather than
+# converting from scratch: at most one carry out of the day row.
+ODOMETER_DAYS = 15
+
+
+def _counters(days):
+    """
+    Return the row counters and board positions for a day of the cycle
+    (1 to PAK_DAYS_IN_CYCLE).
+    """
+    data = []
+    pos = []
+    flag = 0
+    rem = days - 1
+    for row, divisor in enumerate(_ROW_DAYS):
+        positions = _ROW_FLAGS[row][flag]
+        q, rem = divmod(rem, divisor)
+        if q >= len(positions):
+            # the last position of the row takes the remaining days
+            rem += (q - len(positions) + 1) * divisor
+            q = len(positions) - 1
+        data.append(q + 1)
+        pos.append((1 - flag if row else 0, q))
+        flag = positions[q]
+
+    # วัน (ค่ำ)
+    data.append(rem + 1)
+    pos.append((flag, rem))
+    return data, pos
+
+
+def _flags(data):
+    """
+    Return the mahachula flags (1 for มหา, 0 for จุล) of the row positions a
+    to e of the counters data.
+    """
+    a, b, c, d, e = _ROW_FLAGS
+    fa = a[0][data[0]-1]
+    fb = b[fa][data[1]-1]
+    fc = c[fb][data[2]-1]
+    fd = d[fc][data[3]-1]
+    return [fa, fb, fc, fd, e[fd][data[4]-1]]
+
+
+def _positions(data, flags):
+    """
+    Return the board positions of the counters data, as returned by
+    _counters().
+    """
+    fa, fb, fc, fd, fe = flags
+    return [(0, data[0]-1), (1-fa, data[1]-1), (1-fb, data[2]-1),
+            (1-fc, data[3]-1), (1-fd, data[4]-1), (fe, data[5]-1)]
+
+
+def _increment(data, flags, row):
+    """
+    Move row (0 to 5) of the counters data on by one, carrying into the
+    rows above like an odometer. data and flags are updated in place.
+    Returns 1 if the carry passes row a into the next cycle, otherwise 0.
+    """
+    while row >= 0:
+        if data[row] < _ROW_LENGTHS[row][flags[row-1] if row else 0]:
+            data[row] += 1
+            break
+        data[row] = 1
+        row -= 1
+    if row < 5:
+        flags[:] = _flags(data)
+    return 1 if row < 0 else 0
+
+
+def _decrement(data, flags, row):
+    """
+    Move row (0 to 5) of the counters data back by one, borrowing from the
+    rows above. data and flags are updated in place. Returns -1 if the
+    borrow passes row a into the previous cycle, otherwise 0.
+    """
+    top = row
+    while top >= 0 and data[top] == 1:
+        top -= 1
+    if top >= 0:
+        data[top] -= 1
+    # the rows below the one moved back go to their last positions
+    for r in range(top + 1, row + 1):
+        data[r] = _ROW_LENGTHS[r][_flags(data)[r-1] if r else 0]
+    flags[:] = _flags(data)
+    return -1 if top < 0 else 0
+
+
+def _advance(cycle, data, n):
+    """
+    Return (cycle, data, flags) n days on from cycle and the counters data
+    (back for negative n), carrying and borrowing between the rows like an
+    odometer.
+    """
+    data = data[:]
+    flags = _flags(data)
+    day = data[5] + n
+    while day > _ROW_LENGTHS[5][flags[4]]:
+        day -= _ROW_LENGTHS[5][flags[4]]
+        data[5] = 1
+        cycle += _increment(data, flags, 4)
+    while day < 1:
+        cycle += _decrement(data, flags, 4)
+        day += _ROW_LENGTHS[5][flags[4]]
+    data[5] = day
+    return cycle, data, flags
+
+
+def _jd_counters(jd):
+    """
+    Return (cycle, data) for the Julian Day Number jd.
+    """
+    horakhun = jd - PAK_JULIAN_DAY_OFFSET
+    if horakhun <= 0:
+        raise ValueError("Invalid Pakkhakhananaa range.")
+    cycle, days = divmod(horakhun - 1, PAK_DAYS_IN_CYCLE)
+    return cycle + 1, _counters(days + 1)[0]
+
+
+def _iter_counters(jd, step: int = 1):
+    """
+    Yield (jd, cycle, data, flags) for every step days from the Julian Day
+    Number jd on, stopping at the start of the Pakkhakhananaa era. Each day
+    is found from the one before like an odometer: the day counter is moved
+    on and carries into the rows above it when it passes the end of its row.
+    Steps of more than ODOMETER_DAYS are converted directly.
+    """
+    cycle, data = _jd_counters(jd)
+    flags = _flags(data)
+    if step == 1:
+        while True:
+            yield jd, cycle, data, flags
+            jd += 1
+            data = data[:]
+            flags = flags[:]
+            cycle += _increment(data, flags, 5)
+    while True:
+        yield jd, cycle, data, flags
+        jd += step
+        if jd <= PAK_JULIAN_DAY_OFFSET:
+            return
+        if abs(step) <= ODOMETER_DAYS:
+            cycle, data, flags = _advance(cycle, data, step)
+        else:
+            cycle, data = _jd_counters(jd)
+            flags = _flags(data)
+
+
 class PakDate:
 
     def __init__(self, jd=None, pakcode=None, date=None):
@@ -65,6 +232,51 @@ class PakDate:
         """Class method for Julian Day Number conversion."""
         return cls(jd=jd)
 
+    @classmethod
+    def range(cls, start, stop, step: int = 1):
+        """
+        Return a lazy sequence of dates from start up to, but not including,
+        stop. Bounds may be Pak objects (or other objects with a julianday
+        property), datetime.date objects or Julian Day Numbers. Like the
+        builtin range(), it supports len(), reversed(), indexing and negative
+        steps. Iterating steps each date on from the one before.
+        """
+        return julianday.DateRange(cls, start, stop, step)
+
+    @classmethod
+    def _checkrange(cls, jds):
+        if min(jds[0], jds[-1]) <= PAK_JULIAN_DAY_OFFSET:
+            raise ValueError("Invalid Pakkhakhananaa range.")
+
+    @classmethod
+    def _walk(cls, jds):
+        """Yield the dates of a range of Julian Day Numbers."""
+        if not jds:
+            return
+        fromcounters = cls._fromcounters
+        for counters in islice(_iter_counters(jds[0], jds.step), len(jds)):
+            yield fromcounters(*counters)
+
+    @classmethod
+    def _fromcounters(cls, jd, cycle, data, flags):
+        """
+        Return a Pak object directly from its Julian Day Number, cycle,
+        counters and row flags (see _iter_counters()).
+        """
+        return cls._fromstate(jd, cycle, data, _positions(data, flags))
+
+    @classmethod
+    def _fromstate(cls, jd, cycle, data, pos):
+        self = cls.__new__(cls)
+        self.__julianday = jd
+        self.__horakhun = jd - PAK_JULIAN_DAY_OFFSET
+        self.__pakkhagen = None
+        self.__cycle = cycle
+        self.__data = data
+        self.__pos = pos
+        self.__pakabbr = None
+        return self
+
     # @classmethod
     # def frompakcode(cls, pakcode):
     #     """Return Pak object from format string (x-a:b:c:d:e:f)."""
@@ -72,59 +284,14 @@ class PakDate:
 
     def __convert_julianday(self, jd):
         """Convert from Julian Day Number."""
-        def div(a, b):
-            c = 0
-            while True:
-                if b >= a:
-                    return c + 1, a
-                a -= b
-                c += 1
-
-        def _adjust(row, prefix, col):
-            logging.debug("_adjust_1(%s, %s, %s)", row, 1-prefix, col-1)
-            if col > len(layout[row][1-prefix]):
-                rtn = None
-            else:
-                rtn = layout[row][1-prefix][col-1]
-            logging.debug("_adjust_1(%s, %s, %s) -> %s", row, 1-prefix, col-1, rtn)
-            return rtn
-
         self.__julianday = jd
         self.__horakhun = jd - PAK_JULIAN_DAY_OFFSET
         if self.__horakhun <= 0:
             raise ValueError("Invalid Pakkhakhananaa range.")
 
-        days = self.__horakhun % PAK_DAYS_IN_CYCLE
-        if days == 0:
-            days = PAK_DAYS_IN_CYCLE
-        self.__cycle = math.ceil(self.__horakhun / PAK_DAYS_IN_CYCLE)
-
-        # ปักขคณนา row
-        self.__data[0], rem = div(days, 16168)
-        self.__pos[0] = (0, self.__data[0]-1)
-        mahachula = layout[0][0][self.__data[0]-1]
-        logging.debug("0 data:%s, mc:%s", self.__data, self.__pos)
-
-        # สัมพยุหะ, พยุหะ, สมุหะ, วรรค rows
-        for row, divisor in ((1, 1447), (2, 251), (3, 59), (4, 15)):
-            self.__data[row], rem = div(rem, divisor)
-            mahachula1 = _adjust(row, mahachula, self.__data[row])
-            # logging.debug("L: row:%s div:%s -> d[r]:%s rem:%s | mc:%s mc1:%s", row, divisor, self.__data[row], rem, mc, mc1)
-            if mahachula1 is None:
-                # the row position is too large - decrement it by one and add
-                # the divisor back on to rem for the next iteration. Do the
-                # adjustment again and it should be correct.
-                self.__data[row] -= 1
-                rem += divisor
-                mahachula1 = _adjust(row, mahachula, self.__data[row])
-            self.__pos[row] = (1-mahachula, self.__data[row]-1)  # display_pattern[row][self.__mahachula[row]][mc-1]
-            # logging.debug("L: %s data:%s, mc:%s", row, self.__data, self.__pos)
-            mahachula = mahachula1
-
-        # วัน (ค่ำ)
-        self.__data[5] = rem
-        self.__pos[5] = (mahachula, self.__data[5]-1)  # display_pattern[row][self.__mahachula[4]][mc-1]
-        logging.debug("F: %s %s %s", self.__cycle, self.__data, self.__pos)
+        cycle, days = divmod(self.__horakhun - 1, PAK_DAYS_IN_CYCLE)
+        self.__cycle = cycle + 1
+        self.__data, self.__pos = _counters(days + 1)
 
     def __convert_pakcode(self, s):
         """Convert a Pak string (x-a:b:c:d:e:f) to a state object."""
@@ -179,6 +346,13 @@ class PakDate:
     def pakcode(self):
         return "{:d}-{:d}:{:d}:{:d}:{:d}:{:d}:{:d}".format(self.__cycle, *self.__data)
 
+    @property
+    def pakdata(self):
+        """
+        The cycle and the six counters of the pakcode as a tuple of ints.
+        """
+        return (self.__cycle, *self.__data)
+
     @property
     def pakabbr(self):
         """
@@ -223,18 +397,15 @@ class PakDate:
         f_days = 15 if self.__pos[5][0] else 14
         d = self.__data[5]
         val = d / f_days
-        logging.debug("f_days:%d d:%d val:%d t1:%s t2:%s t3:%s",
-                      f_days, d, val,
-                      val == 4/7, val == 8/15, val == 1)
         return val == 4/7 or val == 8/15 or val == 1
 
     issabbath = iswanphra
 
     def weekday(self):
-        return self.__horakhun % 7 - 1
+        return self.__julianday % 7
 
     def isoweekday(self):
-        return self.__horakhun % 7
+        return self.__julianday % 7 + 1
 
     def debug(self):
         return {
@@ -313,59 +484,112 @@ class PakDate:
                    "(" + ("ปักข์ขาด" if next_row else "ปักข์ถ้วน") + ")"]
         return digit_arabic_to_thai(" ".join(output))
 
+    def csstrftime(self, fmt: str) -> str:
+        """
+        Return the date formatted according to fmt. See pythaidate.formatting
+        for the format directives.
+        """
+        return formatting.strftime(self, fmt, formatting.PAK)
+
+    @classmethod
+    def csstrptime(cls, s: str, fmt: str):
+        """
+        Return a Pak object parsed from s according to fmt. See
+        pythaidate.formatting for the format directives.
+        """
+        return formatting.strptime(s, fmt, formatting.PAK)
+
+    def __format__(self, fmt):
+        if not fmt:
+            return str(self)
+        return self.csstrftime(fmt)
+
+    def __hash__(self):
+        return julianday._date_hash(self.__julianday)
+
+    def __reduce__(self):
+        return (self.__class__.fromjulianday, (self.__julianday,))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
     def __lt__(self, other):
         if hasattr(other, "julianday"):
             return self.julianday < other.julianday
         elif isinstance(other, date):
-            return self.julianday < julianday.to_julianday(other.year, other.month, other.day)
+            return self.julianday < julianday.date_to_julianday(other)
         return NotImplemented
 
     def __le__(self, other):
         if hasattr(other, "julianday"):
             return self.julianday <= other.julianday
         elif isinstance(other, date):
-            return self.julianday <= julianday.to_julianday(other.year, other.month, other.day)
+            return self.julianday <= julianday.date_to_julianday(other)
         return NotImplemented
 
     def __eq__(self, other):
         if hasattr(other, "julianday"):
             return self.julianday == other.julianday
         elif isinstance(other, date):
-            return self.julianday == julianday.to_julianday(other.year, other.month, other.day)
+            return self.julianday == julianday.date_to_julianday(other)
         return NotImplemented
 
     def __ge__(self, other):
         if hasattr(other, "julianday"):
             return self.julianday >= other.julianday
         elif isinstance(other, date):
-            return self.julianday >= julianday.to_julianday(other.year, other.month, other.day)
+            return self.julianday >= julianday.date_to_julianday(other)
         return NotImplemented
 
     def __gt__(self, other):
         if hasattr(other, "julianday"):
             return self.julianday > other.julianday
         elif isinstance(other, date):
-            return self.julianday > julianday.to_julianday(other.year, other.month, other.day)
+            return self.julianday > julianday.date_to_julianday(other)
         return NotImplemented
 
+    def _adddays(self, n: int):
+        """
+        Return the date n days from this one. Up to ODOMETER_DAYS days are
+        counted on (or back) from this date's counters, carrying between the
+        rows like an odometer; larger jumps are converted directly.
+        """
+        if abs(n) > ODOMETER_DAYS:
+            return self.fromjulianday(self.__julianday + n)
+        flag, col = self.__pos[5]
+        if 0 <= col + n < 14 + flag:
+            # same ปักข์: only the day counter moves
+            data = self.__data[:]
+            data[5] += n
+            pos = self.__pos[:]
+            pos[5] = (flag, col + n)
+            return self._fromstate(self.__julianday + n, self.__cycle, data, pos)
+        cycle, data, flags = _advance(self.__cycle, self.__data, n)
+        if cycle < 1:
+            raise ValueError("Invalid Pakkhakhananaa range.")
+        return self._fromcounters(self.__julianday + n, cycle, data, flags)
+
     def __add__(self, other):
         if isinstance(other, timedelta):
-            return PakDate.fromjulianday(self.julianday + other.days)
+            return self._adddays(other.days)
         return NotImplemented
 
     __radd__ = __add__
 
     def __sub__(self, other):
         if isinstance(other, timedelta):
-            return self + timedelta(-other.days)
+            return self._adddays(-other.days)
         elif hasattr(other, "julianday"):
             return timedelta(days=self.julianday - other.julianday)
         elif isinstance(other, date):
-            other_jd = julianday.to_julianday(other.year, other.month, other.day)
+            other_jd = julianday.date_to_julianday(other)
             return timedelta(days=self.julianday - other_jd)
         return NotImplemented
 
     def debug_reset(self):  # pragma: no cover
         self.__horakhun = None
         self.__julianday = None
-        self.__pakkhagen = None
\ No newline at end of file
+        self.__pakkhagen = None
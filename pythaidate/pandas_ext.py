@@ -0,0 +1,312 @@
+"""
+pandas integration for Thai calendar dates.
+
+CsDateArray is a pandas ExtensionArray of CsDate values, stored as an int64
+buffer of Julian Day Numbers, with dtype "csdate". Sorting, comparison,
+factorizing and groupby work directly on the Julian Day Numbers.
+
+Importing this module also registers a Series.thaidate accessor that
+computes calendar fields for a whole column at once. It works on csdate,
+datetime64 and integer (Julian Day Number) Series.
+
+pandas is an optional dependency: pip install pythaidate[pandas]
+"""
+
+import datetime
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import (
+    ExtensionArray,
+    ExtensionDtype,
+    register_extension_dtype,
+    register_series_accessor,
+)
+
+from . import julianday, vector
+from .constants import CS_UNIX_EPOCH_OFFSET
+from .csdate import CsDate
+
+__all__ = (
+    "CsDtype",
+    "CsDateArray",
+    "ThaiDateAccessor",
+)
+
+# Julian Day Number used for missing values
+_NA_JD = np.iinfo(np.int64).min
+
+
+def _to_julianday(obj):
+    """Return the Julian Day Number of a scalar, or _NA_JD if missing."""
+    if obj is None or obj is pd.NA or obj is pd.NaT:
+        return _NA_JD
+    if isinstance(obj, (int, np.integer)):
+        return int(obj)
+    if isinstance(obj, float) and np.isnan(obj):
+        return _NA_JD
+    if hasattr(obj, "julianday"):
+        return obj.julianday
+    if isinstance(obj, datetime.date):
+        return julianday.date_to_julianday(obj)
+    raise TypeError("Cannot convert {!r} to a CsDate.".format(obj))
+
+
+@register_extension_dtype
+class CsDtype(ExtensionDtype):
+    """pandas dtype for CsDate values."""
+
+    name = "csdate"
+    type = CsDate
+    kind = "O"
+    na_value = pd.NA
+    _is_numeric = False
+
+    @classmethod
+    def construct_array_type(cls):
+        return CsDateArray
+
+    def __repr__(self):
+        return "CsDtype()"
+
+
+class CsDateArray(ExtensionArray):
+    """
+    An ExtensionArray of CsDate values backed by an int64 array of Julian
+    Day Numbers.
+    """
+
+    def __init__(self, values, copy: bool = False):
+        values = np.asarray(values, dtype=np.int64)
+        if copy:
+            values = values.copy()
+        if values.ndim != 1:
+            raise ValueError("CsDateArray must be one-dimensional.")
+        self._data = values
+
+    # constructors
+
+    @classmethod
+    def from_julianday(cls, jd):
+        """Return an array from Julian Day Numbers."""
+        return cls(np.asarray(jd, dtype=np.int64), copy=True)
+
+    @classmethod
+    def from_datetime(cls, values):
+        """
+        Return an array from datetime64 values (times of day are dropped).
+        Timezone-aware values are taken at their local date.
+        """
+        values = pd.DatetimeIndex(values)
+        if values.tz is not None:
+            values = values.tz_localize(None)
+        jd = values.as_unit("s").asi8 // 86400 + CS_UNIX_EPOCH_OFFSET
+        jd[values.isna()] = _NA_JD
+        return cls(jd)
+
+    @classmethod
+    def _from_sequence(cls, scalars, *, dtype=None, copy=False):
+        if isinstance(scalars, cls):
+            return scalars.copy() if copy else scalars
+        return cls([_to_julianday(s) for s in scalars])
+
+    @classmethod
+    def _from_factorized(cls, values, original):
+        return cls(values)
+
+    # ExtensionArray interface
+
+    @property
+    def dtype(self):
+        return CsDtype()
+
+    @property
+    def julianday(self):
+        """The Julian Day Numbers as an int64 array (read-only view)."""
+        view = self._data.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def nbytes(self):
+        return self._data.nbytes
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, np.integer)):
+            jd = self._data[item]
+            return pd.NA if jd == _NA_JD else CsDate.fromjulianday(int(jd))
+        item = pd.api.indexers.check_array_indexer(self, item)
+        return type(self)(self._data[item])
+
+    def __setitem__(self, key, value):
+        if pd.api.types.is_list_like(value) and not isinstance(value, CsDate):
+            value = [_to_julianday(v) for v in value]
+        else:
+            value = _to_julianday(value)
+        key = pd.api.indexers.check_array_indexer(self, key)
+        self._data[key] = value
+
+    def __iter__(self):
+        for jd in self._data.tolist():
+            yield pd.NA if jd == _NA_JD else CsDate.fromjulianday(jd)
+
+    def isna(self):
+        return self._data == _NA_JD
+
+    def copy(self):
+        return type(self)(self._data.copy())
+
+    def take(self, indices, allow_fill=False, fill_value=None):
+        fill = _NA_JD if fill_value is None else _to_julianday(fill_value)
+        data = pd.api.extensions.take(self._data, indices, allow_fill=allow_fill, fill_value=fill)
+        return type(self)(data)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        return cls(np.concatenate([a._data for a in to_concat]))
+
+    def _values_for_factorize(self):
+        return self._data, _NA_JD
+
+    def _values_for_argsort(self):
+        return self._data
+
+    def _reduce(self, name, *, skipna=True, keepdims=False, **kwargs):
+        if name not in ("min", "max"):
+            return super()._reduce(name, skipna=skipna, keepdims=keepdims, **kwargs)
+        na = self.isna()
+        data = self._data[~na]
+        if (na.any() and not skipna) or not len(data):
+            result = pd.NA
+        else:
+            result = CsDate.fromjulianday(int(getattr(data, name)()))
+        if keepdims:
+            return type(self)._from_sequence([result])
+        return result
+
+    def _formatter(self, boxed=False):
+        def fmt(value):
+            return "<NA>" if value is pd.NA else value.csformatymd()
+        return fmt
+
+    # comparisons are made on the Julian Day Numbers
+
+    def _cmp(self, other, op):
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        if isinstance(other, CsDateArray):
+            other = other._data
+            na = self.isna() | (other == _NA_JD)
+        elif pd.api.types.is_list_like(other):
+            other = np.array([_to_julianday(o) for o in other], dtype=np.int64)
+            na = self.isna() | (other == _NA_JD)
+        else:
+            try:
+                other = _to_julianday(other)
+            except TypeError:
+                return NotImplemented
+            na = self.isna() | (other == _NA_JD)
+        result = op(self._data, other)
+        result[na] = op is np.not_equal
+        return result
+
+    def __eq__(self, other):
+        return self._cmp(other, np.equal)
+
+    def __ne__(self, other):
+        return self._cmp(other, np.not_equal)
+
+    def __lt__(self, other):
+        return self._cmp(other, np.less)
+
+    def __le__(self, other):
+        return self._cmp(other, np.less_equal)
+
+    def __gt__(self, other):
+        return self._cmp(other, np.greater)
+
+    def __ge__(self, other):
+        return self._cmp(other, np.greater_equal)
+
+
+@register_series_accessor("thaidate")
+class ThaiDateAccessor:
+    """
+    Thai calendar fields of a Series, computed for the whole column at once.
+    Missing values give <NA> in the results.
+    """
+
+    def __init__(self, series):
+        if isinstance(series.dtype, CsDtype):
+            jd = series.array._data
+        elif pd.api.types.is_datetime64_any_dtype(series.dtype):
+            jd = CsDateArray.from_datetime(series)._data
+        elif pd.api.types.is_integer_dtype(series.dtype):
+            jd = series.to_numpy(dtype=np.int64, na_value=_NA_JD)
+        else:
+            raise AttributeError("Can only use .thaidate accessor with csdate, datetime64 or integer values.")
+        self._series = series
+        self._jd = jd
+        self._na = jd == _NA_JD
+        self._cs = None
+        self._pak = None
+
+    def _fields(self):
+        if self._cs is None:
+            self._cs = vector.from_julianday(np.where(self._na, CS_UNIX_EPOCH_OFFSET, self._jd))
+        return self._cs
+
+    def _pakfields(self):
+        if self._pak is None:
+            self._pak = vector.pak_from_julianday(np.where(self._na, CS_UNIX_EPOCH_OFFSET, self._jd))
+        return self._pak
+
+    def _result(self, values, dtype):
+        out = pd.array(values, dtype=dtype)
+        if self._na.any():
+            out[self._na] = pd.NA
+        return pd.Series(out, index=self._series.index, name=self._series.name)
+
+    @property
+    def csdate(self):
+        """The values as a csdate Series."""
+        return pd.Series(CsDateArray(self._jd, copy=True), index=self._series.index, name=self._series.name)
+
+    @property
+    def julianday(self):
+        return self._result(self._jd, "Int64")
+
+    @property
+    def cs_year(self):
+        return self._result(self._fields().year, "Int64")
+
+    @property
+    def cs_month(self):
+        """Sukothai month number, 88 for the intercalary month."""
+        return self._result(self._fields().month, "Int64")
+
+    @property
+    def cs_day(self):
+        return self._result(self._fields().day, "Int64")
+
+    @property
+    def tithi(self):
+        return self._result(self._fields().tithi, "Int64")
+
+    @property
+    def is_waxing(self):
+        return self._result(self._fields().day <= 15, "boolean")
+
+    @property
+    def pakcode(self):
+        p = self._pakfields()
+        fields = (p.cycle, p.a, p.b, p.c, p.d, p.e, p.f)
+        codes = ["%d-%d:%d:%d:%d:%d:%d" % f for f in zip(*(a.tolist() for a in fields))]
+        return self._result(codes, "string")
+
+    @property
+    def is_wanphra(self):
+        return self._result(self._pakfields().iswanphra, "boolean")
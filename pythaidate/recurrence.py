@@ -0,0 +1,262 @@
+"""
+Recurrence rules for Thai lunar dates, in the manner of dateutil.rrule.
+
+A LunarRule selects days of the lunar months of each year by month, day of
+the month (or day of the waxing/waning phase) and weekday. Occurrences are
+taken straight from each year's month table (see csdate.lunar_months()), so
+finding the next occurrence never scans through days.
+"""
+
+from itertools import chain
+
+from .cscalendar import WAXING, WANING
+from .csdate import (
+    CsDate,
+    LEAP_FIRST,
+    LEAP_SECOND,
+    LEAP_BOTH,
+    lunar_months,
+    _lunar_year,
+    _lunation,
+    _month_lunation,
+)
+from .julianday import _to_julianday
+
+__all__ = (
+    "LunarRule",
+    "YEARLY",
+    "MONTHLY",
+    "LEAP_FIRST",
+    "LEAP_SECOND",
+    "LEAP_BOTH",
+    "WAXING",
+    "WANING",
+)
+
+# frequencies
+YEARLY = "yearly"
+MONTHLY = "monthly"
+
+MONTHS = (1, 2, 3, 4, 5, 6, 7, 8, 88, 9, 10, 11, 12)
+
+# Give up looking for the next occurrence of a rule that can't match
+# (month 5 day 30, say) after this many years without one.
+MAX_EMPTY_YEARS = 1000
+
+
+def _ints(value, name):
+    if value is None:
+        return None
+    if isinstance(value, int):
+        value = (value,)
+    value = tuple(value)
+    if not value or not all(isinstance(v, int) for v in value):
+        raise TypeError("{} must be an int or a sequence of ints.".format(name))
+    return value
+
+
+class LunarRule:
+    """
+    A recurrence rule for lunar dates.
+
+    freq is YEARLY or MONTHLY; with an interval of n, the rule applies to
+    every nth CS year or every nth lunar month counted from dtstart.
+
+    month is a month number (88 for the intercalary month) or a sequence of
+    them, and defaults to every month. leap decides which month 8 a rule for
+    month 8 applies to in years with an intercalary month (LEAP_FIRST,
+    LEAP_SECOND or LEAP_BOTH); a rule for month 88 only applies to those
+    years.
+
+    day is a day of the month (1-30, or negative to count from the end of
+    the month, -1 being the last day) or a sequence of them. With phase
+    WAXING or WANING, days are numbered within that half of the month
+    (1-15, or negative to count from its end). Days a month doesn't have are
+    skipped. With phase and no day, every day of the phase is selected.
+
+    weekday limits the rule to weekdays numbered as by
+    datetime.date.weekday() (0 is Monday).
+
+    dtstart is the first date of the rule; iterating over a rule yields its
+    occurrences from dtstart on, indefinitely.
+    """
+
+    def __init__(self, freq: str = MONTHLY, month=None, day=None, phase=None,
+                 leap: str = LEAP_FIRST, weekday=None, interval: int = 1, dtstart=None):
+        if freq not in (YEARLY, MONTHLY):
+            raise ValueError("Unknown frequency {!r}.".format(freq))
+        if phase not in (None, WAXING, WANING):
+            raise ValueError("Unknown phase {!r}.".format(phase))
+        if leap not in (LEAP_FIRST, LEAP_SECOND, LEAP_BOTH):
+            raise ValueError("Unknown leap month policy {!r}.".format(leap))
+        if interval < 1:
+            raise ValueError("interval must be at least 1.")
+        if interval > 1 and dtstart is None:
+            raise ValueError("An interval needs a dtstart to count from.")
+
+        month = _ints(month, "month")
+        if month is not None:
+            for m in month:
+                if m not in MONTHS:
+                    raise ValueError("Invalid month {}.".format(m))
+        day = _ints(day, "day")
+        limit = 30 if phase is None else 15
+        if day is not None:
+            for d in day:
+                if not 0 < abs(d) <= limit:
+                    raise ValueError("Invalid day {}.".format(d))
+        weekday = _ints(weekday, "weekday")
+        if weekday is not None:
+            for w in weekday:
+                if not 0 <= w <= 6:
+                    raise ValueError("Invalid weekday {}.".format(w))
+
+        self.freq = freq
+        self.month = month
+        self.day = day
+        self.phase = phase
+        self.leap = leap
+        self.weekday = weekday
+        self.interval = interval
+        self.dtstart = None if dtstart is None else CsDate.fromjulianday(_to_julianday(dtstart))
+
+        # offsets from the first day of the month, for 29 and 30 day months
+        self._offsets = {n: self._month_offsets(n) for n in (29, 30)}
+        if self.dtstart is not None:
+            year = _lunar_year(self.dtstart.julianday)
+            self._start_year = year
+            self._start_lunation = _lunation(self.dtstart.julianday)
+
+    def _month_offsets(self, days):
+        if self.phase is None:
+            first, length = 1, days
+        elif self.phase == WAXING:
+            first, length = 1, 15
+        else:
+            first, length = 16, days - 15
+        if self.day is None:
+            chosen = range(length)
+        else:
+            chosen = (d - 1 if d > 0 else length + d for d in self.day)
+        return tuple(sorted({first - 1 + d for d in chosen if 0 <= d < length}))
+
+    def _matches_month(self, month, leap_year):
+        if self.month is None:
+            return True
+        if month == 8 and leap_year:
+            return 8 in self.month and self.leap != LEAP_SECOND
+        if month == 88:
+            return 88 in self.month or (8 in self.month and self.leap != LEAP_FIRST)
+        return month in self.month
+
+    def _year(self, year):
+        """Return the sorted Julian Day Numbers of the occurrences in CS year year."""
+        if self.freq == YEARLY and self.interval > 1 and (year - self._start_year) % self.interval:
+            return []
+        months = lunar_months(year)
+        leap_year = len(months) == 13
+        result = []
+        for m in months:
+            if not self._matches_month(m.month, leap_year):
+                continue
+            if self.freq == MONTHLY and self.interval > 1 and \
+                    (_month_lunation(m.julianday) - self._start_lunation) % self.interval:
+                continue
+            for offset in self._offsets[m.days]:
+                jd = m.julianday + offset
+                if self.weekday is None or jd % 7 in self.weekday:
+                    result.append(jd)
+        return result
+
+    def _iter(self, jd, reverse=False):
+        """
+        Yield the Julian Day Numbers of occurrences on or after jd (on or
+        before jd if reverse is true), in order.
+        """
+        first = None if self.dtstart is None else self.dtstart.julianday
+        if first is not None and not reverse:
+            jd = max(jd, first)
+        year = _lunar_year(jd)
+        step = -1 if reverse else 1
+        empty = 0
+        while empty < MAX_EMPTY_YEARS and year > 0:
+            jds = self._year(year)
+            if reverse:
+                jds = reversed(jds)
+            found = False
+            for occurrence in jds:
+                if (occurrence > jd) if reverse else (occurrence < jd):
+                    continue
+                if reverse and first is not None and occurrence < first:
+                    return
+                found = True
+                yield occurrence
+            empty = 0 if found else empty + 1
+            if reverse and first is not None and year <= self._start_year:
+                return
+            year += step
+
+    def _result(self, jds, julianday):
+        if julianday:
+            return jds
+        return (CsDate.fromjulianday(jd) for jd in jds)
+
+    def __iter__(self):
+        if self.dtstart is None:
+            raise ValueError("Iterating over a rule needs a dtstart.")
+        return self._result(self._iter(self.dtstart.julianday), False)
+
+    def xafter(self, dt, inc: bool = False, julianday: bool = False):
+        """
+        Return a lazy iterator over the occurrences after dt (or on dt if inc
+        is true).
+        """
+        jd = _to_julianday(dt)
+        return self._result(self._iter(jd if inc else jd + 1), julianday)
+
+    def after(self, dt, inc: bool = False, julianday: bool = False):
+        """
+        Return the first occurrence after dt (or on dt if inc is true), or
+        None.
+        """
+        return next(self.xafter(dt, inc, julianday), None)
+
+    def before(self, dt, inc: bool = False, julianday: bool = False):
+        """
+        Return the last occurrence before dt (or on dt if inc is true), or
+        None.
+        """
+        jd = _to_julianday(dt)
+        return next(self._result(self._iter(jd if inc else jd - 1, reverse=True), julianday), None)
+
+    def between(self, after, before, inc: bool = False, julianday: bool = False):
+        """
+        Return a list of the occurrences between after and before (including
+        them if inc is true). Bounds may be CsDate (or other objects with a
+        julianday property), datetime.date objects or Julian Day Numbers.
+        With julianday true, Julian Day Numbers are returned instead of
+        CsDate objects.
+        """
+        start = _to_julianday(after) + (0 if inc else 1)
+        stop = _to_julianday(before) + (1 if inc else 0)
+        if self.dtstart is not None:
+            start = max(start, self.dtstart.julianday)
+        if start >= stop:
+            return []
+        jds = chain.from_iterable(
+            self._year(year) for year in range(_lunar_year(start), _lunar_year(stop - 1) + 1))
+        return list(self._result([jd for jd in jds if start <= jd < stop], julianday))
+
+    def __repr__(self):
+        args = ["{!r}".format(self.freq)]
+        for name in ("month", "day", "phase", "weekday", "dtstart"):
+            value = getattr(self, name)
+            if value is not None:
+                if isinstance(value, tuple) and len(value) == 1:
+                    value = value[0]
+                args.append("{}={!r}".format(name, value))
+        if self.leap != LEAP_FIRST:
+            args.append("leap={!r}".format(self.leap))
+        if self.interval != 1:
+            args.append("interval={}".format(self.interval))
+        return "LunarRule({})".format(", ".join(args))
@@ -0,0 +1,166 @@
+"""
+Optional instrumentation of the conversion hot paths.
+
+Instrumentation is off by default and then costs nothing: enable() wraps the
+conversion entry points, year calculations and LSYear construction with
+counting (and optionally timing) versions, and disable() puts the originals
+back. Counters are read with stats(), also available as pythaidate.stats().
+"""
+
+from collections import Counter, defaultdict
+from functools import wraps
+from time import perf_counter_ns
+
+from . import lsyear
+from .csdate import CsDate
+from .pakdate import PakDate
+
+__all__ = (
+    "enable",
+    "disable",
+    "is_enabled",
+    "reset",
+    "stats",
+)
+
+# (owner, attribute, counter name)
+ENTRY_POINTS = (
+    (CsDate, "__init__", "CsDate.__init__"),
+    (CsDate, "fromyd", "CsDate.fromyd"),
+    (CsDate, "fromjulianday", "CsDate.fromjulianday"),
+    (CsDate, "__add__", "CsDate.__add__"),
+    (CsDate, "__sub__", "CsDate.__sub__"),
+    (PakDate, "__init__", "PakDate.__init__"),
+)
+YEAR_HOOKS = (
+    (lsyear, "_year0", "year0"),
+    (lsyear.LSYear, "__init__", "LSYear"),
+)
+
+_calls = Counter()
+_cache = Counter()
+_timings = defaultdict(Counter)
+_patched = []
+# year cache (hits, misses) when counting started or the cache was last
+# cleared; None when not counting
+_cache_base = None
+
+
+def _wrap(func, name, timing):
+    if timing:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            _calls[name] += 1
+            start = perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                # histogram bucket: the power of 2 microseconds above the elapsed time
+                us = (perf_counter_ns() - start) // 1000
+                _timings[name][1 << us.bit_length()] += 1
+    else:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            _calls[name] += 1
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def enable(timing: bool = False):
+    """
+    Start counting calls to the conversion entry points, year calculations
+    and LSYear builds. With timing=True, a histogram of call durations is
+    also kept for each.
+    """
+    global _cache_base
+    disable()
+    for owner, attr, name in ENTRY_POINTS + YEAR_HOOKS:
+        original = vars(owner)[attr]
+        if isinstance(original, classmethod):
+            patched = classmethod(_wrap(original.__func__, name, timing))
+        else:
+            patched = _wrap(original, name, timing)
+        setattr(owner, attr, patched)
+        _patched.append((owner, attr, original))
+    _cache_base = _cache_snapshot()
+    lsyear._cache_clear_hooks.append(_cache_cleared)
+
+
+def _cache_snapshot():
+    info = lsyear.year_cache_info()
+    return info.hits, info.misses
+
+
+def _cache_lookups(info):
+    """Return the year cache (hits, misses) counted since _cache_base."""
+    if _cache_base is None:
+        return 0, 0
+    return info.hits - _cache_base[0], info.misses - _cache_base[1]
+
+
+def _cache_cleared(info):
+    # keep the lookups made before the cache's statistics are reset
+    global _cache_base
+    hits, misses = _cache_lookups(info)
+    _cache["hits"] += hits
+    _cache["misses"] += misses
+    _cache_base = (0, 0)
+
+
+def disable():
+    """
+    Stop counting and restore the uninstrumented functions. Counters are
+    kept until reset().
+    """
+    global _cache_base
+    if _cache_cleared in lsyear._cache_clear_hooks:
+        # keep the year cache lookups counted so far
+        _cache_cleared(lsyear.year_cache_info())
+        lsyear._cache_clear_hooks.remove(_cache_cleared)
+    _cache_base = None
+    while _patched:
+        owner, attr, original = _patched.pop()
+        setattr(owner, attr, original)
+
+
+def is_enabled():
+    return bool(_patched)
+
+
+def reset():
+    """Zero all counters."""
+    global _cache_base
+    _calls.clear()
+    _cache.clear()
+    _timings.clear()
+    if _patched:
+        _cache_base = _cache_snapshot()
+
+
+def stats():
+    """
+    Return a snapshot of the counters as a dict:
+
+    * enabled: whether instrumentation is on
+    * calls: calls per conversion entry point
+    * year0: year records calculated (cache misses and iter_years() steps)
+    * lsyear_builds: LSYear objects built
+    * cache_hits, cache_misses: year cache lookups since enable() or reset(),
+      including those before the cache was cleared or resized
+    * year_cache: the year cache's own statistics
+    * timings: per entry point, {bucket: count}, counting calls that took
+      less than bucket microseconds (powers of 2)
+    """
+    info = lsyear.year_cache_info()
+    hits, misses = _cache_lookups(info)
+    calls = {name: _calls[name] for _, _, name in ENTRY_POINTS}
+    return {
+        "enabled": is_enabled(),
+        "calls": calls,
+        "year0": _calls["year0"],
+        "lsyear_builds": _calls["LSYear"],
+        "cache_hits": _cache["hits"] + hits,
+        "cache_misses": _cache["misses"] + misses,
+        "year_cache": info,
+        "timings": {name: dict(sorted(c.items())) for name, c in _timings.items()},
+    }
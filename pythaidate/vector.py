@@ -0,0 +1,437 @@
+"""
+Vectorised Chulasakarat conversions using NumPy.
+
+These functions convert whole arrays of Julian Day Numbers to and from the
+Thai lunisolar calendar without building a CsDate object per element. The
+results are identical to the scalar CsDate calculations.
+
+NumPy is an optional dependency: pip install pythaidate[vector]
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from .constants import (
+    DAYS_IN_800_YEARS,
+    TIME_UNITS_IN_1_DAY,
+    EPOCH_OFFSET,
+    UCCAPON_CONSTANT,
+    APOGEE_ROTATION_DAYS,
+    CS_JULIAN_DAY_OFFSET,
+    PAK_JULIAN_DAY_OFFSET,
+    PAK_DAYS_IN_CYCLE,
+)
+from .lsyear import CsYear
+from .csdate import (
+    CsDate,
+    lunation_months,
+    _lunation,
+    MONTH_CUMULATIVE_DAYS,
+    MONTH_POSITION_AB,
+    MONTH_POSITION_C,
+)
+from .pakdate import layout as _PAK_LAYOUT
+
+__all__ = (
+    "CsFields",
+    "PakFields",
+    "LSYearTable",
+    "from_julianday",
+    "to_julianday",
+    "pak_from_julianday",
+    "lunation",
+)
+
+CsFields = namedtuple("CsFields", [
+    "year",
+    "month",
+    "month_raw",
+    "day",
+    "days",
+    "horakhun",
+    "tithi",
+    "avoman",
+    "masaken",
+    "uccapon",
+    "weekday",
+    "solar_leap_year",
+    "leap_day",
+    "leap_month",
+])
+
+PakFields = namedtuple("PakFields", [
+    "cycle",
+    "a",
+    "b",
+    "c",
+    "d",
+    "e",
+    "f",
+    "horakhun",
+    "pakkhagen",
+    "iswaxing",
+    "iswanphra",
+])
+
+# Year type codes. CAL_c is the transient "leap day and leap month" type that
+# only exists until the neighbouring year adjustments are done.
+CAL_A, CAL_B, CAL_C, CAL_c = 0, 1, 2, 3
+CAL_TYPES = "ABC"
+_NEXT_NYD_STEP = np.array((4, 5, 6, 6), dtype=np.int64)
+_CAL_DAYS = np.array((354, 355, 384), dtype=np.int64)
+
+# Lunar day-of-year (offset_days + days) to month/day lookup tables, one row
+# per year type. Offsets are at most 35 and a solar year at most 366 days.
+_MAX_T = 402
+_T_MONTH = np.zeros((3, _MAX_T), dtype=np.int64)
+_T_DAY = np.zeros((3, _MAX_T), dtype=np.int64)
+for _c, _cal in enumerate(CAL_TYPES):
+    for _t in range(1, _MAX_T):
+        _T_MONTH[_c, _t], _T_DAY[_c, _t] = CsDate.find_date(_cal, _t)
+
+# Month number (5..12, 1..4, 88, 15, 16) to position in the year, -1 where the
+# month does not exist for the year type.
+_MONTH_POSITION = np.full((3, 89), -1, dtype=np.int64)
+for _c, _mp in ((CAL_A, MONTH_POSITION_AB), (CAL_B, MONTH_POSITION_AB), (CAL_C, MONTH_POSITION_C)):
+    for _i, _m in enumerate(_mp[1:], start=1):
+        _MONTH_POSITION[_c, _m] = _i
+
+# Cumulative days per month position, extended to the end of month 16 (the
+# month 6 at the end of the year) for every year type.
+_CUMULATIVE_DAYS = np.array([
+    MONTH_CUMULATIVE_DAYS["A"] + (413, 0),
+    MONTH_CUMULATIVE_DAYS["B"] + (414, 0),
+    MONTH_CUMULATIVE_DAYS["C"] + (413, 443),
+], dtype=np.int64)
+
+# Pak board layout rows as lookup tables indexed by [1 - mahachula, column];
+# -1 marks columns past the end of the row.
+_PAK_ROWS = np.full((5, 2, 64), -1, dtype=np.int64)
+for _r, _row in enumerate(_PAK_LAYOUT):
+    for _p, _cols in enumerate(_row):
+        _PAK_ROWS[_r, _p, 1:len(_cols) + 1] = _cols
+_PAK_DIVISORS = (16168, 1447, 251, 59, 15)
+
+
+def _year_horakhun(year):
+    return (year * DAYS_IN_800_YEARS + EPOCH_OFFSET) // TIME_UNITS_IN_1_DAY + 1
+
+
+def _lsyears(year):
+    """
+    Vectorised LSYear: the unadjusted new year's day values for an array of
+    years.
+    """
+    horakhun = _year_horakhun(year)
+    kammacapon = TIME_UNITS_IN_1_DAY - (year * DAYS_IN_800_YEARS + EPOCH_OFFSET) % TIME_UNITS_IN_1_DAY
+    uccapon = (UCCAPON_CONSTANT + horakhun) % APOGEE_ROTATION_DAYS
+    avo_quot = (horakhun * 11 + 650) // 692
+    avoman = (horakhun * 11 + 650) % 692
+    avoman[avoman == 0] = 692
+    masaken = (avo_quot + horakhun) // 30
+    tithi = (avo_quot + horakhun) % 30
+    tithi -= avoman == 692
+    weekday = horakhun % 7
+
+    horakhun1 = _year_horakhun(year + 1)
+    tithi1 = ((horakhun1 * 11 + 650) // 692 + horakhun1) % 30
+
+    langsak = np.maximum(1, tithi)
+    nyd = np.where(langsak < 6, langsak + 29, langsak)
+    nyd = (weekday - nyd + 1 + 35) % 7
+
+    leapday = kammacapon <= 207
+
+    cal_type = np.full(year.shape, CAL_A, dtype=np.int64)
+    cal_type[(tithi > 24) | (tithi < 6)] = CAL_C
+    cal_type[(tithi == 25) & (tithi1 == 5)] = CAL_A
+    short = (leapday & (avoman <= 126)) | (~leapday & (avoman <= 137))
+    cal_type[short] = np.where(cal_type[short] == CAL_C, CAL_c, CAL_B)
+
+    next_nyd = (nyd + _NEXT_NYD_STEP[cal_type]) % 7
+    return {
+        "horakhun": horakhun,
+        "kammacapon": kammacapon,
+        "uccapon": uccapon,
+        "avoman": avoman,
+        "masaken": masaken,
+        "tithi": tithi,
+        "weekday": weekday,
+        "langsak": langsak,
+        "nyd": nyd,
+        "next_nyd": next_nyd,
+        "leapday": leapday,
+        "cal_type": cal_type,
+    }
+
+
+class LSYearTable:
+    """
+    Year records for the CS years start ... stop-1, calculated as NumPy
+    arrays in one pass. Each column holds the same values as the matching
+    field of lsyear.calculate_year0(), including the neighbouring year
+    adjustments. cal_type is a string array; cal_code holds the year types as
+    integers (0: A, 1: B, 2: C).
+    """
+
+    COLUMNS = (
+        "year", "horakhun", "kammacapon", "uccapon", "avoman", "masaken",
+        "tithi", "weekday", "langsak", "nyd", "next_nyd", "leapday", "offset",
+        "cal_type", "cal_code", "caldays", "first_month", "first_day",
+        "offset_days",
+    )
+
+    def __init__(self, start: int, stop: int):
+        if stop < start:
+            raise ValueError("stop must not be less than start.")
+        self.start = start
+        self.stop = stop
+        n = stop - start
+        base = _lsyears(np.arange(start - 2, stop + 2, dtype=np.int64))
+
+        def window(a):
+            # (n, 5) array: columns are year-2 ... year+2
+            return np.stack([a[i:i + n] for i in range(5)], axis=1)
+
+        tithi = window(base["tithi"])
+        cal_type = window(base["cal_type"])
+        nyd = window(base["nyd"])
+        next_nyd = window(base["next_nyd"])
+        langsak = window(base["langsak"])
+        offset = np.zeros((n, 5), dtype=bool)
+        rows = np.arange(n)
+
+        # tithi 24 followed by 6: the whole window becomes C-type
+        m = (tithi[:, 2] == 24) & (tithi[:, 3] == 6)
+        cal_type[m] = CAL_C
+        next_nyd[m] = (next_nyd[m] + 2) % 7
+
+        # move the leap day of c-type years to the previous or next year
+        for i in (1, 2, 3):
+            m = cal_type[:, i] == CAL_c
+            j = np.where(nyd[:, i] == next_nyd[:, i - 1], 1, -1)
+            r, c = rows[m], i + j[m]
+            cal_type[r, c] = CAL_B
+            next_nyd[r, c] = (next_nyd[r, c] + 1) % 7
+
+        # weekday offset correction
+        for i in (1, 2, 3):
+            m = (next_nyd[:, i - 1] != nyd[:, i]) & (next_nyd[:, i] != nyd[:, i + 1])
+            offset[:, i] |= m
+            langsak[:, i] += m
+            nyd[:, i] = np.where(m, (nyd[:, i] + 6) % 7, nyd[:, i])
+            next_nyd[:, i] = np.where(m, (next_nyd[:, i] + 6) % 7, next_nyd[:, i])
+
+        cal_code = cal_type[:, 2]
+        cal_code[cal_code == CAL_c] = CAL_C
+
+        first_day = langsak[:, 2]
+        offset = offset[:, 2]
+        vaisakha = first_day < 6 + offset
+
+        centre = slice(2, n + 2)
+        self.year = np.arange(start, stop, dtype=np.int64)
+        for name in ("horakhun", "kammacapon", "uccapon", "avoman", "masaken",
+                     "tithi", "weekday", "leapday"):
+            setattr(self, name, base[name][centre])
+        self.langsak = first_day
+        self.nyd = nyd[:, 2]
+        self.next_nyd = next_nyd[:, 2]
+        self.offset = offset
+        self.cal_code = cal_code
+        self.cal_type = np.array(tuple(CAL_TYPES), dtype="<U1")[cal_code]
+        self.caldays = _CAL_DAYS[cal_code]
+        self.first_month = np.where(vaisakha, "V", "C")
+        self.first_day = first_day
+        self.offset_days = np.where(vaisakha, first_day + 29, first_day)
+
+    def __len__(self):
+        return self.stop - self.start
+
+    def __getitem__(self, name):
+        """Return a column by name."""
+        if name not in self.COLUMNS:
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def record(self, year: int):
+        """Return the lsyear.CsYear record for a year in the table."""
+        if not self.start <= year < self.stop:
+            raise IndexError("year out of range")
+        i = year - self.start
+        values = []
+        for name in CsYear._fields:
+            v = getattr(self, name)[i]
+            values.append(v.item())
+        return CsYear(*values)
+
+    def to_dict(self):
+        """Return the columns as a dict of arrays."""
+        return {name: getattr(self, name) for name in self.COLUMNS}
+
+    def to_records(self):
+        """Return the table as a NumPy structured array."""
+        cols = self.to_dict()
+        dtype = [(name, cols[name].dtype) for name in self.COLUMNS]
+        out = np.empty(len(self), dtype=dtype)
+        for name in self.COLUMNS:
+            out[name] = cols[name]
+        return out
+
+
+def _horakhun_year(horakhun):
+    return (horakhun * TIME_UNITS_IN_1_DAY - EPOCH_OFFSET - 1) // DAYS_IN_800_YEARS
+
+
+def from_julianday(jd):
+    """
+    Convert an array of Julian Day Numbers to Chulasakarat date fields.
+    Returns a CsFields namedtuple of arrays.
+    """
+    jd = np.asarray(jd, dtype=np.int64)
+    horakhun = jd - CS_JULIAN_DAY_OFFSET
+    if np.any(horakhun <= 0):
+        raise ValueError("Julian Day Number before the Chulasakarat epoch.")
+
+    year = _horakhun_year(horakhun)
+    ymin = int(year.min()) if year.size else 0
+    ymax = int(year.max()) + 1 if year.size else 0
+    y0 = LSYearTable(ymin, ymax)
+    idx = year - ymin
+    cal_type = y0.cal_code[idx]
+
+    days = horakhun - y0.horakhun[idx]
+    t = y0.offset_days[idx] + days
+    month_raw = _T_MONTH[cal_type, t]
+    day = _T_DAY[cal_type, t]
+    month = np.where((month_raw == 15) | (month_raw == 16), month_raw - 10, month_raw)
+
+    avoman = (horakhun * 11 + 650) % 692
+    avoman[avoman == 0] = 692
+    quot = (horakhun * 11 + 650) // 692
+    return CsFields(
+        year=year,
+        month=month,
+        month_raw=month_raw,
+        day=day,
+        days=days,
+        horakhun=horakhun,
+        tithi=(quot + horakhun) % 30,
+        avoman=avoman,
+        masaken=(((horakhun + days) * 11 + 650) // 692 + horakhun) // 30,
+        uccapon=(horakhun + UCCAPON_CONSTANT) % APOGEE_ROTATION_DAYS,
+        weekday=(horakhun + 5) % 7,
+        solar_leap_year=y0.leapday[idx],
+        leap_day=cal_type == CAL_B,
+        leap_month=cal_type == CAL_C,
+    )
+
+
+def to_julianday(year, month, day):
+    """
+    Convert arrays of CS year, Sukothai month (88 for the intercalary month)
+    and day of month to Julian Day Numbers. Raises ValueError if any
+    element is not a valid date.
+    """
+    year, month, day = np.broadcast_arrays(
+        np.asarray(year, dtype=np.int64),
+        np.asarray(month, dtype=np.int64),
+        np.asarray(day, dtype=np.int64),
+    )
+    if year.size == 0:
+        return np.zeros(year.shape, dtype=np.int64)
+    if np.any((month < 1) | (month > 88)):
+        raise ValueError("Invalid month.")
+
+    ymin = int(year.min())
+    y0 = LSYearTable(ymin, int(year.max()) + 1)
+    idx = year - ymin
+    cal_type = y0.cal_code[idx]
+    offset_days = y0.offset_days[idx]
+
+    tmonth = _MONTH_POSITION[cal_type, month]
+    if np.any(tmonth < 0):
+        raise ValueError("Invalid month for year type.")
+
+    # months 5 and 6 before new year's day are at the end of the year
+    date_offset = np.where(month == 5, day, np.where(month == 6, 29 + day, 0))
+    end = (date_offset > 0) & (date_offset < offset_days)
+    tmonth = tmonth + np.where(end, np.where(cal_type == CAL_C, 13, 12), 0)
+
+    month_days = _CUMULATIVE_DAYS[cal_type, tmonth] - _CUMULATIVE_DAYS[cal_type, tmonth - 1]
+    if np.any((day < 1) | (day > month_days)):
+        raise ValueError("Invalid day of month.")
+
+    days = _CUMULATIVE_DAYS[cal_type, tmonth - 1] + day - offset_days
+    year_days = 365 + y0.leapday[idx]
+    if np.any((days < 0) | (days >= year_days)):
+        raise ValueError("Date outside of the CS year.")
+    return y0.horakhun[idx] + days + CS_JULIAN_DAY_OFFSET
+
+
+def lunation(jd):
+    """
+    Convert an array of Julian Day Numbers to the numbers of the lunations
+    (calendar months, see CsDate.lunation) containing them, looking up one
+    boundary per month.
+    """
+    jd = np.asarray(jd, dtype=np.int64)
+    if jd.size == 0:
+        return np.zeros(jd.shape, dtype=np.int64)
+    if np.any(jd - CS_JULIAN_DAY_OFFSET <= 0):
+        raise ValueError("Julian Day Number before the Chulasakarat epoch.")
+    first = _lunation(int(jd.min()))
+    months = lunation_months(first, _lunation(int(jd.max())) + 1)
+    starts = np.fromiter((m.julianday for m in months), dtype=np.int64, count=len(months))
+    return np.searchsorted(starts, jd, side="right") - 1 + first
+
+
+def pak_from_julianday(jd):
+    """
+    Convert an array of Julian Day Numbers to Pakkhakhananaa fields: the
+    cycle and row counters of the pakcode (cycle-a:b:c:d:e:f), the
+    pakkhagen and the moon phase flags. Returns a PakFields namedtuple of
+    arrays.
+    """
+    jd = np.asarray(jd, dtype=np.int64)
+    horakhun = jd - PAK_JULIAN_DAY_OFFSET
+    if np.any(horakhun <= 0):
+        raise ValueError("Invalid Pakkhakhananaa range.")
+
+    cycle, rem = np.divmod(horakhun - 1, PAK_DAYS_IN_CYCLE)
+    rem += 1
+    rows = []
+    mahachula = None
+    for row, divisor in enumerate(_PAK_DIVISORS):
+        q, rem = np.divmod(rem - 1, divisor)
+        q += 1
+        rem += 1
+        if row == 0:
+            mahachula = _PAK_ROWS[0, 0, q]
+        else:
+            # a row position past the end of the row is moved back by one,
+            # and its days added on to the next row
+            prefix = 1 - mahachula
+            mc = _PAK_ROWS[row, prefix, np.minimum(q, 63)]
+            over = mc < 0
+            q[over] -= 1
+            rem[over] += divisor
+            mahachula = _PAK_ROWS[row, prefix, q]
+        rows.append(q)
+    a, b, c, d, e = rows
+    f = rem
+    pakkhagen = cycle * 19612 + (a - 1) * 1095 + (b - 1) * 98 + (c - 1) * 17 + (d - 1) * 4 + e
+    return PakFields(
+        cycle=cycle + 1,
+        a=a,
+        b=b,
+        c=c,
+        d=d,
+        e=e,
+        f=f,
+        horakhun=horakhun,
+        pakkhagen=pakkhagen,
+        iswaxing=pakkhagen % 2 == 0,
+        iswanphra=(f == 8) | (f == 14 + mahachula),
+    )
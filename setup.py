@@ -43,6 +43,8 @@ setup(
     extras_require={
         "dev": ["check-manifest"],
         "test": ["coverage"],
+        "vector": ["numpy"],
+        "pandas": ["numpy", "pandas>=2.0"],
     },
     include_package_data=True,
     package_data={
@@ -0,0 +1,48 @@
+import random
+import unittest
+from datetime import date
+
+from pythaidate import CsDate, PakDate, bridge
+from pythaidate.constants import PAK_JULIAN_DAY_OFFSET, PAK_DAYS_IN_CYCLE
+
+
+class Test_Bridge(unittest.TestCase):
+
+    def test_convert(self):
+        cs = CsDate(1361, 1, 24)
+        pak = bridge.to_pakdate(cs)
+        self.assertIsInstance(pak, PakDate)
+        self.assertEqual(pak.julianday, cs.julianday)
+        self.assertEqual(pak.pakcode, "1-6:11:5:2:2:10")
+        back = bridge.to_csdate(pak)
+        self.assertEqual(back, cs)
+        self.assertEqual(back.csformatymd(), "1361-01-24")
+
+    def test_pairs(self):
+        # crosses the end of the first Pak cycle
+        start = PAK_JULIAN_DAY_OFFSET + PAK_DAYS_IN_CYCLE - 400
+        result = list(bridge.pairs(start, start + 800))
+        self.assertEqual(len(result), 800)
+        for i, (cs, pak) in enumerate(result):
+            self.assertEqual(cs.julianday, start + i)
+            self.assertEqual(pak.julianday, start + i)
+        for cs, pak in random.sample(result, 100) + result[399:402]:
+            expected = PakDate.fromjulianday(pak.julianday)
+            self.assertEqual(pak.pakcode, expected.pakcode)
+            self.assertEqual(pak.pakabbr, expected.pakabbr)
+            self.assertEqual(pak.iswanphra, expected.iswanphra)
+            self.assertEqual(pak.pakkhagen, expected.pakkhagen)
+        self.assertEqual([pak.pakdata[0] for _, pak in result[399:402]], [1, 1, 2])
+        self.assertEqual(list(bridge.pairs(start, start)), [])
+
+    def test_rows(self):
+        start, stop = date(1999, 1, 1), date(2001, 1, 1)
+        rows = list(bridge.rows(start, stop))
+        self.assertEqual(len(rows), 731)
+        for row, (cs, pak) in zip(rows, bridge.pairs(start, stop)):
+            self.assertEqual(row.julianday, cs.julianday)
+            self.assertEqual((row.year, row.month, row.day), (cs.year, cs.month, cs.day))
+            self.assertEqual(row.pakdata, pak.pakdata)
+        self.assertEqual(list(bridge.rows(stop, start)), [])
+        with self.assertRaises(ValueError):
+            list(bridge.rows(PAK_JULIAN_DAY_OFFSET - 10, PAK_JULIAN_DAY_OFFSET + 10))
@@ -0,0 +1,84 @@
+from array import array
+import unittest
+
+from pythaidate import CsDate, PakDate, codec
+
+
+class Test_Codec(unittest.TestCase):
+
+    def test_cs_layout(self):
+        cs = CsDate(1361, 1, 24)
+        code = codec.encode(cs)
+        year0 = cs.calculate_year0(1361)
+        self.assertEqual(code, 1361 << 11 | 1 << 7 | 24 << 2 | "ABC".index(year0.cal_type))
+        self.assertEqual(codec.decode(code), cs)
+
+    def test_cs_months(self):
+        # intercalary month and month 5/6 at the end of the year
+        for cs, month in ((CsDate(1380, 88, 3), 13), (CsDate.fromjulianday(2458580), 14)):
+            code = codec.encode(cs)
+            self.assertEqual(code >> 7 & 15, month)
+            self.assertEqual(codec.decode(code), cs)
+
+    def test_pak_layout(self):
+        p = PakDate(jd=2451545)
+        code = codec.encode(p)
+        cycle, rows = p.pakcode.split("-")
+        values = [int(cycle)] + [int(i) for i in rows.split(":")]
+        fields = []
+        for width in (4, 3, 3, 3, 4, 5, 10):
+            fields.insert(0, code & (1 << width) - 1)
+            code >>= width
+        self.assertEqual(fields, values)
+        self.assertEqual(codec.decode(codec.encode(p), codec.PAK), p)
+
+    def test_many(self):
+        for kind, start in ((codec.CS, 2400000), (codec.PAK, 2355148)):
+            jds = array("q", range(start, start + 4000, 3))
+            codes = codec.encode_many(jds, kind)
+            self.assertEqual(codes.typecode, "I")
+            self.assertEqual(codec.decode_many(codes, kind), jds)
+            self.assertEqual(codec.decode_many(memoryview(codes), kind), jds)
+            data = codec.encode_many(jds, kind, as_bytes=True)
+            self.assertEqual(len(data), 4 * len(jds))
+            self.assertEqual(codec.decode_many(data, kind), jds)
+            self.assertEqual(codec.decode_many(memoryview(data), kind), jds)
+
+    def test_bytes_little_endian(self):
+        data = codec.encode_many([2451545], as_bytes=True)
+        self.assertEqual(int.from_bytes(data, "little"), codec.encode(CsDate.fromjulianday(2451545)))
+
+    def test_errors(self):
+        code = codec.encode(CsDate(1361, 1, 24))
+        with self.assertRaises(ValueError):
+            codec.decode(code ^ 1)  # wrong year type
+        with self.assertRaises(ValueError):
+            codec.decode(code & ~(31 << 2))  # day 0
+        with self.assertRaises(ValueError):
+            codec.encode_many([1954167])
+        # month 5 day 1 before new year's day belongs to the year before
+        year0 = CsDate.calculate_year0(1361)
+        self.assertGreater(year0.offset_days, 0)
+        code = 1361 << 11 | 5 << 7 | 1 << 2 | "ABC".index(year0.cal_type)
+        with self.assertRaises(ValueError):
+            codec.decode(code)
+        with self.assertRaises(ValueError):
+            codec.encode_many([2355147], codec.PAK)
+        with self.assertRaises(TypeError):
+            codec.encode(2451545)
+
+    def test_pak_errors(self):
+        code = codec.encode(PakDate(pakcode="1-6:11:5:2:2:10"))
+        self.assertEqual(codec.decode(code, codec.PAK).pakcode, "1-6:11:5:2:2:10")
+        for bad in (
+                code & ~(1023 << 22),           # cycle 0
+                code & ~(31 << 17),             # a 0
+                code & ~(31 << 17) | 19 << 17,  # a 19
+                code & ~(15 << 13) | 12 << 13,  # b 12
+                code & ~15,                     # day 0
+                code & ~(7 << 4) | 5 << 4,      # e 5 under a จุลสมุหะ
+        ):
+            with self.assertRaises(ValueError):
+                codec.decode(bad, codec.PAK)
+            with self.assertRaises(ValueError):
+                codec.decode_many([bad], codec.PAK)
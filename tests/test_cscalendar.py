@@ -0,0 +1,65 @@
+import unittest
+
+from pythaidate import CsCalendar, CsDate
+from pythaidate.cscalendar import WAXING, WANING
+
+
+class Test_CsCalendar(unittest.TestCase):
+
+    def test_months(self):
+        cal = CsCalendar()
+        self.assertEqual(cal.months(1360), (5, 6, 7, 8, 9, 10, 11, 12, 1, 2, 3, 4))
+        self.assertEqual(cal.months(1361), (5, 6, 7, 8, 88, 9, 10, 11, 12, 1, 2, 3, 4))
+        with self.assertRaises(ValueError):
+            cal.monthdayscalendar(1360, 88)
+
+    def test_itermonthdates(self):
+        for firstweekday in range(7):
+            cal = CsCalendar(firstweekday)
+            for year in (1360, 1361):
+                for month in cal.months(year):
+                    dates = list(cal.itermonthdates(year, month))
+                    self.assertEqual(len(dates) % 7, 0)
+                    self.assertEqual(dates[0].weekday(), firstweekday)
+                    for a, b in zip(dates, dates[1:]):
+                        self.assertEqual(a.julianday + 1, b.julianday)
+                    days = list(cal.itermonthdays(year, month))
+                    self.assertEqual(len(days), len(dates))
+                    for d, cs in zip(days, dates):
+                        if d:
+                            self.assertEqual((cs.month, cs.day), (month, d))
+                        else:
+                            self.assertFalse(cs.month == month and cs.year in (year, year - 1))
+
+    def test_monthdayscalendar(self):
+        cal = CsCalendar()
+        weeks = cal.monthdayscalendar(1361, 88)
+        self.assertEqual(weeks[0], [0, 0, 1, 2, 3, 4, 5])
+        self.assertEqual(max(max(w) for w in weeks), 30)
+        self.assertEqual(CsDate(1361, 88, 1).weekday(), 2)  # AD 1999-07-14
+        weeks = cal.monthdays2calendar(1361, 88)
+        self.assertEqual(weeks[0][2], (1, 2))
+
+    def test_monthphasecalendar(self):
+        cal = CsCalendar(6)
+        weeks = cal.monthphasecalendar(1361, 1)
+        flat = [d for w in weeks for d in w if d[1]]
+        self.assertEqual(flat[0], (1, WAXING))
+        self.assertEqual(flat[14], (15, WAXING))
+        self.assertEqual(flat[15], (1, WANING))
+        self.assertEqual(len(flat), 29)
+        self.assertEqual(flat[-1], (14, WANING))
+
+    def test_yeardatescalendar(self):
+        cal = CsCalendar()
+        rows = cal.yeardatescalendar(1361, width=4)
+        self.assertEqual([len(r) for r in rows], [4, 4, 4, 1])
+        rows = cal.yeardayscalendar(1360)
+        self.assertEqual(len(rows), 4)
+        rows = cal.yeardays2calendar(1360, width=6)
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(list(cal.iterweekdays()), [0, 1, 2, 3, 4, 5, 6])
+
+
+if __name__ == '__main__':
+    unittest.main()
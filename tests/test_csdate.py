@@ -1,13 +1,15 @@
 from datetime import date, timedelta
+import copy
 import json
 import unittest
 import os
+import pickle
 import pathlib
 import random
 
 import logging
 
-from pythaidate import CsDate, julianday
+from pythaidate import CsDate, csdate, julianday
 from pythaidate.constants import CS_JULIAN_DAY_OFFSET
 
 random.seed()
@@ -153,6 +155,25 @@ class Test_CsDate(unittest.TestCase):
         self.assertEqual(y.weekday(), 4)
         self.assertEqual(y.isoweekday(), 5)
         self.assertEqual(y.csweekday(), 6)
+        y = CsDate.fromjulianday(2451545)  # Saturday, AD 2000-01-01
+        self.assertEqual(y.weekday(), 5)
+        self.assertEqual(y.isoweekday(), 6)
+        self.assertEqual(y.csweekday(), 0)
+        # numbered like datetime.date on every weekday, never negative
+        for jd in range(2451545, 2451545 + 7):
+            d = julianday.julianday_to_date(jd)
+            y = CsDate.fromjulianday(jd)
+            self.assertEqual((y.weekday(), y.isoweekday()), (d.weekday(), d.isoweekday()))
+
+    def test_slots(self):
+        cs = CsDate(1361, 1, 24)
+        self.assertFalse(hasattr(cs, "__dict__"))
+        with self.assertRaises(AttributeError):
+            cs.foo = 1
+        # derived values
+        self.assertEqual(cs.days, 260)
+        self.assertEqual(cs.horakhun, 497378)
+        self.assertEqual(cs.julianday, 2451545)
 
     def test_cscalendar(self):
         y = CsDate(1200, 5, 19)
@@ -178,6 +199,24 @@ class Test_CsDate(unittest.TestCase):
                 y1.julianday, y1._hashable()
             ))
 
+    def test_fromyd_large_offset(self):
+        y0 = CsDate.fromyd(year=0, days=0)
+        for days in (365, 366, 800000, 292207, 292207 * 3 + 95333):
+            cs = CsDate.fromyd(year=0, days=days)
+            self.assertEqual(cs.julianday, y0.julianday + days)
+            self.assertEqual(cs, CsDate.fromjulianday(y0.julianday + days))
+            self.assertTrue(0 <= cs.days < 366, (days, cs.days))
+
+    def test_fromyd_negative_offset(self):
+        y0 = CsDate.fromyd(year=1361, days=0)
+        cs = CsDate.fromyd(year=1361, days=-1)
+        self.assertEqual(cs.year, 1360)
+        self.assertEqual(cs.julianday, y0.julianday - 1)
+
+    def test_fromjulianday_pre_epoch(self):
+        with self.assertRaises(ValueError):
+            CsDate.fromjulianday(CS_JULIAN_DAY_OFFSET)
+
     def test_fromtimestamp(self):
         cs = CsDate.fromtimestamp(946758689)
         y2k_julianday = 2451545
@@ -208,6 +247,21 @@ class Test_CsDate(unittest.TestCase):
                 )
             )
 
+    def test_add_sequential(self):
+        # step across several new years one day, and one year, at a time
+        one = timedelta(days=1)
+        cs = CsDate.fromyd(year=1358, days=0)
+        for i in range(1, 3 * 366):
+            cs += one
+            expected = CsDate.fromjulianday(cs.julianday)
+            self.assertEqual((cs.year, cs.month_raw, cs.day, cs.days),
+                             (expected.year, expected.month_raw, expected.day, expected.days))
+        for n in (365, -365, 366, -366, 731, -731, 100000, -100000):
+            expected = CsDate.fromjulianday(cs.julianday + n)
+            result = cs + timedelta(days=n)
+            self.assertEqual((result.year, result.month_raw, result.day, result.days),
+                             (expected.year, expected.month_raw, expected.day, expected.days))
+
     def test_add_typeerror(self):
         cs = CsDate.fromyd(year=1000, days=0)
         with self.assertRaises(TypeError):
@@ -223,6 +277,15 @@ class Test_CsDate(unittest.TestCase):
                              (y0.julianday, "-", r, "!=", y1.julianday, "diff:", y0.julianday - r - y1.julianday,
                               (y0.year, y0.month, y0.day), (y1.year, y1.month, y1.day)))
 
+    def test_subtract_before_epoch(self):
+        y0 = CsDate.fromjulianday(CS_JULIAN_DAY_OFFSET + 5)
+        self.assertEqual((y0 - timedelta(days=4)).julianday, CS_JULIAN_DAY_OFFSET + 1)
+        for n in (5, 10, 400):
+            with self.assertRaises(ValueError):
+                y0 - timedelta(days=n)
+            with self.assertRaises(ValueError):
+                y0 + timedelta(days=-n)
+
     def test_subtract_dates(self):
         count = 0
         while True:
@@ -243,6 +306,149 @@ class Test_CsDate(unittest.TestCase):
         self.assertEqual(cs - dt, timedelta(days=7))
 
 
+    def test_hash(self):
+        a = CsDate(1361, 1, 24)
+        b = CsDate.fromjulianday(a.julianday)
+        c = a + timedelta(days=1) - timedelta(days=1)
+        self.assertEqual(hash(a), hash(b))
+        self.assertEqual(len({a, b, c}), 1)
+        d = {a: "x"}
+        self.assertEqual(d[b], "x")
+        # equal to, and so hashed like, the datetime.date of the same day
+        for jd in (2451545, 2268933, a.julianday):
+            cs = CsDate.fromjulianday(jd)
+            dt = julianday.julianday_to_date(jd)
+            self.assertEqual(cs, dt)
+            self.assertEqual(len({cs, dt}), 1)
+            self.assertEqual({dt: "x"}[cs], "x")
+        from pythaidate import date as pdate
+        self.assertEqual(len({CsDate.fromjulianday(2451545), pdate(2000, 1, 1), date(2000, 1, 1)}), 1)
+        self.assertIs(copy.copy(a), a)
+        self.assertIs(copy.deepcopy(a), a)
+
+    def test_pickle(self):
+        for cs in (CsDate(1361, 1, 24), CsDate(1380, 88, 3), CsDate(1381, 5, 1, month_style=csdate.MONTH_CM)):
+            data = pickle.dumps(cs)
+            cs2 = pickle.loads(data)
+            self.assertEqual(cs, cs2)
+            self.assertEqual(cs._hashable(), cs2._hashable())
+            self.assertNotIn(b"LSYear", data)
+            self.assertNotIn(b"CsYear", data)
+
+    def test_intern(self):
+        self.assertIsNone(csdate.intern_cache_info())
+        self.assertIsNot(CsDate.fromjulianday(2451545), CsDate.fromjulianday(2451545))
+        csdate.set_intern_size(2)
+        try:
+            a = CsDate.fromjulianday(2451545)
+            self.assertIs(CsDate.fromjulianday(2451545), a)
+            CsDate.fromjulianday(2451546)
+            CsDate.fromjulianday(2451547)
+            info = csdate.intern_cache_info()
+            self.assertEqual((info.hits, info.misses, info.currsize), (1, 3, 2))
+            self.assertIsNot(CsDate.fromjulianday(2451545), a)
+            csdate.intern_cache_clear()
+            self.assertEqual(csdate.intern_cache_info().currsize, 0)
+        finally:
+            csdate.set_intern_size(0)
+        self.assertIsNone(csdate.intern_cache_info())
+
+    def test_range(self):
+        start = CsDate.fromyd(year=1359, days=300)  # crosses a leap month year
+        stop = start.julianday + 800
+        r = CsDate.range(start, stop)
+        self.assertEqual(len(r), 800)
+        dates = list(r)
+        self.assertEqual(len(dates), 800)
+        for i, cs in enumerate(dates):
+            expected = CsDate.fromjulianday(start.julianday + i)
+            self.assertEqual((cs.julianday, cs.year, cs.month_raw, cs.day),
+                             (expected.julianday, expected.year, expected.month_raw, expected.day))
+        self.assertIn(88, [cs.month for cs in dates])
+        self.assertEqual([cs.julianday for cs in reversed(r)], [cs.julianday for cs in dates][::-1])
+        self.assertEqual(r[-1].julianday, stop - 1)
+        self.assertIn(dates[10], r)
+        self.assertNotIn(CsDate.fromjulianday(stop), r)
+
+    def test_range_bounds_and_step(self):
+        r = CsDate.range(date(2000, 1, 1), 2451545 + 70, 7)
+        self.assertEqual(len(r), 10)
+        self.assertEqual([cs.julianday for cs in r], list(range(2451545, 2451615, 7)))
+        r = CsDate.range(2451545, 2451535, -3)
+        self.assertEqual([cs.julianday for cs in r], [2451545, 2451542, 2451539, 2451536])
+        self.assertEqual(len(CsDate.range(2451545, 2451545)), 0)
+        with self.assertRaises(ValueError):
+            CsDate.range(2451545, 2451546, 0)
+        with self.assertRaises(ValueError):
+            CsDate.range(CS_JULIAN_DAY_OFFSET, 2451546)
+        with self.assertRaises(TypeError):
+            CsDate.range("2000-01-01", 2451546)
+
+    def test_lunar_year(self):
+        for year in range(1350, 1400):
+            months = csdate.lunar_months(year)
+            for m in (months[0], months[-1]):
+                for jd in (m.julianday, m.julianday + m.days - 1):
+                    self.assertEqual(csdate._lunar_year(jd), year)
+
+    def test_add_lunar_months(self):
+        cs = CsDate(1361, 8, 30)  # 1361 has an intercalary month
+        self.assertEqual(cs.add_lunar_months(0).julianday, cs.julianday)
+        self.assertEqual(cs.add_lunar_months(1).csformatymd(), "1361-88-30")
+        self.assertEqual(cs.add_lunar_months(2).csformatymd(), "1361-09-29")
+        self.assertEqual(cs.add_lunar_months(2, csdate.OVERFLOW).csformatymd(), "1361-10-01")
+        with self.assertRaises(ValueError):
+            cs.add_lunar_months(2, csdate.RAISE)
+        self.assertEqual(cs.add_lunar_months(12).csformatymd(), "1362-07-29")
+        self.assertEqual(cs.add_lunar_months(-13).csformatymd(), "1360-07-30")
+        cs = CsDate(1361, 8, 15)
+        for n in range(-40, 40, 3):
+            self.assertEqual(cs.add_lunar_months(n).add_lunar_months(-n).julianday, cs.julianday)
+        # lunations agree with masaken
+        for year in (1, 500, 1361, 1385, 2000):
+            for m in csdate.lunar_months(year):
+                n = CsDate.fromjulianday(m.julianday).masaken
+                self.assertEqual(csdate._lunation(m.julianday + m.days - 1), n)
+                self.assertEqual(csdate._lunation_month(n), m)
+
+    def test_lunation(self):
+        cs = CsDate(1361, 88, 10)
+        n = cs.lunation
+        self.assertEqual(n, 16837)
+        self.assertEqual(csdate.lunation_bounds(n), (2451374, 2451404))
+        self.assertEqual(csdate.lunation_start_jd(n), 2451374)
+        self.assertEqual(CsDate.from_lunation(n, 10).julianday, cs.julianday)
+        self.assertEqual(CsDate.from_lunation(n).csformatymd(), "1361-88-01")
+        with self.assertRaises(ValueError):
+            CsDate.from_lunation(n + 1, 30)  # month 9 has 29 days
+        months = csdate.lunation_months(n - 30, n + 30)
+        self.assertEqual(len(months), 60)
+        self.assertEqual(months[30], csdate.lunar_months(1361)[4])
+        for i, m in enumerate(months):
+            self.assertEqual((m.julianday, m.julianday + m.days), csdate.lunation_bounds(n - 30 + i))
+        self.assertEqual(csdate.lunation_months(n, n), ())
+
+    def test_anniversary(self):
+        cs = CsDate(1361, 88, 15)
+        self.assertEqual([cs.add_lunar_years(n).csformatymd() for n in range(-2, 3)],
+                         ["1359-08-15", "1360-08-15", "1361-88-15", "1362-08-15", "1363-08-15"])
+        cs = CsDate(1360, 8, 15)
+        self.assertEqual(cs.anniversary(1361).csformatymd(), "1361-08-15")
+        self.assertEqual(cs.anniversary(1361, leap=csdate.LEAP_SECOND).csformatymd(), "1361-88-15")
+        self.assertEqual(CsDate(1361, 8, 15).anniversary(1385, leap=csdate.LEAP_SECOND).csformatymd(),
+                         "1385-08-15")
+        cs = CsDate(1360, 7, 30)  # 1360 is a B year
+        self.assertEqual(cs.anniversary(1362).csformatymd(), "1362-07-29")
+        self.assertEqual(cs.anniversary(1362, csdate.OVERFLOW).csformatymd(), "1362-08-01")
+        with self.assertRaises(ValueError):
+            cs.anniversary(1362, csdate.RAISE)
+        with self.assertRaises(ValueError):
+            cs.anniversary(1362, leap=csdate.LEAP_BOTH)
+        # months 5 and 6 dated at the end of the CS year are in the next lunar year
+        cs = CsDate(1361, 5, 1)
+        self.assertEqual(cs.month_raw, 15)
+        self.assertEqual(cs.add_lunar_years(1).julianday, csdate.lunar_months(1363)[0].julianday)
+
     def test_today(self):
         t1 = julianday.today()
         t2 = CsDate.today()
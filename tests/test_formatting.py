@@ -0,0 +1,162 @@
+import io
+import unittest
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from pythaidate import CsDate, PakDate, date, formatting
+
+
+class Test_Formatting(unittest.TestCase):
+
+    def setUp(self):
+        self.cs = CsDate(1361, 1, 24)
+        self.pak = PakDate(jd=2451545)
+        self.date = date(2000, 1, 1)
+
+    def test_cs_directives(self):
+        cs = self.cs
+        self.assertEqual(cs.csstrftime("%Y-%m-%d"), "1361-01-24")
+        self.assertEqual(cs.csstrftime("%-m/%-d %j %J"), "1/24 261 2451545")
+        self.assertEqual(cs.csstrftime("%A %a %w"), "วันเสาร์ ส. 6")
+        self.assertEqual(cs.csstrftime("%B %b %p %e %K"), "เดือนอ้าย อ้าย แรม 09 ปีเถาะ")
+        self.assertEqual(cs.csstrftime("%EY %Ey %OEY"), "จ.ศ.1361 1361 จ.ศ.๑๓๖๑")
+        self.assertEqual(cs.csstrftime("%Od %O-e 100%% {}"), "๒๔ ๙ 100% {}")
+        self.assertEqual(CsDate(1380, 88, 3).csstrftime("%m %B"), "88 เดือนแปดหลัง")
+
+    def test_csformat(self):
+        self.assertEqual(self.cs.csformat(), "วันเสาร์ เดือน ๑ แรม ๙ ค่ำ ปีเถาะ จ.ศ.๑๓๖๑")
+        self.assertEqual(self.cs.csstrftime("%A เดือน %O-m %p %O-e ค่ำ %K %OEY"), self.cs.csformat())
+
+    def test_pak_directives(self):
+        self.assertEqual(self.pak.csstrftime("%P"), self.pak.pakcode)
+        self.assertEqual(self.pak.csstrftime("%C %1 %2 %3 %4 %5 %6"), "1 6 11 5 2 2 10")
+        self.assertEqual(self.pak.csstrftime("%p %A %J"), "แรม วันเสาร์ 2451545")
+
+    def test_date_directives(self):
+        d = self.date
+        self.assertEqual(d.csstrftime("%d/%m/%Y"), "01/01/2000")
+        self.assertEqual(d.csstrftime("%-d %EB %EY"), "1 มกราคม พ.ศ.2543")
+        self.assertEqual(d.csstrftime("%Ea %Eb %OEy %A"), "ส. ม.ค. ๒๕๔๓ Saturday")
+        self.assertEqual(d.csstrftime("%J"), "2451545")
+
+    def test_format(self):
+        self.assertEqual("{:%Y-%m-%d}".format(self.cs), "1361-01-24")
+        self.assertEqual(format(self.cs), str(self.cs))
+        self.assertEqual(f"{self.pak:%P}", self.pak.pakcode)
+        self.assertEqual(f"{self.date:%EY}", "พ.ศ.2543")
+        self.assertEqual(f"{self.date}", "2000-01-01")
+
+    def test_invalid(self):
+        for fmt in ("%Q", "%", "%EA"):
+            with self.assertRaises(ValueError):
+                self.cs.csstrftime(fmt)
+        with self.assertRaises(ValueError):
+            self.date.csstrftime("%EQ")
+        with self.assertRaises(TypeError):
+            formatting.strftime(object(), "%Y")
+
+    def test_format_many(self):
+        dates = [self.cs, CsDate.fromjulianday(2451546), 2451547]
+        self.assertEqual(formatting.format_many("%d", dates), ["24", "25", "26"])
+        mixed = [self.cs, self.pak, self.date]
+        self.assertEqual(formatting.format_many("%J", mixed), ["2451545"] * 3)
+        self.assertEqual(formatting.format_many("%P", [2451545], formatting.PAK), [self.pak.pakcode])
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_format_many_array(self):
+        jds = np.arange(2451000, 2452000)
+        fmt = "%A %Od %B %p %K %EY %j %J"
+        expected = [CsDate.fromjulianday(int(j)).csstrftime(fmt) for j in jds]
+        self.assertEqual(formatting.format_many(fmt, jds), expected)
+        fmt = "%P %p %A %w"
+        expected = [PakDate(jd=int(j)).csstrftime(fmt) for j in jds]
+        self.assertEqual(formatting.format_many(fmt, jds, formatting.PAK), expected)
+
+
+class Test_Parsing(unittest.TestCase):
+
+    def test_cs(self):
+        cs = CsDate(1361, 1, 24)
+        self.assertEqual(CsDate.csstrptime("1361-01-24", "%Y-%m-%d"), cs)
+        self.assertEqual(CsDate.csstrptime("๑๓๖๑-๐๑-๒๔", "%Y-%m-%d"), cs)
+        self.assertEqual(CsDate.csstrptime(" 1361  1 24 ", "%Y %m %d"), cs)
+        self.assertEqual(CsDate.csstrptime("จ.ศ.1361 เดือนอ้าย แรม 9", "%EY %B %p %e"), cs)
+        self.assertEqual(CsDate.csstrptime("1361 261", "%Y %j"), cs)
+        self.assertEqual(CsDate.csstrptime("2451545", "%J"), cs)
+        self.assertEqual(CsDate.fromcsformat(cs.csformat()), cs)
+
+    def test_cs_round_trip(self):
+        fmts = ("%A เดือน %O-m %p %O-e ค่ำ %K %OEY", "%Y-%m-%d %a", "%Y %j", "%EY %B %e %p %w")
+        for jd in range(2451000, 2452500, 7):
+            cs = CsDate.fromjulianday(jd)
+            for fmt in fmts:
+                self.assertEqual(CsDate.csstrptime(cs.csstrftime(fmt), fmt), cs, (jd, fmt))
+
+    def test_cs_month_5(self):
+        # month 5 day 26 is both at the start and the end of CS 1360; the
+        # weekday picks between them
+        start = CsDate.csstrptime("1360-05-26", "%Y-%m-%d")
+        end = CsDate.fromjulianday(2451281)
+        self.assertEqual((end.year, end.month_raw, end.day), (1360, 15, 26))
+        self.assertNotEqual(start, end)
+        self.assertEqual(CsDate.csstrptime("1360-05-26 วันจันทร์", "%Y-%m-%d %A"), end)
+        self.assertEqual(CsDate.csstrptime(start.csstrftime("%Y-%m-%d %A"), "%Y-%m-%d %A"), start)
+
+    def test_invalid(self):
+        for s, fmt in (("1361-01-31", "%Y-%m-%d"), ("1361-13-01", "%Y-%m-%d"),
+                       ("1360-88-01", "%Y-%m-%d"), ("1361-01", "%Y-%m"),
+                       ("1361-01-24x", "%Y-%m-%d"), ("1361-01-24 วันอาทิตย์", "%Y-%m-%d %A"),
+                       ("1361 400", "%Y %j")):
+            with self.assertRaises(ValueError, msg=s):
+                CsDate.csstrptime(s, fmt)
+        with self.assertRaises(ValueError):
+            CsDate.csstrptime("1361", "%Q")
+
+    def test_pak(self):
+        pak = PakDate(jd=2451545)
+        self.assertEqual(PakDate.csstrptime(pak.pakcode, "%P"), pak)
+        self.assertEqual(PakDate.csstrptime("1 6 11 5 2 2 10", "%C %1 %2 %3 %4 %5 %6"), pak)
+        self.assertEqual(PakDate.csstrptime("2451545 แรม", "%J %p"), pak)
+        with self.assertRaises(ValueError):
+            PakDate.csstrptime("1-6:11:5:2:2:16", "%P")
+
+    def test_date(self):
+        d = date(2000, 1, 1)
+        self.assertEqual(date.csstrptime("1 มกราคม พ.ศ.2543", "%d %EB %EY"), d)
+        self.assertEqual(date.csstrptime("๑ ม.ค. ๒๕๔๓", "%d %Eb %Ey"), d)
+        self.assertEqual(date.csstrptime("01/01/00", "%d/%m/%y"), d)
+        self.assertEqual(date.csstrptime("Saturday 1 January 2000", "%A %d %B %Y"), d)
+        self.assertEqual(date.csstrptime("2000 001", "%Y %j"), d)
+        self.assertIsInstance(date.csstrptime("2451545", "%J"), date)
+        # Julian calendar dates before the Gregorian reform
+        d = date(1500, 1, 1)
+        self.assertEqual(d.csstrftime("%J"), str(d.julianday))
+        self.assertEqual(date.csstrptime(d.csstrftime("%J"), "%J"), d)
+        with self.assertRaises(ValueError):
+            date.csstrptime("2000 367", "%Y %j")
+
+    def test_parse_many(self):
+        lines = ["1361-01-24\n", "bad\n", "\n", "1361-01-31\n", "1361-01-24\n"]
+        result = list(formatting.parse_many(lines, "%Y-%m-%d"))
+        self.assertEqual(result[0], CsDate(1361, 1, 24))
+        self.assertEqual(result[3], result[0])
+        errors = result[1:3]
+        self.assertTrue(all(isinstance(e, formatting.ParseError) for e in errors))
+        self.assertEqual([(e.lineno, e.text) for e in errors], [(2, "bad"), (4, "1361-01-31")])
+        self.assertEqual(list(formatting.parse_many(lines, "%Y-%m-%d", as_julianday=True, errors="skip")),
+                         [2451545, 2451545])
+        with self.assertRaises(formatting.ParseError) as cm:
+            list(formatting.parse_many(lines, "%Y-%m-%d", errors="raise"))
+        self.assertEqual(cm.exception.lineno, 2)
+        with self.assertRaises(ValueError):
+            list(formatting.parse_many(lines, "%Y-%m-%d", errors="ignore"))
+
+    def test_parse_many_file(self):
+        stream = io.StringIO("1-6:11:5:2:2:10\n1-6:11:5:2:2:11\n")
+        result = list(formatting.parse_many(stream, "%P", formatting.PAK, as_julianday=True))
+        self.assertEqual(result, [2451545, 2451546])
+        result = list(formatting.parse_many([b"1361-01-24"], "%Y-%m-%d", as_julianday=True))
+        self.assertEqual(result, [2451545])
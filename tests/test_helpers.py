@@ -1,3 +1,6 @@
+import io
+import os
+import tempfile
 import unittest
 
 from pythaidate import helpers
@@ -18,8 +21,20 @@ THAI_WIDTH_TESTS = (
     ("ปฏิทิน", 4),
     ("จันทรคติ", 6),
     ("ไทย", 3),
+    ("ผู้เฒ่า", 4),
+    ("abc", 0),
 )
 
+STRING_WIDTH_TESTS = (
+    ("มาร์ค", 4),
+    ("วันเสาร์ 2024", 11),
+    ("abc", 3),
+    ("e\u0301", 1),
+    ("", 0),
+)
+
+TRANSCODE_TEXT = "วันเสาร์ เดือน ๑ แรม ๙ ค่ำ ปีเถาะ จ.ศ.๑๓๖๑ (2000-01-01)\n" * 200
+
 class Test_Helpers(unittest.TestCase):
 
     def test_digit_thai_to_arabic(self):
@@ -55,3 +70,43 @@ class Test_Helpers(unittest.TestCase):
         for s, w in THAI_WIDTH_TESTS:
             result = helpers.thai_string_width(s)
             self.assertEqual(w, result, "Failed: "+s+" result:"+str(result)+" expected:"+str(w))
+
+    def test_string_width(self):
+        for s, w in STRING_WIDTH_TESTS:
+            self.assertEqual(w, helpers.string_width(s), s)
+
+    def test_iter_transcode(self):
+        chunks = ["จ.ศ.๑๓", "๖๑ 20", "00"]
+        self.assertEqual("".join(helpers.iter_transcode(chunks)), "จ.ศ.1361 2000")
+        self.assertEqual("".join(helpers.iter_transcode(chunks, "thai")), "จ.ศ.๑๓๖๑ ๒๐๐๐")
+
+    def test_transcode_file_objects(self):
+        expected = TRANSCODE_TEXT.translate(helpers.THAI_TO_ARABIC)
+        # text file objects
+        out = io.StringIO()
+        n = helpers.transcode(io.StringIO(TRANSCODE_TEXT), out, chunk_size=7)
+        self.assertEqual(out.getvalue(), expected)
+        self.assertEqual(n, len(expected))
+        # binary file objects, chunks splitting multi-byte characters
+        out = io.BytesIO()
+        helpers.transcode(io.BytesIO(TRANSCODE_TEXT.encode("utf-8")), out, chunk_size=7)
+        self.assertEqual(out.getvalue().decode("utf-8"), expected)
+        # and back again
+        out = io.StringIO()
+        helpers.transcode(io.StringIO(expected), out, to="thai")
+        self.assertEqual(out.getvalue(), TRANSCODE_TEXT.translate(helpers.ARABIC_TO_THAI))
+
+    def test_transcode_files(self):
+        expected = TRANSCODE_TEXT.translate(helpers.THAI_TO_ARABIC)
+        with tempfile.TemporaryDirectory() as d:
+            src = os.path.join(d, "src.txt")
+            dst = os.path.join(d, "dst.txt")
+            with open(src, "w", encoding="utf-8") as fh:
+                fh.write(TRANSCODE_TEXT)
+            for use_mmap in (False, True):
+                helpers.transcode(src, dst, chunk_size=1001, mmap=use_mmap)
+                with open(dst, encoding="utf-8") as fh:
+                    self.assertEqual(fh.read(), expected)
+            # empty file
+            open(src, "w").close()
+            self.assertEqual(helpers.transcode(src, dst, mmap=True), 0)
@@ -0,0 +1,54 @@
+import unittest
+from datetime import date
+
+from pythaidate import CsDate, holidays
+from pythaidate.julianday import to_julianday, julianday_to_date
+
+
+class Test_Holidays(unittest.TestCase):
+
+    def test_holidays(self):
+        # 1385 (2023) has an intercalary month, and 1386 (2024) doesn't
+        expected = {
+            1384: [date(2022, 5, 15), date(2022, 7, 13), date(2022, 7, 14), date(2022, 10, 10), date(2023, 3, 6)],
+            1385: [date(2023, 6, 3), date(2023, 8, 1), date(2023, 8, 2), date(2023, 10, 29), date(2024, 2, 24)],
+            1386: [date(2024, 5, 22), date(2024, 7, 20), date(2024, 7, 21), date(2024, 10, 17), date(2025, 2, 12)],
+        }
+        names = [holidays.VISAKHA_BUCHA, holidays.ASANHA_BUCHA, holidays.KHAO_PHANSA,
+                 holidays.OK_PHANSA, holidays.MAKHA_BUCHA]
+        for year, dates in expected.items():
+            result = holidays.holidays(year)
+            self.assertEqual([h.name for h in result], names)
+            self.assertEqual([julianday_to_date(h.julianday) for h in result], dates)
+
+        h = dict(holidays.holidays(1385))
+        cs = CsDate.fromjulianday(h[holidays.ASANHA_BUCHA])
+        self.assertEqual((cs.month, cs.day), (88, 15))
+        cs = CsDate.fromjulianday(h[holidays.KHAO_PHANSA])
+        self.assertEqual((cs.month, cs.day), (88, 16))
+
+    def test_wanphra(self):
+        start, stop = to_julianday(2000, 1, 1), to_julianday(2004, 1, 1)
+        result = set(holidays.between(start, stop, holidays.WAN_PHRA))
+        for cs in CsDate.range(start, stop):
+            last = cs.day == 30 or (cs.day == 29 and CsDate.fromjulianday(cs.julianday + 1).day == 1)
+            self.assertEqual(cs.julianday in result, cs.day in (8, 15, 23) or last, cs.csformat())
+        self.assertEqual(len(holidays.wanphra(1360)), 48)
+        self.assertEqual(len(holidays.wanphra(1361)), 52)
+
+    def test_between(self):
+        start, stop = date(1900, 1, 1), date(2100, 1, 1)
+        result = holidays.between(start, stop)
+        self.assertEqual(result, sorted(set(result)))
+        self.assertTrue(to_julianday(1900, 1, 1) <= result[0] < result[-1] < to_julianday(2100, 1, 1))
+
+        makha = holidays.between(start, stop, holidays.MAKHA_BUCHA)
+        self.assertEqual(len(makha), 200)
+        self.assertTrue(set(makha) <= set(result))
+        dates = holidays.between(start, stop, [holidays.MAKHA_BUCHA], as_date=True)
+        self.assertEqual([d.julianday for d in dates], makha)
+        self.assertTrue(all(d.day == 15 and d.month in (3, 4) for d in dates))
+
+        self.assertEqual(holidays.between(stop, start), [])
+        with self.assertRaises(ValueError):
+            holidays.between(start, stop, "songkran")
@@ -0,0 +1,27 @@
+import unittest
+
+from pythaidate import CsDate, PakDate
+from pythaidate import json as pjson
+
+
+class Test_Json(unittest.TestCase):
+
+    def test_dumps(self):
+        obj = {"cs": CsDate(1361, 1, 24), "pak": [PakDate(jd=2451545)], "n": 1}
+        s = pjson.dumps(obj, sort_keys=True)
+        self.assertEqual(s, '{"cs": {"$cs": 2451545}, "n": 1, "pak": [{"$pak": 2451545}]}')
+
+    def test_round_trip(self):
+        obj = {"cs": CsDate(1361, 1, 24), "pak": [PakDate(jd=2451545)], "n": 1}
+        obj2 = pjson.loads(pjson.dumps(obj))
+        self.assertIsInstance(obj2["cs"], CsDate)
+        self.assertIsInstance(obj2["pak"][0], PakDate)
+        self.assertEqual(obj, obj2)
+
+    def test_untagged(self):
+        for s in ('{"$cs": "x"}', '{"$cs": 1, "y": 2}', '{"$other": 1}'):
+            self.assertIsInstance(pjson.loads(s), dict)
+
+    def test_unserializable(self):
+        with self.assertRaises(TypeError):
+            pjson.dumps(object())
@@ -2,11 +2,24 @@ import json
 import unittest
 import os
 import pathlib
+import random
 from datetime import date
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
 this_path = pathlib.Path(__file__).parent.resolve()
 
 from pythaidate import julianday
+from pythaidate.constants import CS_JULIAN_DAY_OFFSET
+
+# supported range: the start of the Julian Day count to 3000 AD
+MAX_JD = 2817152
+RUN_PERCENT = 10
+if os.environ.get("RUN_PERCENT"):
+    RUN_PERCENT = min(int(os.environ.get("RUN_PERCENT")), 100)
 
 with open(os.path.join(this_path, "data/julian.json")) as fh:
     TESTDATA = json.load(fh)
@@ -30,5 +43,54 @@ class Test_JulianDay(unittest.TestCase):
             jd = julianday.date_to_julianday(dt)
             self.assertEqual(i["jd"], jd, (i, jd))
 
+    def test_cutover(self):
+        self.assertEqual(julianday.to_julianday(1582, 10, 4), 2299160)
+        self.assertEqual(julianday.to_julianday(1582, 10, 15), 2299161)
+        self.assertEqual(julianday.from_julianday(2299160), (1582, 10, 4))
+        self.assertEqual(julianday.from_julianday(2299161), (1582, 10, 15))
+        self.assertEqual(julianday.to_julianday(1582, 10, 5, julianday.GREGORIAN), 2299151)
+        self.assertEqual(julianday.to_julianday(1582, 10, 15, julianday.JULIAN), 2299171)
+        self.assertEqual(julianday.from_julianday(0), (-4712, 1, 1))
+        self.assertEqual(julianday.from_julianday(0, julianday.GREGORIAN), (-4713, 11, 24))
+        self.assertEqual(julianday.from_julianday(2451545, julianday.JULIAN), (1999, 12, 19))
+        with self.assertRaises(ValueError):
+            julianday.to_julianday(2000, 1, 1, "french")
+        with self.assertRaises(ValueError):
+            julianday.from_julianday(2451545, "french")
+
+    def test_roundtrip(self):
+        n = MAX_JD * RUN_PERCENT // 1000
+        jds = random.sample(range(MAX_JD), n) + [0, 2299160, 2299161, CS_JULIAN_DAY_OFFSET, MAX_JD]
+        for cutover in (julianday.STANDARD, julianday.GREGORIAN, julianday.JULIAN):
+            for jd in jds:
+                ymd = julianday.from_julianday(jd, cutover)
+                self.assertEqual(julianday.to_julianday(*ymd, cutover), jd, (jd, cutover))
+            ymds = julianday.from_julianday_many(jds, cutover)
+            self.assertEqual(julianday.to_julianday_many(*zip(*ymds), cutover=cutover), jds)
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_roundtrip_array(self):
+        # every day of the supported range
+        jds = np.arange(MAX_JD + 1)
+        for cutover in (julianday.STANDARD, julianday.GREGORIAN, julianday.JULIAN):
+            years, months, days = julianday.from_julianday_many(jds, cutover)
+            self.assertTrue(((months >= 1) & (months <= 12) & (days >= 1) & (days <= 31)).all())
+            back = julianday.to_julianday_many(years, months, days, cutover)
+            np.testing.assert_array_equal(back, jds)
+        # consecutive days
+        years, months, days = julianday.from_julianday_many(jds)
+        ymd = years * 10000 + months * 100 + days
+        self.assertTrue((np.diff(ymd) > 0).all())
+
+    def test_ordinal(self):
+        # date.toordinal() agrees with the Gregorian calendar
+        for ordinal in random.sample(range(1, date.max.toordinal()), 1000):
+            d = date.fromordinal(ordinal)
+            jd = julianday.to_julianday(d.year, d.month, d.day, julianday.GREGORIAN)
+            self.assertEqual(jd, ordinal + julianday.ORDINAL_OFFSET)
+            self.assertEqual(julianday.date_to_julianday(d), julianday.to_julianday(d.year, d.month, d.day))
+            self.assertEqual(julianday.julianday_to_date(julianday.date_to_julianday(d)), d)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+
+from pythaidate import lsyear, CsDate
+
+
+class Test_LSYear(unittest.TestCase):
+
+    def tearDown(self):
+        lsyear.set_year_cache_size(lsyear.YEAR_CACHE_SIZE)
+
+    def test_record_is_read_only(self):
+        y0 = lsyear.calculate_year0(1361)
+        with self.assertRaises(AttributeError):
+            y0.cal_type = "A"
+        with self.assertRaises(AttributeError):
+            y0.langsak += 1
+
+    def test_record_values(self):
+        y0 = lsyear.calculate_year0(1361)
+        self.assertEqual(y0.year, 1361)
+        self.assertEqual(y0.cal_type, "C")
+        self.assertEqual(y0.caldays, 384)
+        self.assertIs(y0, CsDate.calculate_year0(1361))
+
+    def test_record_properties(self):
+        y0 = lsyear.calculate_year0(1361)
+        self.assertEqual(y0.julianday, CsDate.fromyd(1361, 0).julianday)
+        self.assertEqual(y0.days_in_year, 384)
+        self.assertTrue(y0.leap_month)
+        self.assertFalse(y0.leap_day)
+        self.assertFalse(y0.solar_leap_year)
+
+    def test_iter_years(self):
+        years = list(lsyear.iter_years(0, 2400))
+        self.assertEqual(len(years), 2400)
+        for year, y0 in enumerate(years):
+            self.assertEqual(y0, lsyear.calculate_year0(year))
+        self.assertEqual(list(lsyear.iter_years(10, 10)), [])
+
+    def test_horakhun_year(self):
+        for year in range(-5, 3000):
+            hk = lsyear.year_horakhun(year)
+            self.assertEqual(lsyear.horakhun_year(hk), year)
+            self.assertEqual(lsyear.horakhun_year(hk - 1), year - 1)
+            self.assertEqual(lsyear.LSYear(year).horakhun, hk)
+
+    def test_cache_info(self):
+        lsyear.year_cache_clear()
+        lsyear.calculate_year0(1000)
+        lsyear.calculate_year0(1000)
+        lsyear.calculate_year0(1001)
+        info = lsyear.year_cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 2)
+        self.assertEqual(info.currsize, 2)
+        lsyear.year_cache_clear()
+        self.assertEqual(lsyear.year_cache_info().currsize, 0)
+
+    def test_cache_size(self):
+        lsyear.set_year_cache_size(4)
+        for y in range(1000, 1010):
+            lsyear.calculate_year0(y)
+        info = lsyear.year_cache_info()
+        self.assertEqual(info.maxsize, 4)
+        self.assertEqual(info.currsize, 4)
+        # dates still resolve with a tiny cache
+        cs = CsDate.fromjulianday(2451545)
+        self.assertEqual((cs.year, cs.month, cs.day), (1361, 1, 24))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,14 +1,17 @@
 from datetime import date, timedelta
+import copy
 import json
 import unittest
 import os
+import pickle
 import pathlib
 import random
 
 import logging
 
 from pythaidate import PakDate, CsDate, julianday
-from pythaidate.constants import PAK_JULIAN_DAY_OFFSET
+from pythaidate import pakdate
+from pythaidate.constants import PAK_JULIAN_DAY_OFFSET, PAK_DAYS_IN_CYCLE
 
 RUN_PERCENT = 10
 if os.environ.get("RUN_PERCENT"):
@@ -153,9 +156,16 @@ class Test_PakDate(unittest.TestCase):
         self.assertGreater(p2, y1)
 
     def test_weekday(self):
-        y = PakDate(jd=2454103)
-        self.assertEqual(y.weekday(), 3)
-        self.assertEqual(y.isoweekday(), 4)
+        y = PakDate(jd=2454103)  # Tuesday, AD 2007-01-02
+        self.assertEqual(y.weekday(), 1)
+        self.assertEqual(y.isoweekday(), 2)
+        # numbered like datetime.date, and the same as CsDate, on every weekday
+        for jd in range(2451545, 2451545 + 7):
+            d = julianday.julianday_to_date(jd)
+            p = PakDate(jd=jd)
+            cs = CsDate.fromjulianday(jd)
+            self.assertEqual((p.weekday(), p.isoweekday()), (d.weekday(), d.isoweekday()))
+            self.assertEqual((cs.weekday(), cs.isoweekday()), (d.weekday(), d.isoweekday()))
 
     def test_add_timedelta(self):
         for jd in [random.randint(2454000, 2454999) for _ in range(200)]:
@@ -165,6 +175,55 @@ class Test_PakDate(unittest.TestCase):
             p1 = p0 + td
             self.assertEqual(p0.julianday + r, p1.julianday)
 
+    def test_add_odometer(self):
+        # small steps move the counters; check them against a full conversion,
+        # including across the end of a cycle
+        end = PAK_JULIAN_DAY_OFFSET + PAK_DAYS_IN_CYCLE
+        jds = [random.randint(2454000, 2454999) for _ in range(100)] + list(range(end - 20, end + 20))
+        for jd in jds:
+            p0 = PakDate(jd=jd)
+            for n in range(-pakdate.ODOMETER_DAYS - 1, pakdate.ODOMETER_DAYS + 2):
+                p1 = p0 + timedelta(days=n)
+                expected = PakDate(jd=jd + n)
+                self.assertEqual((p1.julianday, p1.pakcode), (expected.julianday, expected.pakcode))
+                self.assertEqual(p1.pakabbr, expected.pakabbr)
+                self.assertEqual(p1.iswanphra, expected.iswanphra)
+        with self.assertRaises(ValueError):
+            PakDate(jd=PAK_JULIAN_DAY_OFFSET + 3) - timedelta(days=5)
+
+    def test_counters(self):
+        # stepping the counters a day at a time through a whole cycle
+        # matches the direct conversion
+        sample = RUN_PERCENT  # a fraction: RUN_PERCENT is divided by 100 above
+        days = 1
+        for jd, cycle, data, flags in pakdate._iter_counters(PAK_JULIAN_DAY_OFFSET + 1):
+            if days > PAK_DAYS_IN_CYCLE:
+                self.assertEqual((cycle, data), (2, [1, 1, 1, 1, 1, 1]))
+                break
+            if random.random() < sample:
+                self.assertEqual(data, pakdate._counters(days)[0])
+                self.assertEqual(flags, pakdate._flags(data))
+            days += 1
+
+    def test_range(self):
+        end = PAK_JULIAN_DAY_OFFSET + PAK_DAYS_IN_CYCLE
+        for step in (1, 3, 16, 100, -1, -7, -100):
+            start, stop = (end - 500, end + 500) if step > 0 else (end + 500, end - 500)
+            r = PakDate.range(start, stop, step)
+            jds = range(start, stop, step)
+            self.assertEqual(len(r), len(jds))
+            self.assertEqual([p.pakcode for p in r], [PakDate(jd=jd).pakcode for jd in jds])
+            self.assertEqual([p.julianday for p in reversed(r)], list(reversed(jds)))
+        r = PakDate.range(date(2000, 1, 1), 2451545 + 10)
+        self.assertEqual([p.julianday for p in r], list(range(2451545, 2451555)))
+        self.assertEqual(r[-1].julianday, 2451554)
+        self.assertEqual([p.julianday for p in r[::3]], [2451545, 2451548, 2451551, 2451554])
+        self.assertIn(PakDate(jd=2451550), r)
+        self.assertNotIn(date(2000, 1, 20), r)
+        self.assertEqual(list(PakDate.range(2451545, 2451545)), [])
+        with self.assertRaises(ValueError):
+            PakDate.range(PAK_JULIAN_DAY_OFFSET, 2451545)
+
     # def test_add_dates(self):
     #     pass
 
@@ -199,3 +258,13 @@ class Test_PakDate(unittest.TestCase):
         t1 = julianday.today()
         t2 = PakDate.today()
         self.assertEqual(t1, t2.julianday)
+
+    def test_pickle(self):
+        p = PakDate(jd=2451545)
+        p2 = pickle.loads(pickle.dumps(p))
+        self.assertEqual(p, p2)
+        self.assertEqual(p.pakcode, p2.pakcode)
+        self.assertEqual(hash(p), hash(p2))
+        self.assertEqual(len({p, date(2000, 1, 1), CsDate.fromjulianday(2451545)}), 1)
+        self.assertIs(copy.copy(p), p)
+        self.assertIs(copy.deepcopy(p), p)
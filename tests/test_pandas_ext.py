@@ -0,0 +1,94 @@
+import unittest
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover
+    pd = None
+
+from pythaidate import CsDate, PakDate
+
+if pd is not None:
+    from pythaidate.pandas_ext import CsDateArray, CsDtype
+
+
+@unittest.skipIf(pd is None, "pandas not installed")
+class Test_PandasExt(unittest.TestCase):
+
+    def setUp(self):
+        self.dates = pd.Series(pd.date_range("1999-12-30", periods=40, freq="D"))
+        self.dates[3] = pd.NaT
+
+    def test_array(self):
+        arr = pd.array([CsDate(1361, 1, 24), None, 2451546], dtype="csdate")
+        self.assertIsInstance(arr, CsDateArray)
+        self.assertIsInstance(arr.dtype, CsDtype)
+        self.assertEqual(arr[0], CsDate(1361, 1, 24))
+        self.assertIs(arr[1], pd.NA)
+        self.assertEqual(arr[2].julianday, 2451546)
+        self.assertEqual(list(arr.isna()), [False, True, False])
+        self.assertEqual(list(arr.julianday[[0, 2]]), [2451545, 2451546])
+        self.assertEqual(list(arr.take([2, -1], allow_fill=True).isna()), [False, True])
+
+    def test_accessor(self):
+        td = self.dates.thaidate
+        for i, d in enumerate(self.dates):
+            if pd.isna(d):
+                self.assertIs(td.cs_year[i], pd.NA)
+                self.assertIs(td.pakcode[i], pd.NA)
+                continue
+            cs = CsDate.fromjulianday(d.toordinal() + 1721425)
+            pak = PakDate(jd=cs.julianday)
+            self.assertEqual(td.julianday[i], cs.julianday)
+            self.assertEqual(td.cs_year[i], cs.year)
+            self.assertEqual(td.cs_month[i], cs.month)
+            self.assertEqual(td.cs_day[i], cs.day)
+            self.assertEqual(td.tithi[i], cs.tithi)
+            self.assertEqual(td.pakcode[i], pak.pakcode)
+            self.assertEqual(td.is_wanphra[i], pak.iswanphra)
+
+    def test_accessor_sources(self):
+        cs = self.dates.thaidate.csdate
+        self.assertIsInstance(cs.dtype, CsDtype)
+        jd = pd.Series([2451545, 2451546])
+        self.assertEqual(list(jd.thaidate.cs_day), [24, 25])
+        self.assertEqual(list(cs.thaidate.cs_day[:3]), list(self.dates.thaidate.cs_day[:3]))
+        with self.assertRaises(AttributeError):
+            pd.Series(["a"]).thaidate
+
+    def test_accessor_tz_aware(self):
+        # the local date, not the UTC one
+        s = pd.Series(pd.to_datetime(["2000-01-01 03:00"]).tz_localize("Asia/Bangkok"))
+        self.assertEqual(list(s.thaidate.julianday), [2451545])
+
+    def test_accessor_nullable_int(self):
+        jd = pd.Series([2451545, None, 2451546], dtype="Int64")
+        self.assertEqual(list(jd.thaidate.cs_day.isna()), [False, True, False])
+        self.assertEqual(jd.thaidate.cs_day[2], 25)
+
+    def test_min_max(self):
+        cs = self.dates.thaidate.csdate
+        self.assertEqual(cs.min(), CsDate.fromjulianday(2451543))
+        self.assertEqual(cs.max(), CsDate.fromjulianday(2451582))
+        self.assertIs(cs.min(skipna=False), pd.NA)
+        self.assertIs(cs.iloc[3:4].max(), pd.NA)
+        with self.assertRaises(TypeError):
+            cs.sum()
+
+    def test_sort_compare(self):
+        cs = self.dates.thaidate.csdate
+        s = cs.sort_values(ascending=False, na_position="last")
+        self.assertEqual(s.iloc[0], CsDate.fromjulianday(2451582))
+        self.assertIs(s.iloc[-1], pd.NA)
+        mask = cs >= CsDate(1361, 2, 1)
+        self.assertEqual(int(mask.sum()), 32)
+        self.assertFalse(mask[3])
+        self.assertTrue((cs.iloc[:3] == cs.iloc[:3]).all())
+
+    def test_groupby(self):
+        df = pd.DataFrame({"cs": self.dates.thaidate.csdate, "n": 1})
+        df["month"] = df.cs.thaidate.cs_month
+        counts = df.groupby("month").n.sum()
+        self.assertEqual(counts.to_dict(), {1: 7, 2: 30, 3: 2})
+        by_date = pd.concat([df, df]).groupby("cs").n.sum()
+        self.assertEqual(len(by_date), 39)
+        self.assertTrue((by_date == 2).all())
@@ -0,0 +1,106 @@
+import itertools
+import unittest
+
+from pythaidate import CsDate
+from pythaidate.csdate import lunation_start_jd
+from pythaidate.julianday import to_julianday
+from pythaidate.recurrence import (
+    LunarRule, YEARLY, MONTHLY, LEAP_FIRST, LEAP_SECOND, LEAP_BOTH, WAXING, WANING,
+)
+
+
+def month_days(cs):
+    # number of days in the month of cs
+    return 30 if CsDate.fromjulianday(cs.julianday - cs.day + 30).day == 30 else 29
+
+
+def brute_force(rule, start, stop):
+    # occurrences of rule found by checking every day
+    result = []
+    for cs in CsDate.range(start, stop):
+        length = month_days(cs)
+        if rule.phase is None:
+            day, days = cs.day, length
+        elif rule.phase == WAXING:
+            day, days = cs.day, 15
+        else:
+            day, days = cs.day - 15, length - 15
+        if not 1 <= day <= days:
+            continue
+        if rule.month is not None and not rule._matches_month(cs.month, cs.leap_month):
+            continue
+        if rule.day is not None and day not in [d if d > 0 else days + d + 1 for d in rule.day]:
+            continue
+        if rule.weekday is not None and cs.weekday() not in rule.weekday:
+            continue
+        result.append(cs.julianday)
+    return result
+
+
+class Test_LunarRule(unittest.TestCase):
+
+    def test_between(self):
+        start, stop = to_julianday(1995, 1, 1), to_julianday(2005, 1, 1)
+        rules = (
+            LunarRule(YEARLY, month=3, day=15, phase=WAXING),
+            LunarRule(MONTHLY, day=8, phase=WANING),
+            LunarRule(month=88),
+            LunarRule(month=8, day=(1, -1), leap=LEAP_SECOND),
+            LunarRule(month=8, day=15, leap=LEAP_BOTH),
+            LunarRule(month=8, day=15, leap=LEAP_FIRST),
+            LunarRule(day=-1, phase=WANING, weekday=(0, 6)),
+            LunarRule(day=30),
+        )
+        for rule in rules:
+            result = rule.between(start - 1, stop, julianday=True)
+            self.assertEqual(result, brute_force(rule, start, stop), repr(rule))
+            self.assertTrue(result)
+
+    def test_after_before(self):
+        rule = LunarRule(YEARLY, month=3, day=15, phase=WAXING)
+        cs = rule.after(CsDate(1361, 1, 1))
+        self.assertEqual(cs.csformatymd(), "1361-03-15")
+        self.assertEqual(rule.after(cs, inc=True).julianday, cs.julianday)
+        self.assertEqual(rule.after(cs).csformatymd(), "1362-03-15")
+        self.assertEqual(rule.before(cs).csformatymd(), "1360-03-15")
+        self.assertEqual(rule.before(cs, inc=True, julianday=True), cs.julianday)
+        self.assertEqual(
+            [c.csformatymd() for c in itertools.islice(rule.xafter(cs), 3)],
+            ["1362-03-15", "1363-03-15", "1364-03-15"])
+        self.assertEqual(len(rule.between(cs, rule.after(cs))), 0)
+        self.assertEqual(len(rule.between(cs, rule.after(cs), inc=True)), 2)
+        # never matches
+        self.assertIsNone(LunarRule(month=5, day=30).after(CsDate(1361, 1, 1)))
+
+    def test_interval(self):
+        rule = LunarRule(MONTHLY, day=1, interval=3, dtstart=CsDate(1361, 7, 1))
+        self.assertEqual(
+            [c.csformatymd() for c in itertools.islice(rule, 5)],
+            ["1361-07-01", "1361-09-01", "1361-12-01", "1361-03-01", "1362-06-01"])
+        rule = LunarRule(YEARLY, month=7, day=1, interval=2, dtstart=CsDate(1361, 7, 1))
+        self.assertEqual(
+            [c.csformatymd() for c in itertools.islice(rule, 3)],
+            ["1361-07-01", "1363-07-01", "1365-07-01"])
+        self.assertEqual(rule.before(CsDate(1370, 1, 1)).csformatymd(), "1369-07-01")
+        self.assertIsNone(rule.before(CsDate(1361, 7, 1)))
+        # every 7th lunation over a long run, without drifting
+        start = CsDate(1100, 7, 1)
+        rule = LunarRule(MONTHLY, day=1, interval=7, dtstart=start)
+        n = start.lunation
+        for c in itertools.islice(rule, 2000):
+            self.assertEqual(c.julianday, lunation_start_jd(n))
+            n += 7
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            LunarRule("daily")
+        with self.assertRaises(ValueError):
+            LunarRule(month=13)
+        with self.assertRaises(ValueError):
+            LunarRule(day=16, phase=WANING)
+        with self.assertRaises(ValueError):
+            LunarRule(interval=2)
+        with self.assertRaises(ValueError):
+            iter(LunarRule())
+        with self.assertRaises(TypeError):
+            LunarRule(day="8")
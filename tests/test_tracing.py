@@ -0,0 +1,90 @@
+from datetime import timedelta
+import unittest
+
+import pythaidate
+from pythaidate import tracing, lsyear, CsDate, PakDate
+
+
+class Test_Tracing(unittest.TestCase):
+
+    def tearDown(self):
+        tracing.disable()
+        tracing.reset()
+
+    def test_disabled_by_default(self):
+        self.assertFalse(tracing.is_enabled())
+        self.assertNotIn("__wrapped__", vars(vars(CsDate)["fromjulianday"].__func__))
+        s = pythaidate.stats()
+        self.assertFalse(s["enabled"])
+        self.assertEqual(sum(s["calls"].values()), 0)
+
+    def test_counters(self):
+        lsyear.year_cache_clear()
+        tracing.enable()
+        for jd in range(2451545, 2451545 + 100):
+            CsDate.fromjulianday(jd)
+        CsDate(1361, 1, 24) + timedelta(days=1)
+        CsDate(1361, 1, 24) - timedelta(days=1)
+        CsDate.fromyd(1361, 0)
+        PakDate(jd=2451545)
+        s = pythaidate.stats()
+        self.assertTrue(s["enabled"])
+        self.assertEqual(s["calls"]["CsDate.fromjulianday"], 100)
+        self.assertEqual(s["calls"]["CsDate.__init__"], 2)
+        self.assertEqual(s["calls"]["CsDate.__add__"], 1)
+        self.assertEqual(s["calls"]["CsDate.__sub__"], 1)
+        self.assertEqual(s["calls"]["CsDate.fromyd"], 1)
+        self.assertEqual(s["calls"]["PakDate.__init__"], 1)
+        self.assertEqual(s["year0"], 1)
+        self.assertEqual(s["lsyear_builds"], 5)
+        self.assertEqual(s["cache_misses"], 1)
+        self.assertEqual(s["cache_hits"], 102)
+        self.assertEqual(s["timings"], {})
+
+        list(lsyear.iter_years(0, 10))
+        s = tracing.stats()
+        self.assertEqual(s["year0"], 11)
+        self.assertEqual(s["lsyear_builds"], 19)
+
+        tracing.disable()
+        CsDate.fromjulianday(2451545)
+        self.assertEqual(tracing.stats()["calls"]["CsDate.fromjulianday"], 100)
+        tracing.reset()
+        self.assertEqual(tracing.stats()["calls"]["CsDate.fromjulianday"], 0)
+
+    def test_cache_cleared(self):
+        tracing.enable()
+        CsDate.fromjulianday(2451545)
+        CsDate.fromjulianday(2451545)
+        before = tracing.stats()
+        lsyear.year_cache_clear()
+        s = tracing.stats()
+        self.assertEqual((s["cache_hits"], s["cache_misses"]),
+                         (before["cache_hits"], before["cache_misses"]))
+        CsDate.fromjulianday(2451545)
+        CsDate.fromjulianday(2451545)
+        s = tracing.stats()
+        self.assertEqual(s["cache_hits"], before["cache_hits"] + 1)
+        self.assertEqual(s["cache_misses"], before["cache_misses"] + 1)
+        lsyear.set_year_cache_size(lsyear.YEAR_CACHE_SIZE)
+        CsDate.fromjulianday(2451545)
+        s = tracing.stats()
+        self.assertEqual(s["cache_misses"], before["cache_misses"] + 2)
+        tracing.disable()
+        CsDate.fromjulianday(2451545)
+        self.assertEqual(tracing.stats()["cache_hits"], s["cache_hits"])
+        tracing.reset()
+        self.assertEqual(tracing.stats()["cache_hits"], 0)
+
+    def test_timings(self):
+        tracing.enable(timing=True)
+        for jd in range(2451545, 2451545 + 10):
+            CsDate.fromjulianday(jd)
+        timings = tracing.stats()["timings"]["CsDate.fromjulianday"]
+        self.assertEqual(sum(timings.values()), 10)
+        for bucket in timings:
+            self.assertEqual(bucket & (bucket - 1), 0)  # power of 2
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import os
+import random
+import unittest
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from pythaidate import CsDate, PakDate, lsyear
+from pythaidate.constants import CS_JULIAN_DAY_OFFSET, PAK_JULIAN_DAY_OFFSET, PAK_DAYS_IN_CYCLE
+
+if np is not None:
+    from pythaidate import vector
+
+MIN_YEAR = 0  # 638 AD
+MAX_YEAR = 2362  # 3000 AD
+RUN_PERCENT = 10
+if os.environ.get("RUN_PERCENT"):
+    RUN_PERCENT = int(os.environ.get("RUN_PERCENT"))
+    if RUN_PERCENT > 100:
+        RUN_PERCENT = 100
+
+FIELDS = ("year", "month", "month_raw", "day", "days", "horakhun", "tithi",
+          "avoman", "masaken", "uccapon", "solar_leap_year", "leap_day",
+          "leap_month")
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class Test_Vector(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        start = CsDate.fromyd(MIN_YEAR, 0).julianday
+        stop = CsDate.fromyd(MAX_YEAR, 0).julianday
+        cls.jd = np.arange(start, stop, dtype=np.int64)
+        cls.fields = vector.from_julianday(cls.jd)
+
+    def sample(self):
+        # scalar comparisons are slow: check a tenth of RUN_PERCENT
+        n = len(self.jd)
+        return random.sample(range(n), n * RUN_PERCENT // 1000)
+
+    def test_from_julianday(self):
+        f = self.fields
+        for i in self.sample():
+            cs = CsDate.fromjulianday(int(self.jd[i]))
+            for name in FIELDS:
+                self.assertEqual(getattr(cs, name), getattr(f, name)[i], (name, int(self.jd[i])))
+            self.assertEqual(cs.weekday(), f.weekday[i])
+
+    def test_to_julianday_roundtrip(self):
+        f = self.fields
+        jd = vector.to_julianday(f.year, f.month_raw, f.day)
+        self.assertTrue(np.array_equal(jd, self.jd))
+
+    def test_to_julianday_scalar(self):
+        f = self.fields
+        idx = self.sample()
+        jd = vector.to_julianday(f.year[idx], f.month[idx], f.day[idx])
+        for i, j in zip(idx, jd):
+            cs = CsDate(int(f.year[i]), int(f.month[i]), int(f.day[i]))
+            self.assertEqual(cs.julianday, j)
+
+    def test_to_julianday_invalid(self):
+        for args in ((1360, 88, 1), (1361, 13, 1), (1361, 1, 31), (1361, 2, 0)):
+            with self.assertRaises(ValueError):
+                vector.to_julianday(*args)
+
+    def test_year_table(self):
+        table = vector.LSYearTable(MIN_YEAR, MAX_YEAR)
+        self.assertEqual(len(table), MAX_YEAR - MIN_YEAR)
+        for year in range(MIN_YEAR, MAX_YEAR):
+            self.assertEqual(table.record(year), lsyear.calculate_year0(year))
+
+    def test_year_table_columns(self):
+        table = vector.LSYearTable(1360, 1363)
+        self.assertEqual(list(table["cal_type"]), ["B", "C", "A"])
+        self.assertEqual(list(table.caldays), [355, 384, 354])
+        records = table.to_records()
+        self.assertEqual(records["year"][1], 1361)
+        self.assertEqual(records["cal_code"][1], vector.CAL_C)
+        self.assertEqual(set(table.to_dict()), set(table.COLUMNS))
+        with self.assertRaises(KeyError):
+            table["nonexistent"]
+        with self.assertRaises(IndexError):
+            table.record(1363)
+
+    def test_pre_epoch(self):
+        with self.assertRaises(ValueError):
+            vector.from_julianday([CS_JULIAN_DAY_OFFSET])
+
+    def test_lunation(self):
+        lunation = vector.lunation(self.jd)
+        # one lunation per calendar month
+        np.testing.assert_array_equal(np.diff(lunation), self.fields.day[1:] == 1)
+        for i in self.sample():
+            self.assertEqual(lunation[i], CsDate.fromjulianday(int(self.jd[i])).lunation)
+        self.assertEqual(vector.lunation([]).shape, (0,))
+        with self.assertRaises(ValueError):
+            vector.lunation([CS_JULIAN_DAY_OFFSET])
+
+    def test_pak_from_julianday(self):
+        jd = np.arange(PAK_JULIAN_DAY_OFFSET + 1, PAK_JULIAN_DAY_OFFSET + 2 * PAK_DAYS_IN_CYCLE + 100)
+        p = vector.pak_from_julianday(jd)
+        n = len(jd)
+        idx = random.sample(range(n), n * RUN_PERCENT // 1000)
+        idx += [0, PAK_DAYS_IN_CYCLE - 1, PAK_DAYS_IN_CYCLE, n - 1]
+        for i in idx:
+            pak = PakDate(jd=int(jd[i]))
+            fields = (p.cycle, p.a, p.b, p.c, p.d, p.e, p.f)
+            code = "{}-{}:{}:{}:{}:{}:{}".format(*(int(f[i]) for f in fields))
+            self.assertEqual(code, pak.pakcode)
+            self.assertEqual(p.pakkhagen[i], pak.pakkhagen)
+            self.assertEqual(p.iswaxing[i], pak.iswaxing)
+            self.assertEqual(p.iswanphra[i], pak.iswanphra)
+        with self.assertRaises(ValueError):
+            vector.pak_from_julianday([PAK_JULIAN_DAY_OFFSET])
+
+
+if __name__ == '__main__':
+    unittest.main()